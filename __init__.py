@@ -24,7 +24,7 @@
 import bpy
 import os
 import sys
-from . import panels, imports, shader, render, remesh
+from . import panels, mesh_cleanup, imports, blend_catalog, shader, scene_index, render, render_cache, render_queue, remesh
 
 # Configuração das informações do add-on
 bl_info = {
@@ -54,7 +54,7 @@ def register():
     source_path = setup_source_path()
     
     # Registro dos módulos
-    modules = [panels, imports, shader, render, remesh]
+    modules = [panels, mesh_cleanup, imports, blend_catalog, shader, scene_index, render, render_cache, render_queue, remesh]
     
     # Registro individual de cada módulo
     for module in modules:
@@ -95,7 +95,7 @@ def unregister():
         print(f"Error removing properties: {e}")
     
     # Remove classes registradas
-    modules = [remesh, render, shader, imports, panels]  # Ordem inversa
+    modules = [remesh, render_queue, render_cache, render, scene_index, shader, blend_catalog, imports, mesh_cleanup, panels]  # Ordem inversa
     
     for module in modules:
         try:
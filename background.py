@@ -0,0 +1,392 @@
+import bpy
+import os
+import json
+import queue
+import struct
+import threading
+import subprocess
+from .utils import write_replacing
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "render_worker.py")
+PROGRESS_PREFIX = "EPICTOOLBAG_PROGRESS "
+
+def log_message(message):
+    print(f"Epic Toolbag - Background: {message}")
+
+def save_scene_copy(filepath):
+    """
+    Save a copy of the current file for background processes, leaving the open file untouched.
+
+    :param filepath: Destination .blend path
+    :return: The destination path
+    """
+    bpy.ops.wm.save_as_mainfile(filepath=filepath, copy=True, check_existing=False)
+    return filepath
+
+def default_worker_count():
+    return max(1, (os.cpu_count() or 2) // 2)
+
+class BackgroundRender:
+    """One background Blender process rendering a batch of tasks."""
+
+    def __init__(self, blend_path, tasks, tasks_path):
+        self.blend_path = blend_path
+        self.tasks = tasks
+        self.tasks_path = tasks_path
+        self.process = None
+        self.events = queue.Queue()
+        self.reported = set()
+        self.reader = None
+
+    def start(self):
+        with open(self.tasks_path, 'w', encoding='utf-8') as f:
+            json.dump({"tasks": self.tasks}, f)
+
+        command = [bpy.app.binary_path, "-b", self.blend_path, "--python", WORKER_SCRIPT, "--", self.tasks_path]
+        self.process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            universal_newlines=True,
+            bufsize=1
+        )
+        self.reader = threading.Thread(target=self._read_output, daemon=True)
+        self.reader.start()
+
+    def _read_output(self):
+        # Runs in a thread: only parses lines, never touches Blender data
+        for line in self.process.stdout:
+            if line.startswith(PROGRESS_PREFIX):
+                try:
+                    self.events.put(json.loads(line[len(PROGRESS_PREFIX):]))
+                except ValueError:
+                    pass
+        self.process.stdout.close()
+
+    def drain(self):
+        events = []
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event.get("event") in {"done", "error"}:
+                self.reported.add(event.get("task"))
+            events.append(event)
+        return events
+
+    @property
+    def finished(self):
+        return self.process is not None and self.process.poll() is not None and not self.reader.is_alive()
+
+    def terminate(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+
+class RenderWorkerPool:
+    """
+    Run batches of render tasks in background Blender processes, at most max_workers at a time.
+
+    Call update() from a modal timer: it starts queued batches and returns the progress
+    events of all running processes. Tasks of a process that exits without reporting them
+    (crash, killed) come back as "error" events.
+    """
+
+    def __init__(self, blend_path, work_dir, max_workers=None):
+        self.blend_path = blend_path
+        self.work_dir = work_dir
+        self.max_workers = max_workers or default_worker_count()
+        self.queued = []
+        self.running = []
+        self.batch_count = 0
+
+    def add(self, tasks):
+        if tasks:
+            self.queued.append(tasks)
+
+    def update(self):
+        events = []
+        for worker in list(self.running):
+            events.extend(worker.drain())
+            if worker.finished:
+                events.extend(worker.drain())
+                for task in worker.tasks:
+                    if task["id"] not in worker.reported:
+                        events.append({"event": "error", "task": task["id"], "error": "Worker process exited"})
+                self.running.remove(worker)
+
+        while self.queued and len(self.running) < self.max_workers:
+            self.batch_count += 1
+            tasks_path = os.path.join(self.work_dir, f"tasks_{self.batch_count}.json")
+            worker = BackgroundRender(self.blend_path, self.queued.pop(0), tasks_path)
+            try:
+                worker.start()
+            except OSError as e:
+                log_message(f"Failed to start worker: {e}")
+                events.extend({"event": "error", "task": task["id"], "error": str(e)} for task in worker.tasks)
+                continue
+            self.running.append(worker)
+        return events
+
+    @property
+    def finished(self):
+        return not self.queued and not self.running
+
+    def cancel(self):
+        self.queued.clear()
+        for worker in self.running:
+            worker.terminate()
+        self.running.clear()
+
+def split_tasks(tasks, count):
+    """Split tasks into at most count interleaved batches of similar size."""
+    count = max(1, min(count, len(tasks)))
+    return [tasks[index::count] for index in range(count)]
+
+def tile_regions(width, height, tiles_x, tiles_y, overlap=0):
+    """
+    Split a frame into a grid of tiles that overlap their neighbours.
+
+    :param width: Frame width in pixels
+    :param height: Frame height in pixels
+    :param tiles_x: Number of columns
+    :param tiles_y: Number of rows
+    :param overlap: Pixels each tile extends past its edge into its neighbours
+    :return: (regions, overlap): (x0, y0, x1, y1) pixel regions with y measured from the bottom
+             and exclusive ends, and the overlap actually used
+    """
+    tiles_x = max(1, min(tiles_x, width))
+    tiles_y = max(1, min(tiles_y, height))
+    # Overlap ramps from both sides of an edge must not meet inside a tile
+    overlap = max(0, min(overlap, width // tiles_x // 4, height // tiles_y // 4))
+    xs = [round(index * width / tiles_x) for index in range(tiles_x + 1)]
+    ys = [round(index * height / tiles_y) for index in range(tiles_y + 1)]
+
+    regions = []
+    for row in range(tiles_y):
+        for column in range(tiles_x):
+            regions.append((
+                max(0, xs[column] - overlap),
+                max(0, ys[row] - overlap),
+                min(width, xs[column + 1] + overlap),
+                min(height, ys[row + 1] + overlap),
+            ))
+    return regions, overlap
+
+def region_border(region, width, height):
+    """
+    Convert a pixel region to Blender's render border (min_x, max_x, min_y, max_y).
+
+    A small bias keeps float rounding from moving the border onto the neighbouring pixel.
+    """
+    x0, y0, x1, y1 = region
+    return [(x0 + 0.01) / width, (x1 + 0.01) / width, (y0 + 0.01) / height, (y1 + 0.01) / height]
+
+def tile_ramp(size, overlap, start_inside, end_inside):
+    """Cross-fade weights along one side of a tile: ramps where it overlaps a neighbour."""
+    import numpy as np
+
+    weights = np.ones(size, dtype=np.float32)
+    fade = min(2 * overlap, size)
+    if fade:
+        rising = (np.arange(fade, dtype=np.float32) + 0.5) / fade
+        if start_inside:
+            weights[:fade] *= rising
+        if end_inside:
+            weights[size - fade:] *= rising[::-1]
+    return weights
+
+def iter_blended_bands(load_tile, regions, width, height, overlap):
+    """
+    Assemble rendered tiles into one frame band by band, from the top of the frame down,
+    cross-fading the overlaps so seams from per-tile denoising or sampling noise do not show.
+    Only the tiles overlapping the current band are held in memory, never the whole frame.
+
+    :param load_tile: Called with the index of a region, returns float32 pixels of shape (h, w, 4), bottom row first
+    :param regions: Pixel regions from tile_regions
+    :return: Generator of (y0, y1, float32 pixels of shape (y1 - y0, width, 4)), y measured from
+             the bottom, bottom row first within a band
+    """
+    import numpy as np
+
+    edges = sorted({0, height} | {y for region in regions for y in (region[1], region[3])})
+    loaded = {}
+    for band_top in range(len(edges) - 1, 0, -1):
+        y0, y1 = edges[band_top - 1], edges[band_top]
+        covering = [index for index, region in enumerate(regions) if region[1] < y1 and region[3] > y0]
+        # Bands move down the frame: a tile no longer covering the band is never needed again
+        for index in [index for index in loaded if index not in covering]:
+            del loaded[index]
+
+        band = np.zeros((y1 - y0, width, 4), dtype=np.float32)
+        total = np.zeros((y1 - y0, width, 1), dtype=np.float32)
+        for index in covering:
+            if index not in loaded:
+                loaded[index] = load_tile(index)
+            x0, tile_y0, x1, tile_y1 = regions[index]
+            tile = loaded[index][:tile_y1 - tile_y0, :x1 - x0]
+            row_start, row_end = y0 - tile_y0, min(y1 - tile_y0, tile.shape[0])
+            if row_end <= row_start:
+                continue
+            tile_width = tile.shape[1]
+            rows = tile_ramp(tile.shape[0], overlap, tile_y0 > 0, tile_y1 < height)[row_start:row_end]
+            weights = np.outer(rows, tile_ramp(tile_width, overlap, x0 > 0, x1 < width))
+            band_rows = slice(0, row_end - row_start)
+            band[band_rows, x0:x0 + tile_width] += tile[row_start:row_end] * weights[..., None]
+            total[band_rows, x0:x0 + tile_width, 0] += weights
+        band /= np.maximum(total, 1e-8)
+        yield y0, y1, band
+
+def write_exr_bands(filepath, width, height, bands):
+    """
+    Write float RGBA bands as an uncompressed scanline OpenEXR file, one band at a time.
+    Every scanline has a fixed size, so bands can arrive in any order.
+
+    :param bands: Iterable of (y0, y1, float32 pixels of shape (y1 - y0, width, 4)) from iter_blended_bands
+    """
+    import numpy as np
+
+    def attribute(name, type_name, value):
+        return name + b"\0" + type_name + b"\0" + struct.pack('<i', len(value)) + value
+
+    # Channels are stored in alphabetical order, as 32-bit floats
+    channels = b"".join(name + b"\0" + struct.pack('<iB3xii', 2, 0, 1, 1) for name in (b"A", b"B", b"G", b"R")) + b"\0"
+    window = struct.pack('<iiii', 0, 0, width - 1, height - 1)
+    header = b"".join((
+        struct.pack('<ii', 20000630, 2),
+        attribute(b"channels", b"chlist", channels),
+        attribute(b"compression", b"compression", b"\0"),
+        attribute(b"dataWindow", b"box2i", window),
+        attribute(b"displayWindow", b"box2i", window),
+        attribute(b"lineOrder", b"lineOrder", b"\0"),
+        attribute(b"pixelAspectRatio", b"float", struct.pack('<f', 1.0)),
+        attribute(b"screenWindowCenter", b"v2f", struct.pack('<ff', 0.0, 0.0)),
+        attribute(b"screenWindowWidth", b"float", struct.pack('<f', 1.0)),
+        b"\0",
+    ))
+    line_size = width * 4 * 4
+    block_size = 8 + line_size
+    first_block = len(header) + 8 * height
+
+    def write(f):
+        f.write(header)
+        f.write((first_block + np.arange(height, dtype='<u8') * block_size).tobytes())
+        for y0, y1, pixels in bands:
+            # EXR line 0 is the top of the image
+            lines = np.arange(height - y1, height - y0, dtype='<i4')
+            blocks = np.empty((len(lines), block_size), dtype=np.uint8)
+            blocks[:, :4] = lines.view(np.uint8).reshape(-1, 4)
+            blocks[:, 4:8] = np.frombuffer(struct.pack('<i', line_size), dtype=np.uint8)
+            planar = np.ascontiguousarray(pixels[::-1][..., [3, 2, 1, 0]].transpose(0, 2, 1), dtype='<f4')
+            blocks[:, 8:] = planar.view(np.uint8).reshape(len(lines), line_size)
+            f.seek(first_block + int(lines[0]) * block_size)
+            f.write(blocks.tobytes())
+
+    write_replacing(filepath, write)
+
+def write_png_bands(filepath, width, height, bands):
+    """
+    Write RGBA bands in the 0-1 range as an 8-bit PNG, compressing one band at a time.
+
+    :param bands: Iterable of (y0, y1, float32 pixels of shape (y1 - y0, width, 4)), top band first
+    """
+    import zlib
+    import numpy as np
+
+    def chunk(tag, body):
+        return struct.pack('>I', len(body)) + tag + body + struct.pack('>I', zlib.crc32(tag + body) & 0xffffffff)
+
+    def write(f):
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+        compressor = zlib.compressobj(6)
+        expected = height
+        for y0, y1, pixels in bands:
+            if y1 != expected:
+                raise ValueError("PNG bands must arrive from the top of the image down")
+            expected = y0
+            rows = np.zeros((y1 - y0, width * 4 + 1), dtype=np.uint8)
+            rows[:, 1:] = (np.clip(pixels[::-1], 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8).reshape(y1 - y0, -1)
+            data = compressor.compress(rows.tobytes())
+            if data:
+                f.write(chunk(b'IDAT', data))
+        f.write(chunk(b'IDAT', compressor.flush()))
+        f.write(chunk(b'IEND', b''))
+
+    write_replacing(filepath, write)
+
+def physical_memory_mb():
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def load_image_pixels(filepath):
+    """
+    Read an image file into a NumPy array through Blender's image loader.
+
+    :param filepath: Image path
+    :return: float32 array of shape (height, width, 4), bottom row first
+    """
+    import numpy as np
+
+    image = bpy.data.images.load(filepath, check_existing=False)
+    try:
+        width, height = image.size
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        return pixels.reshape(height, width, 4)
+    finally:
+        bpy.data.images.remove(image)
+
+def save_image_pixels(pixels, filepath, name, file_format='PNG'):
+    """
+    Write a NumPy array to an image file, keeping the result as an image datablock.
+
+    :param pixels: float32 array of shape (height, width, 4), bottom row first
+    :param filepath: Destination path
+    :param name: Name of the image datablock
+    :param file_format: Blender image file format ('PNG', 'OPEN_EXR', ...)
+    :return: The image datablock
+    """
+    height, width = pixels.shape[:2]
+    previous = bpy.data.images.get(name)
+    if previous is not None:
+        bpy.data.images.remove(previous)
+
+    image = bpy.data.images.new(name, width, height, alpha=True, float_buffer=file_format == 'OPEN_EXR')
+    image.pixels.foreach_set(pixels.ravel())
+    image.filepath_raw = filepath
+    image.file_format = file_format
+    image.save()
+    return image
+
+def find_image_editor(context):
+    """First Image Editor area, looking at the current screen before the other windows."""
+    screens = [context.screen] if context.screen else []
+    screens.extend(window.screen for window in context.window_manager.windows if window.screen != context.screen)
+    for screen in screens:
+        for area in screen.areas:
+            if area.type == 'IMAGE_EDITOR':
+                return area
+    return None
+
+def show_image(context, image):
+    """
+    Display an image in an Image Editor. When none is open, the render view is opened first,
+    the way a render opens it (following the Render > Display Mode preference).
+
+    :return: True when the image is displayed
+    """
+    area = find_image_editor(context)
+    if area is None and context.window is not None:
+        try:
+            bpy.ops.render.view_show('INVOKE_DEFAULT')
+        except RuntimeError as e:
+            log_message(f"Cannot open the render view: {e}")
+        area = find_image_editor(context)
+    if area is None:
+        return False
+    area.spaces.active.image = image
+    return True
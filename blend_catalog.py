@@ -0,0 +1,247 @@
+import bpy
+import os
+import json
+from bpy.types import Operator, PropertyGroup, UIList
+from bpy.props import StringProperty, EnumProperty, IntProperty, BoolProperty, PointerProperty, CollectionProperty
+from .utils import get_cache_dir, write_replacing
+from .imports import post_import, post_import_options
+
+def log_message(message):
+    print(f"[Epic Toolbag - BlendCatalog]: {message}")
+
+class BlendCatalog:
+    """
+    Names of the objects and collections of .blend files, read once per file version.
+
+    Entries are keyed by the absolute path and reused while the file's modification time and
+    size are unchanged, so large libraries are only opened again after they are saved.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or get_cache_dir("blend_catalog")
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get("entries", {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        data = json.dumps({"entries": self.entries})
+        try:
+            write_replacing(self.index_path, lambda f: f.write(data.encode('utf-8')))
+        except OSError as e:
+            log_message(f"Failed to save index: {e}")
+
+    def contents(self, filepath):
+        """
+        Get the datablock names of a .blend file, reading the file only when it changed.
+
+        :param filepath: Path to the .blend file
+        :return: Dict with "objects" and "collections" name lists
+        """
+        filepath = os.path.normpath(os.path.abspath(filepath))
+        stat = os.stat(filepath)
+        entry = self.entries.get(filepath)
+        if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            return entry
+
+        # Assigning nothing to data_to only lists the names; no datablock is loaded
+        with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+            entry = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "objects": list(data_from.objects),
+                "collections": list(data_from.collections),
+            }
+        self.entries[filepath] = entry
+        self.save()
+        return entry
+
+_blend_catalog = None
+
+def get_blend_catalog():
+    global _blend_catalog
+    if _blend_catalog is None:
+        _blend_catalog = BlendCatalog()
+    return _blend_catalog
+
+def load_blend_datablocks(filepath, objects=(), collections=(), link=False, collection=None):
+    """
+    Append or link chosen objects and collections of a .blend file into a collection.
+
+    Linked collections are placed through a collection instance empty, the way File > Link does.
+
+    :param filepath: Path to the .blend file
+    :param objects: Names of the objects to load
+    :param collections: Names of the collections to load
+    :param link: Reference the library instead of copying its data into this file
+    :param collection: Target collection (the active one by default)
+    :return: New objects in the target collection
+    """
+    collection = collection or bpy.context.collection
+    with bpy.data.libraries.load(filepath, link=link) as (data_from, data_to):
+        data_to.objects = [name for name in objects if name in data_from.objects]
+        data_to.collections = [name for name in collections if name in data_from.collections]
+
+    new_objects = []
+    for obj in data_to.objects:
+        if obj is not None:
+            collection.objects.link(obj)
+            new_objects.append(obj)
+    for loaded in data_to.collections:
+        if loaded is None:
+            continue
+        if link:
+            instance = bpy.data.objects.new(loaded.name, None)
+            instance.instance_type = 'COLLECTION'
+            instance.instance_collection = loaded
+            collection.objects.link(instance)
+            new_objects.append(instance)
+        else:
+            collection.children.link(loaded)
+            new_objects.extend(loaded.all_objects)
+    return new_objects
+
+class BlendCatalogItem(PropertyGroup):
+    id_type: EnumProperty(
+        name="Type",
+        items=[
+            ('OBJECT', "Object", "", 'OBJECT_DATA', 0),
+            ('COLLECTION', "Collection", "", 'OUTLINER_COLLECTION', 1),
+        ],
+        default='OBJECT'
+    )
+    selected: BoolProperty(name="Import", default=False)
+
+class BlendCatalogSettings(PropertyGroup):
+    filepath: StringProperty(name="File", subtype='FILE_PATH')
+    items: CollectionProperty(type=BlendCatalogItem)
+    active_index: IntProperty(default=0)
+    show_type: EnumProperty(
+        name="Show",
+        items=[
+            ('ALL', "All", "Objects and collections"),
+            ('OBJECT', "Objects", "Only objects"),
+            ('COLLECTION', "Collections", "Only collections"),
+        ],
+        default='ALL'
+    )
+
+class EPICTOOLBAG_UL_blend_catalog(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "selected", text="")
+        row.label(text=item.name, icon=item.bl_rna.properties['id_type'].enum_items[item.id_type].icon)
+
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        flags = bpy.types.UI_UL_list.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items, "name")
+        if not flags:
+            flags = [self.bitflag_filter_item] * len(items)
+        if data.show_type != 'ALL':
+            flags = [flag if item.id_type == data.show_type else 0 for flag, item in zip(flags, items)]
+        order = bpy.types.UI_UL_list.sort_items_by_name(items, "name") if self.use_filter_sort_alpha else []
+        return flags, order
+
+class PickBlendAssets(Operator):
+    """Choose objects and collections of a .blend file to append or link"""
+    bl_idname = "epictoolbag.pick_blend_assets"
+    bl_label = "Import From Blender File"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filepath: StringProperty(name="File", subtype='FILE_PATH')
+    link: BoolProperty(
+        name="Link",
+        default=False,
+        description="Reference the chosen assets from the library instead of copying them into this file"
+    )
+
+    def invoke(self, context, event):
+        filepath = bpy.path.abspath(self.filepath)
+        if not os.path.isfile(filepath):
+            self.report({'ERROR'}, "File does not exist: " + filepath)
+            return {'CANCELLED'}
+        try:
+            contents = get_blend_catalog().contents(filepath)
+        except (OSError, RuntimeError) as e:
+            self.report({'ERROR'}, f"Cannot read {os.path.basename(filepath)}: {e}")
+            return {'CANCELLED'}
+
+        settings = context.window_manager.epic_blend_catalog
+        settings.items.clear()
+        settings.filepath = filepath
+        settings.active_index = 0
+        for id_type, names in (('COLLECTION', contents["collections"]), ('OBJECT', contents["objects"])):
+            for name in names:
+                item = settings.items.add()
+                item.name = name
+                item.id_type = id_type
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.window_manager.epic_blend_catalog
+        layout.label(text=os.path.basename(settings.filepath), icon='BLENDER')
+        layout.row().prop(settings, "show_type", expand=True)
+        layout.template_list("EPICTOOLBAG_UL_blend_catalog", "", settings, "items", settings, "active_index", rows=10)
+        row = layout.row(align=True)
+        row.operator("epictoolbag.select_blend_catalog_items", text="Select All").select = True
+        row.operator("epictoolbag.select_blend_catalog_items", text="Deselect All").select = False
+        layout.prop(self, "link")
+
+    def execute(self, context):
+        settings = context.window_manager.epic_blend_catalog
+        objects = [item.name for item in settings.items if item.selected and item.id_type == 'OBJECT']
+        collections = [item.name for item in settings.items if item.selected and item.id_type == 'COLLECTION']
+        if not objects and not collections:
+            self.report({'WARNING'}, "Nothing selected.")
+            return {'CANCELLED'}
+
+        new_objects = load_blend_datablocks(settings.filepath, objects, collections, self.link, context.collection)
+        # Linked data belongs to the library and cannot be changed here
+        summary = "" if self.link else post_import(new_objects, **post_import_options(context))
+
+        message = f"{'Linked' if self.link else 'Appended'} {len(objects)} objects and {len(collections)} collections"
+        self.report({'INFO'}, message + summary + ".")
+        return {'FINISHED'}
+
+class SelectBlendCatalogItems(Operator):
+    """Select every catalog entry of the type shown, or deselect all"""
+    bl_idname = "epictoolbag.select_blend_catalog_items"
+    bl_label = "Select Catalog Items"
+    bl_options = {'INTERNAL'}
+
+    select: BoolProperty(default=True)
+
+    def execute(self, context):
+        settings = context.window_manager.epic_blend_catalog
+        for item in settings.items:
+            item.selected = self.select and settings.show_type in {'ALL', item.id_type}
+        return {'FINISHED'}
+
+classes = [
+    BlendCatalogItem,
+    BlendCatalogSettings,
+    EPICTOOLBAG_UL_blend_catalog,
+    PickBlendAssets,
+    SelectBlendCatalogItems,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    # Picker state is per session and never saved into the .blend file
+    bpy.types.WindowManager.epic_blend_catalog = PointerProperty(type=BlendCatalogSettings)
+
+def unregister():
+    del bpy.types.WindowManager.epic_blend_catalog
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,862 @@
+import os
+import json
+import math
+import struct
+from .utils import get_cache_dir, write_replacing
+
+HDRI_EXTENSIONS = ('.hdr', '.exr')
+THUMBNAIL_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+def log_message(message):
+    print(f"Epic Toolbag - HDRI: {message}")
+
+def read_hdri_resolution(filepath):
+    """
+    Read the resolution of an HDRI from its file header without decoding pixels.
+
+    :param filepath: Path to a Radiance (.hdr) or OpenEXR (.exr) file
+    :return: Tuple (width, height) or None if the header can't be parsed
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    try:
+        with open(filepath, 'rb') as f:
+            if ext == '.hdr':
+                return _read_radiance_resolution(f)
+            if ext == '.exr':
+                return _read_exr_resolution(f)
+    except (OSError, ValueError, struct.error) as e:
+        log_message(f"Could not read header of {filepath}: {e}")
+    return None
+
+def _read_radiance_resolution(f):
+    # Header lines end with an empty line, followed by the resolution string (e.g. "-Y 1024 +X 2048")
+    first_line = f.readline(128)
+    if not first_line.startswith(b'#?'):
+        raise ValueError("Not a Radiance file")
+    while True:
+        line = f.readline(4096)
+        if not line:
+            raise ValueError("Unexpected end of header")
+        if line.strip() == b'':
+            break
+    tokens = f.readline(128).split()
+    if len(tokens) != 4:
+        raise ValueError("Invalid resolution string")
+    sizes = {tokens[0][1:2]: int(tokens[1]), tokens[2][1:2]: int(tokens[3])}
+    return sizes[b'X'], sizes[b'Y']
+
+def _read_exr_resolution(f):
+    # OpenEXR header: magic, version, then (name\0, type\0, size, value) attributes until an empty name
+    magic, _version = struct.unpack('<ii', f.read(8))
+    if magic != 20000630:
+        raise ValueError("Not an OpenEXR file")
+    while True:
+        name = _read_null_terminated(f)
+        if not name:
+            raise ValueError("dataWindow attribute not found")
+        _read_null_terminated(f)
+        size = struct.unpack('<i', f.read(4))[0]
+        if name == b'dataWindow':
+            x_min, y_min, x_max, y_max = struct.unpack('<iiii', f.read(16))
+            return x_max - x_min + 1, y_max - y_min + 1
+        f.seek(size, os.SEEK_CUR)
+
+def _read_null_terminated(f, limit=256):
+    chars = bytearray()
+    while len(chars) < limit:
+        char = f.read(1)
+        if not char or char == b'\0':
+            break
+        chars += char
+    return bytes(chars)
+
+class HDRIIndex:
+    """
+    Persistent on-disk index of the HDRI files found under a set of library roots.
+
+    Directories are only listed again when their mtime changes, so rescanning a large
+    (e.g. network) library costs one stat() per directory instead of one per file.
+    """
+    VERSION = 1
+
+    def __init__(self, index_path=None):
+        self.index_path = index_path or os.path.join(get_cache_dir(), "hdri_index.json")
+        self.dirs = {}
+        self.files = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log_message(f"Ignoring unreadable index {self.index_path}: {e}")
+            return
+        if data.get("version") != self.VERSION:
+            return
+        self.dirs = data.get("dirs", {})
+        self.files = data.get("files", {})
+
+    def save(self):
+        if not self.dirty:
+            return
+        data = json.dumps({"version": self.VERSION, "dirs": self.dirs, "files": self.files})
+        try:
+            write_replacing(self.index_path, lambda f: f.write(data.encode('utf-8')))
+            self.dirty = False
+        except OSError as e:
+            log_message(f"Failed to save index {self.index_path}: {e}")
+
+    def scan(self, roots):
+        """
+        Bring the index up to date with the given library roots.
+
+        :param roots: Iterable of directory paths
+        :return: Number of directories that had to be listed again
+        """
+        seen_dirs = set()
+        rescanned = 0
+        stack = [os.path.normpath(root) for root in roots if root and os.path.isdir(root)]
+
+        while stack:
+            dir_path = stack.pop()
+            if dir_path in seen_dirs:
+                continue
+            seen_dirs.add(dir_path)
+
+            try:
+                mtime = os.stat(dir_path).st_mtime
+            except OSError:
+                continue
+
+            entry = self.dirs.get(dir_path)
+            if entry is None or entry["mtime"] != mtime:
+                entry = self._scan_dir(dir_path, mtime)
+                rescanned += 1
+            stack.extend(entry["subdirs"])
+
+        for dir_path in [d for d in self.dirs if d not in seen_dirs]:
+            self._forget_dir(dir_path)
+
+        return rescanned
+
+    def _scan_dir(self, dir_path, mtime):
+        subdirs = []
+        hdri_names = []
+        thumbnails = {}
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+                        continue
+                    stem, ext = os.path.splitext(entry.name)
+                    ext = ext.lower()
+                    if ext in HDRI_EXTENSIONS:
+                        hdri_names.append(entry.name)
+                    elif ext in THUMBNAIL_EXTENSIONS:
+                        thumbnails[stem] = entry.path
+        except OSError as e:
+            log_message(f"Failed to list {dir_path}: {e}")
+
+        previous = self.dirs.get(dir_path)
+        if previous:
+            for name in set(previous["files"]) - set(hdri_names):
+                self.files.pop(os.path.join(dir_path, name), None)
+
+        for name in hdri_names:
+            file_path = os.path.join(dir_path, name)
+            self._update_file(file_path, thumbnails.get(os.path.splitext(name)[0]))
+
+        entry = {"mtime": mtime, "subdirs": sorted(subdirs), "files": sorted(hdri_names)}
+        self.dirs[dir_path] = entry
+        self.dirty = True
+        return entry
+
+    def _update_file(self, file_path, thumbnail_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            self.files.pop(file_path, None)
+            return
+
+        record = self.files.get(file_path)
+        if record and record["size"] == stat.st_size and record["mtime"] == stat.st_mtime:
+            record["thumbnail"] = thumbnail_path
+            return
+
+        self.files[file_path] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "resolution": read_hdri_resolution(file_path),
+            "thumbnail": thumbnail_path,
+        }
+
+    def _forget_dir(self, dir_path):
+        entry = self.dirs.pop(dir_path)
+        for name in entry["files"]:
+            self.files.pop(os.path.join(dir_path, name), None)
+        self.dirty = True
+
+    def entries(self, root):
+        """
+        Iterate the indexed files under a root, sorted by path.
+
+        :param root: Library root directory
+        :return: Generator of (file_path, record) tuples
+        """
+        root = os.path.normpath(root)
+        prefix = root + os.sep
+        for file_path in sorted(self.files):
+            if file_path.startswith(prefix):
+                yield file_path, self.files[file_path]
+
+_hdri_index = None
+
+def get_hdri_index():
+    """Get the shared HDRI index, loading it from disk on first use."""
+    global _hdri_index
+    if _hdri_index is None:
+        _hdri_index = HDRIIndex()
+    return _hdri_index
+
+def parse_library_roots(roots_string):
+    """
+    Split the library roots preference into a list of directories.
+
+    :param roots_string: Paths separated by ';'
+    :return: List of absolute directory paths
+    """
+    roots = []
+    for root in roots_string.split(';'):
+        root = root.strip()
+        if root:
+            roots.append(os.path.abspath(os.path.expanduser(root)))
+    return roots
+
+def decode_radiance(filepath):
+    """
+    Decode a Radiance RGBE (.hdr) file.
+
+    :param filepath: Path to the .hdr file
+    :return: float32 array of shape (height, width, 3), top row first
+    """
+    import numpy as np
+
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    if not data.startswith(b'#?'):
+        raise ValueError("Not a Radiance file")
+    header_end = data.find(b'\n\n')
+    if header_end < 0:
+        raise ValueError("Unexpected end of header")
+    if b'FORMAT=32-bit_rle_xyze' in data[:header_end]:
+        raise ValueError("XYZE Radiance files are not supported")
+    resolution_end = data.index(b'\n', header_end + 2)
+    tokens = data[header_end + 2:resolution_end].split()
+    if len(tokens) != 4 or tokens[0][1:2] != b'Y' or tokens[2][1:2] != b'X':
+        raise ValueError("Unsupported Radiance orientation")
+    height, width = int(tokens[1]), int(tokens[3])
+    flip_y = tokens[0][:1] == b'+'
+
+    pos = resolution_end + 1
+    if width < 8 or width > 0x7fff or data[pos:pos + 2] != b'\x02\x02':
+        # Flat (uncompressed) scanlines
+        rgbe = np.frombuffer(data, dtype=np.uint8, count=width * height * 4, offset=pos)
+        rgbe = rgbe.reshape(height, width, 4)
+    else:
+        rgbe = _decode_radiance_rle(data, pos, width, height, np)
+
+    if flip_y:
+        rgbe = rgbe[::-1]
+
+    exponent = rgbe[..., 3].astype(np.int32)
+    scale = np.where(exponent > 0, np.ldexp(1.0, exponent - 136), 0.0).astype(np.float32)
+    return (rgbe[..., :3].astype(np.float32) + 0.5) * scale[..., None]
+
+def _decode_radiance_rle(data, pos, width, height, np):
+    planes = bytearray(width * height * 4)
+    row_size = width * 4
+    for y in range(height):
+        if data[pos] != 2 or data[pos + 1] != 2 or ((data[pos + 2] << 8) | data[pos + 3]) != width:
+            raise ValueError("Mixed or corrupt RLE scanlines")
+        pos += 4
+        row_start = y * row_size
+        for channel in range(4):
+            x = row_start + channel * width
+            end = x + width
+            while x < end:
+                count = data[pos]
+                pos += 1
+                if count > 128:
+                    count -= 128
+                    planes[x:x + count] = data[pos:pos + 1] * count
+                    pos += 1
+                else:
+                    planes[x:x + count] = data[pos:pos + count]
+                    pos += count
+                x += count
+    # Scanlines are stored channel-planar; reorder to (height, width, RGBE)
+    return np.frombuffer(bytes(planes), dtype=np.uint8).reshape(height, 4, width).transpose(0, 2, 1)
+
+EXR_LINES_PER_BLOCK = {0: 1, 1: 1, 2: 1, 3: 16}
+EXR_PIXEL_TYPES = {0: 'u4', 1: 'f2', 2: 'f4'}
+
+def decode_exr(filepath):
+    """
+    Decode a single-part scanline OpenEXR file (NONE, RLE, ZIPS or ZIP compression).
+
+    :param filepath: Path to the .exr file
+    :return: float32 array of shape (height, width, 3), top row first
+    """
+    import numpy as np
+    import zlib
+
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    magic, version = struct.unpack_from('<ii', data, 0)
+    if magic != 20000630:
+        raise ValueError("Not an OpenEXR file")
+    if version & 0x1a00:
+        raise ValueError("Tiled, deep or multi-part EXR files are not supported")
+
+    pos = 8
+    channels = []
+    compression = 0
+    data_window = None
+    while True:
+        name_end = data.index(b'\0', pos)
+        name = data[pos:name_end]
+        pos = name_end + 1
+        if not name:
+            break
+        type_end = data.index(b'\0', pos)
+        size = struct.unpack_from('<i', data, type_end + 1)[0]
+        value_start = type_end + 5
+        value = data[value_start:value_start + size]
+        if name == b'channels':
+            channels = _parse_exr_channels(value)
+        elif name == b'compression':
+            compression = value[0]
+        elif name == b'dataWindow':
+            data_window = struct.unpack('<iiii', value)
+        pos = value_start + size
+
+    if compression not in EXR_LINES_PER_BLOCK:
+        raise ValueError(f"Unsupported EXR compression ({compression})")
+    if data_window is None or not channels:
+        raise ValueError("Incomplete EXR header")
+
+    x_min, y_min, x_max, y_max = data_window
+    width, height = x_max - x_min + 1, y_max - y_min + 1
+    lines_per_block = EXR_LINES_PER_BLOCK[compression]
+    block_count = (height + lines_per_block - 1) // lines_per_block
+    offsets = np.frombuffer(data, dtype='<u8', count=block_count, offset=pos)
+
+    # Channels are stored in alphabetical order, one run per scanline
+    line_dtype = np.dtype([(name, '<' + EXR_PIXEL_TYPES[pixel_type], (width,)) for name, pixel_type in channels])
+    image = {name: np.empty((height, width), dtype=np.float32) for name, _ in channels}
+
+    for offset in offsets:
+        y, packed_size = struct.unpack_from('<ii', data, int(offset))
+        packed = data[int(offset) + 8:int(offset) + 8 + packed_size]
+        lines = min(lines_per_block, y_max - y + 1)
+        raw_size = line_dtype.itemsize * lines
+        if compression == 0 or packed_size == raw_size:
+            raw = packed
+        elif compression == 1:
+            raw = _exr_reconstruct(_exr_rle_decompress(packed, raw_size), np)
+        else:
+            raw = _exr_reconstruct(zlib.decompress(packed), np)
+        block = np.frombuffer(raw, dtype=line_dtype, count=lines)
+        row = y - y_min
+        for name, _ in channels:
+            image[name][row:row + lines] = block[name]
+
+    names = [name for name, _ in channels]
+    if all(name in names for name in ('R', 'G', 'B')):
+        return np.stack([image['R'], image['G'], image['B']], axis=-1)
+    if 'Y' in names:
+        return np.repeat(image['Y'][..., None], 3, axis=-1)
+    raise ValueError("EXR file has no RGB or Y channels")
+
+def _parse_exr_channels(value):
+    channels = []
+    pos = 0
+    while value[pos:pos + 1] not in (b'\0', b''):
+        name_end = value.index(b'\0', pos)
+        name = value[pos:name_end].decode('utf-8', 'replace')
+        pixel_type = struct.unpack_from('<i', value, name_end + 1)[0]
+        channels.append((name, pixel_type))
+        pos = name_end + 1 + 16
+    return sorted(channels)
+
+def _exr_rle_decompress(packed, raw_size):
+    out = bytearray()
+    pos = 0
+    while pos < len(packed) and len(out) < raw_size:
+        count = struct.unpack_from('b', packed, pos)[0]
+        pos += 1
+        if count < 0:
+            out += packed[pos:pos - count]
+            pos -= count
+        else:
+            out += packed[pos:pos + 1] * (count + 1)
+            pos += 1
+    return bytes(out)
+
+def _exr_reconstruct(buffer, np):
+    # Undo the byte delta predictor, then de-interleave the two halves of the buffer
+    deltas = np.frombuffer(buffer, dtype=np.uint8).astype(np.int64)
+    deltas[1:] -= 128
+    restored = (np.cumsum(deltas) & 0xff).astype(np.uint8)
+    half = (len(restored) + 1) // 2
+    out = np.empty_like(restored)
+    out[0::2] = restored[:half]
+    out[1::2] = restored[half:]
+    return out.tobytes()
+
+def decode_hdri(filepath):
+    """Decode an HDRI file into a float32 (height, width, 3) array."""
+    if os.path.splitext(filepath)[1].lower() == '.exr':
+        return decode_exr(filepath)
+    return decode_radiance(filepath)
+
+def downsample_area(pixels, max_width):
+    """
+    Downsample an image by averaging whole pixel blocks.
+
+    :param pixels: Array of shape (height, width, channels)
+    :param max_width: Maximum width of the result
+    :return: Downsampled array (the input itself if it's already small enough)
+    """
+    height, width = pixels.shape[:2]
+    factor = -(-width // max_width)
+    if factor <= 1:
+        return pixels
+    new_height, new_width = max(1, height // factor), width // factor
+    cropped = pixels[:new_height * factor, :new_width * factor]
+    return cropped.reshape(new_height, factor, new_width, factor, -1).mean(axis=(1, 3))
+
+def tone_map(pixels, method='FILMIC'):
+    """
+    Map HDR pixels to 8-bit sRGB.
+
+    :param pixels: float array of shape (height, width, 3)
+    :param method: 'REINHARD' or 'FILMIC'
+    :return: uint8 array of the same shape
+    """
+    import numpy as np
+
+    pixels = np.nan_to_num(np.maximum(pixels, 0.0), posinf=0.0)
+    luminance = pixels @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+    # Expose so the log-average luminance lands on middle grey
+    log_average = float(np.exp(np.mean(np.log(luminance + 1e-4))))
+    exposed = pixels * (0.18 / max(log_average, 1e-4))
+
+    if method == 'REINHARD':
+        mapped = exposed / (1.0 + exposed)
+    else:
+        # Narkowicz ACES filmic approximation
+        mapped = (exposed * (2.51 * exposed + 0.03)) / (exposed * (2.43 * exposed + 0.59) + 0.14)
+    mapped = np.clip(mapped, 0.0, 1.0)
+
+    srgb = np.where(mapped <= 0.0031308, mapped * 12.92, 1.055 * np.power(mapped, 1 / 2.4) - 0.055)
+    return (srgb * 255.0 + 0.5).astype(np.uint8)
+
+def write_png(filepath, pixels):
+    """
+    Write an 8-bit RGB image as PNG.
+
+    :param filepath: Destination path
+    :param pixels: uint8 array of shape (height, width, 3), top row first
+    """
+    import numpy as np
+    import zlib
+
+    height, width = pixels.shape[:2]
+    rows = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 0] = 0
+    rows[:, 1:] = pixels.reshape(height, width * 3)
+
+    def chunk(tag, body):
+        return struct.pack('>I', len(body)) + tag + body + struct.pack('>I', zlib.crc32(tag + body) & 0xffffffff)
+
+    def write(f):
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+        f.write(chunk(b'IEND', b''))
+
+    write_replacing(filepath, write)
+
+def content_hash(filepath, sample_size=1 << 16):
+    """
+    Hash a file by its size and the first and last blocks of its content.
+
+    :param filepath: Path to the file
+    :param sample_size: Number of bytes read from each end
+    :return: Hex digest
+    """
+    import hashlib
+
+    size = os.path.getsize(filepath)
+    digest = hashlib.sha1(str(size).encode())
+    with open(filepath, 'rb') as f:
+        digest.update(f.read(sample_size))
+        if size > sample_size * 2:
+            f.seek(-sample_size, os.SEEK_END)
+            digest.update(f.read(sample_size))
+    return digest.hexdigest()
+
+def generate_thumbnail(filepath, cache_dir, size=256, method='FILMIC'):
+    """
+    Build (or reuse) a cached PNG thumbnail for an HDRI.
+
+    :param filepath: Path to the .hdr/.exr file
+    :param cache_dir: Directory holding the content-hashed thumbnails
+    :param size: Thumbnail width in pixels
+    :param method: Tone mapping method passed to tone_map
+    :return: Path to the thumbnail
+    """
+    thumbnail_path = os.path.join(cache_dir, f"{content_hash(filepath)}_{size}.png")
+    if not os.path.exists(thumbnail_path):
+        pixels = downsample_area(decode_hdri(filepath), size)
+        write_png(thumbnail_path, tone_map(pixels, method))
+    return thumbnail_path
+
+def write_radiance(filepath, pixels):
+    """
+    Write float RGB pixels as an uncompressed Radiance RGBE (.hdr) file.
+
+    :param filepath: Destination path
+    :param pixels: float array of shape (height, width, 3), top row first
+    """
+    import numpy as np
+
+    pixels = np.nan_to_num(np.maximum(pixels, 0.0), posinf=0.0).astype(np.float32)
+    brightest = pixels.max(axis=-1)
+    mantissa, exponent = np.frexp(brightest)
+    visible = brightest > 1e-32
+    scale = np.where(visible, mantissa * 256.0 / np.where(visible, brightest, 1.0), 0.0)
+
+    rgbe = np.empty(pixels.shape[:2] + (4,), dtype=np.uint8)
+    rgbe[..., :3] = np.clip(pixels * scale[..., None], 0, 255).astype(np.uint8)
+    rgbe[..., 3] = np.where(visible, exponent + 128, 0).astype(np.uint8)
+
+    height, width = pixels.shape[:2]
+    def write(f):
+        f.write(b"#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n")
+        f.write(f"-Y {height} +X {width}\n".encode())
+        f.write(rgbe.tobytes())
+
+    write_replacing(filepath, write)
+
+PROXY_WIDTHS = {'1K': 1024, '2K': 2048}
+
+def get_proxy_path(filepath, width, cache_dir=None):
+    """Get the cache path of an HDRI proxy without creating it."""
+    cache_dir = cache_dir or get_cache_dir("proxies")
+    return os.path.join(cache_dir, f"{content_hash(filepath)}_{width}.hdr")
+
+def get_hdri_proxy(filepath, width, cache_dir=None):
+    """
+    Get a downsampled proxy of an HDRI, creating and caching it on first use.
+
+    :param filepath: Path to the full resolution .hdr/.exr file
+    :param width: Proxy width in pixels
+    :param cache_dir: Proxy directory; must be given when called from a worker thread
+    :return: Path to the proxy, or the original file if it's already small enough
+    """
+    resolution = read_hdri_resolution(filepath)
+    if resolution and resolution[0] <= width:
+        return filepath
+
+    proxy_path = get_proxy_path(filepath, width, cache_dir)
+    if not os.path.exists(proxy_path):
+        write_radiance(proxy_path, downsample_area(decode_hdri(filepath), width))
+        log_message(f"Proxy created: {proxy_path}")
+    return proxy_path
+
+def analyze_pixels(pixels):
+    """
+    Compute lighting statistics of an equirectangular HDRI.
+
+    Every pixel is weighted by the solid angle it covers (cosine of its latitude), so the
+    stretched poles don't dominate the statistics.
+
+    :param pixels: float array of shape (height, width, 3), top row first
+    :return: Dict with mean luminance, percentiles and the brightest region direction
+    """
+    import numpy as np
+
+    pixels = np.nan_to_num(np.maximum(pixels, 0.0), posinf=0.0)
+    height, width = pixels.shape[:2]
+    luminance = pixels @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+    latitudes = (0.5 - (np.arange(height) + 0.5) / height) * math.pi
+    row_weights = np.cos(latitudes)
+    weights = np.broadcast_to(row_weights[:, None], luminance.shape)
+    mean_luminance = float(np.sum(luminance * weights) / np.sum(weights))
+
+    # Weighted percentiles from the cumulative weight of the sorted luminance
+    flat_luminance = luminance.ravel()
+    order = np.argsort(flat_luminance)
+    cumulative = np.cumsum(weights.ravel()[order])
+    cumulative /= cumulative[-1]
+    percentiles = {}
+    for percentile in (50, 90, 99, 99.9):
+        position = min(np.searchsorted(cumulative, percentile / 100.0), len(order) - 1)
+        percentiles[str(percentile)] = float(flat_luminance[order[position]])
+
+    # Find the brightest region on a coarse grid, then refine with a weighted centroid inside it
+    block = max(1, width // 64)
+    coarse = downsample_area(luminance[..., None], max(1, width // block))[..., 0]
+    region_row, region_col = np.unravel_index(np.argmax(coarse), coarse.shape)
+    rows = slice(region_row * block, (region_row + 1) * block)
+    cols = slice(region_col * block, (region_col + 1) * block)
+    region = luminance[rows, cols]
+    region_weights = region * (region >= region.max() * 0.5)
+    total = float(region_weights.sum()) or 1.0
+    row_grid, col_grid = np.mgrid[rows, cols]
+    sun_row = float((row_grid * region_weights).sum() / total) if region_weights.any() else region_row * block
+    sun_col = float((col_grid * region_weights).sum() / total) if region_weights.any() else region_col * block
+
+    u = (sun_col + 0.5) / width
+    v = (sun_row + 0.5) / height
+    return {
+        "mean_luminance": mean_luminance,
+        "max_luminance": float(flat_luminance[order[-1]]),
+        "percentiles": percentiles,
+        # Blender's equirect mapping: azimuth = (0.5 - u) * 2pi, elevation from the top row down
+        "sun_azimuth": math.degrees((0.5 - u) * 2 * math.pi),
+        "sun_elevation": math.degrees((0.5 - v) * math.pi),
+        "sun_luminance": float(coarse[region_row, region_col]),
+    }
+
+def get_hdri_analysis(filepath, index=None):
+    """
+    Get the lighting analysis of an HDRI, reusing the result cached in the HDRI index.
+
+    :param filepath: Path to the .hdr/.exr file
+    :param index: HDRIIndex holding the cache (the shared index by default)
+    :return: Dict as returned by analyze_pixels
+    """
+    index = index or get_hdri_index()
+    record = index.files.get(filepath)
+    if record and record.get("analysis"):
+        return record["analysis"]
+
+    source_path = get_hdri_proxy(filepath, 1024)
+    analysis = analyze_pixels(downsample_area(decode_hdri(source_path), 512))
+    if record is not None:
+        record["analysis"] = analysis
+        index.dirty = True
+        index.save()
+    return analysis
+
+class HDRIPrefetchCache:
+    """
+    Read the HDRIs next to the current one ahead of time on a background thread.
+
+    Prefetched files (or their proxies, which are built here too) are memory-mapped and
+    every page is touched, so the following bpy.data.images.load reads from RAM instead
+    of the disk or network share. Mapped bytes are capped by a memory budget and the least
+    recently used entries are unmapped first.
+    """
+
+    def __init__(self, budget_mb=512):
+        import threading
+        from collections import OrderedDict
+
+        self.budget = budget_mb * 1024 * 1024
+        self.proxy_dir = get_cache_dir("proxies")
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.executor = None
+        self.futures = {}
+
+    def prefetch(self, filepaths, proxy_width=None):
+        """
+        Queue files for prefetching.
+
+        :param filepaths: Full resolution HDRI paths, most important first
+        :param proxy_width: Prefetch the proxy of this width instead of the full file
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="EpicToolbagPrefetch")
+        for filepath in filepaths:
+            key = (filepath, proxy_width)
+            with self.lock:
+                if key in self.entries:
+                    self.entries.move_to_end(key)
+                    continue
+            if key in self.futures and not self.futures[key].done():
+                continue
+            self.futures[key] = self.executor.submit(self._load, key)
+
+    def _load(self, key):
+        import mmap
+        import numpy as np
+
+        filepath, proxy_width = key
+        try:
+            target_path = get_hdri_proxy(filepath, proxy_width, self.proxy_dir) if proxy_width else filepath
+            size = os.path.getsize(target_path)
+            if size == 0 or size > self.budget:
+                return
+            with open(target_path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # Touch one byte per page to pull the whole file into memory
+            np.frombuffer(mapped, dtype=np.uint8)[::mmap.PAGESIZE].sum()
+        except (OSError, ValueError) as e:
+            log_message(f"Prefetch failed for {filepath}: {e}")
+            return
+
+        with self.lock:
+            self.entries[key] = (target_path, mapped, size)
+            self._evict()
+
+    def _evict(self):
+        used = sum(entry[2] for entry in self.entries.values())
+        while used > self.budget and len(self.entries) > 1:
+            _key, (_path, mapped, size) = self.entries.popitem(last=False)
+            self._close(mapped)
+            used -= size
+
+    @staticmethod
+    def _close(mapped):
+        try:
+            mapped.close()
+        except BufferError:
+            # Still referenced by a NumPy view; released when garbage collected
+            pass
+
+    def get(self, filepath, proxy_width=None):
+        """
+        Get the prefetched path for a file, marking it as recently used.
+
+        :return: Path of the prefetched file (the proxy when proxy_width is given), or None
+        """
+        key = (filepath, proxy_width)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def clear(self):
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        for future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+        with self.lock:
+            for _path, mapped, _size in self.entries.values():
+                self._close(mapped)
+            self.entries.clear()
+
+_prefetch_cache = None
+
+def get_prefetch_cache():
+    """Get the shared HDRI prefetch cache."""
+    global _prefetch_cache
+    if _prefetch_cache is None:
+        _prefetch_cache = HDRIPrefetchCache()
+    return _prefetch_cache
+
+def clear_prefetch_cache():
+    global _prefetch_cache
+    if _prefetch_cache is not None:
+        _prefetch_cache.clear()
+        _prefetch_cache = None
+
+class ThumbnailGenerator:
+    """
+    Build HDRI thumbnails on a thread pool and hand the results back on the main thread.
+
+    Decoding, downsampling and PNG compression run in worker threads (NumPy and zlib
+    release the GIL for the heavy parts); finished thumbnails are delivered through a
+    bpy.app.timers callback, since Blender data may only be touched from the main thread.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.cache_dir = get_cache_dir("thumbnails")
+        self.executor = None
+        self.pending = {}
+        self.finished = []
+        self.callback = None
+
+    def submit(self, filepaths, callback):
+        """
+        Queue thumbnails for generation.
+
+        :param filepaths: HDRI files that need a thumbnail
+        :param callback: Called on the main thread as callback(filepath, thumbnail_path)
+        """
+        import bpy
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.callback = callback
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="EpicToolbagThumbs")
+        for filepath in filepaths:
+            if filepath in self.pending:
+                continue
+            future = self.executor.submit(generate_thumbnail, filepath, self.cache_dir)
+            future.add_done_callback(lambda f, path=filepath: self.finished.append((path, f)))
+            self.pending[filepath] = future
+
+        if self.pending and not bpy.app.timers.is_registered(self._deliver):
+            bpy.app.timers.register(self._deliver, first_interval=0.2)
+
+    def _deliver(self):
+        while self.finished:
+            filepath, future = self.finished.pop()
+            self.pending.pop(filepath, None)
+            try:
+                thumbnail_path = future.result()
+            except Exception as e:
+                log_message(f"Thumbnail failed for {filepath}: {e}")
+                continue
+            if self.callback:
+                self.callback(filepath, thumbnail_path)
+        return 0.2 if self.pending else None
+
+    def shutdown(self):
+        import bpy
+
+        if bpy.app.timers.is_registered(self._deliver):
+            bpy.app.timers.unregister(self._deliver)
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        self.finished.clear()
+
+_thumbnail_generator = None
+
+def get_thumbnail_generator():
+    """Get the shared thumbnail generator."""
+    global _thumbnail_generator
+    if _thumbnail_generator is None:
+        _thumbnail_generator = ThumbnailGenerator()
+    return _thumbnail_generator
+
+def shutdown_thumbnail_generator():
+    global _thumbnail_generator
+    if _thumbnail_generator is not None:
+        _thumbnail_generator.shutdown()
+        _thumbnail_generator = None
@@ -3,9 +3,17 @@ import os
 import tempfile
 import zipfile
 import shutil
-from bpy.props import StringProperty, EnumProperty
+import queue
+import threading
+import time
+import json
+import numpy as np
+from bpy.props import StringProperty, EnumProperty, IntProperty, BoolProperty, FloatProperty
 from bpy.types import Operator, AddonPreferences
 from bpy_extras.io_utils import ImportHelper
+from .mesh_readers import PARSED_EXTENSIONS, ParsePool, read_mesh_file, parse_mtl
+from .utils import file_hash, geometry_hash
+from .mesh_cleanup import optimize_meshes, cleanup_summary
 
 def validate_file_extension(file_path):
     """
@@ -16,6 +24,9 @@ def validate_file_extension(file_path):
     """
     if not os.path.exists(file_path):
         return False, "File does not exist."
+
+    if os.path.isdir(file_path):
+        return True, "Valid folder"
     
     file_name, file_ext = os.path.splitext(file_path)
     file_ext = file_ext.lower()
@@ -24,7 +35,9 @@ def validate_file_extension(file_path):
     valid_direct_extensions = {
         '.blend': 'Blender File',
         '.fbx': 'FBX File',
-        '.stl': 'STL File'
+        '.stl': 'STL File',
+        '.obj': 'OBJ File',
+        '.ply': 'PLY File'
     }
     
     # Zip file special handling
@@ -34,7 +47,8 @@ def validate_file_extension(file_path):
                 # Check if zip contains only valid file types
                 invalid_files = [
                     name for name in zip_ref.namelist() 
-                    if os.path.splitext(name)[1].lower() not in {'.blend', '.fbx', '.stl'}
+                    if not name.endswith('/')
+                    and os.path.splitext(name)[1].lower() not in ZIP_IMPORT_EXTENSIONS | ZIP_COMPANION_EXTENSIONS
                 ]
                 
                 if invalid_files:
@@ -50,6 +64,850 @@ def validate_file_extension(file_path):
     
     return False, f"Invalid file type. Supported types: {', '.join(valid_direct_extensions.keys())}"
 
+# Archive members imported by ImportZIPAssets
+ZIP_IMPORT_EXTENSIONS = {'.blend', '.fbx', '.stl', '.obj', '.ply'}
+
+# Files extracted next to an OBJ member so its materials and textures resolve
+ZIP_COMPANION_EXTENSIONS = {'.mtl', '.png', '.jpg', '.jpeg', '.tga', '.tif', '.tiff', '.bmp', '.exr', '.hdr'}
+OBJ_COMPANIONS = {'.obj': ZIP_COMPANION_EXTENSIONS}
+
+def iter_zip_members(zip_path, extensions, temp_dir, prefetch=1, companions=None, cleanup=True, skip=None):
+    """
+    Extract the supported members of a ZIP archive one at a time, reading only the central
+    directory up front. A background thread extracts the next member while the current one
+    is imported, and each file is deleted once the caller moves on, so at most prefetch + 2
+    members are on disk at any time.
+
+    :param zip_path: Path to the archive
+    :param extensions: Lowercase extensions to extract, e.g. {'.fbx'}
+    :param temp_dir: Directory the members are extracted into
+    :param prefetch: Number of members extracted ahead of the one being imported
+    :param companions: Extension -> extensions of files in the same archive folder (and below)
+                       extracted with that member, e.g. the MTL and textures of an OBJ
+    :param cleanup: Delete each member when the caller moves on; when False the caller removes
+                    the member's folder (os.path.dirname of the path) itself
+    :param skip: Called with the ZipInfo of each member before extraction; members it returns
+                 True for are neither extracted nor yielded
+    :return: Generator of (member name, extracted path)
+    """
+    companions = companions or {}
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        all_members = [info for info in zip_ref.infolist() if not info.is_dir()]
+    members = [info for info in all_members if os.path.splitext(info.filename)[1].lower() in extensions
+               and not (skip is not None and skip(info))]
+
+    def companion_members(info):
+        companion_extensions = companions.get(os.path.splitext(info.filename)[1].lower())
+        if not companion_extensions:
+            return []
+        folder = info.filename.rpartition("/")[0]
+        prefix = folder + "/" if folder else ""
+        found = []
+        for other in all_members:
+            relative = other.filename[len(prefix):]
+            if (other.filename.startswith(prefix) and ".." not in relative.split("/")
+                    and os.path.splitext(relative)[1].lower() in companion_extensions):
+                found.append((other, relative))
+        return found
+
+    ready = queue.Queue(maxsize=max(1, prefetch))
+    stop = threading.Event()
+
+    def extract():
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                for index, info in enumerate(members):
+                    if stop.is_set():
+                        break
+                    # One folder per member: archive paths never leave temp_dir
+                    member_dir = os.path.join(temp_dir, f"{index:05d}")
+                    target = os.path.join(member_dir, os.path.basename(info.filename))
+                    extracts = [(info, os.path.basename(info.filename))] + companion_members(info)
+                    for member, relative in extracts:
+                        member_path = os.path.join(member_dir, *relative.split("/"))
+                        os.makedirs(os.path.dirname(member_path), exist_ok=True)
+                        with zip_ref.open(member) as source, open(member_path, 'wb') as destination:
+                            shutil.copyfileobj(source, destination, 1024 * 1024)
+                    ready.put((info.filename, target, None))
+        except Exception as e:
+            ready.put((None, None, e))
+        finally:
+            ready.put(None)
+
+    worker = threading.Thread(target=extract, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is None:
+                break
+            name, path, error = item
+            if error is not None:
+                raise error
+            try:
+                yield name, path
+            finally:
+                if cleanup:
+                    shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+    finally:
+        # Unblock the extractor if the caller stopped early, and remove what it already wrote
+        stop.set()
+        while worker.is_alive() or not ready.empty():
+            try:
+                item = ready.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is not None and item[1]:
+                shutil.rmtree(os.path.dirname(item[1]), ignore_errors=True)
+
+def append_blend_objects(filepath, collection=None):
+    with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+        data_to.objects = [name for name in data_from.objects]
+    collection = collection or bpy.context.collection
+    for obj in data_to.objects:
+        if obj is not None:
+            collection.objects.link(obj)
+
+def build_mesh(name, vertices, faces, face_sizes=None):
+    """
+    Create a mesh in one pass with foreach_set.
+
+    :param name: Mesh name
+    :param vertices: float32 array of shape (V, 3)
+    :param faces: int array of shape (F, 3), or flat vertex indices of all faces when face_sizes is given
+    :param face_sizes: Number of vertices of each face, for meshes that are not all triangles
+    :return: The mesh datablock
+    """
+    if face_sizes is None:
+        face_sizes = np.full(len(faces), 3, dtype=np.int32)
+    loop_count = int(face_sizes.sum())
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(vertices, dtype=np.float32).ravel())
+    mesh.loops.add(loop_count)
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(faces, dtype=np.int32).ravel())
+    mesh.polygons.add(len(face_sizes))
+    loop_starts = np.zeros(len(face_sizes), dtype=np.int32)
+    np.cumsum(face_sizes[:-1], out=loop_starts[1:])
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", np.ascontiguousarray(face_sizes, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    return mesh
+
+def build_stl_object(data, filepath, collection=None):
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    mesh = build_mesh(name, data["positions"], data["faces"])
+    obj = bpy.data.objects.new(name, mesh)
+    (collection or bpy.context.collection).objects.link(obj)
+    return obj
+
+def srgb_to_linear(colors):
+    """Convert (N, 4) sRGB colors to linear, leaving alpha as it is."""
+    linear = np.array(colors, dtype=np.float32)
+    rgb = np.clip(linear[:, :3], 0.0, None)
+    linear[:, :3] = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    return linear
+
+def build_ply_object(data, filepath, collection=None):
+    """
+    Create a mesh object from a parsed PLY file. Files without faces become point clouds:
+    meshes made of vertices only. Vertex colors are stored as a "Col" color attribute.
+
+    :return: The new object
+    """
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    positions = data["positions"]
+    if len(data["face_sizes"]):
+        mesh = build_mesh(name, positions, data["faces"], data["face_sizes"])
+    else:
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(positions))
+        mesh.vertices.foreach_set("co", np.ascontiguousarray(positions, dtype=np.float32).ravel())
+        mesh.update()
+
+    colors = data["colors"]
+    if len(colors):
+        if hasattr(mesh, "color_attributes"):
+            # PLY colors are display (sRGB) values; float color attributes are linear
+            linear = srgb_to_linear(colors)
+            attribute = mesh.color_attributes.new("Col", 'FLOAT_COLOR', 'POINT')
+            attribute.data.foreach_set("color", np.ascontiguousarray(linear, dtype=np.float32).ravel())
+        elif len(data["face_sizes"]):
+            # Before Blender 3.2 colors can only live on face corners
+            layer = mesh.vertex_colors.new(name="Col")
+            layer.data.foreach_set("color", colors[data["faces"]].ravel())
+
+    if len(data["face_sizes"]):
+        if len(data["uvs"]):
+            uv_layer = mesh.uv_layers.new(name="UVMap")
+            uv_layer.data.foreach_set("uv", data["uvs"][data["faces"]].ravel())
+        if len(data["normals"]):
+            mesh.polygons.foreach_set("use_smooth", np.ones(len(data["face_sizes"]), dtype=bool))
+            if hasattr(mesh, "use_auto_smooth"):
+                mesh.use_auto_smooth = True
+            mesh.normals_split_custom_set_from_vertices(data["normals"])
+        mesh.validate(clean_customdata=False)
+
+    obj = bpy.data.objects.new(name, mesh)
+    (collection or bpy.context.collection).objects.link(obj)
+    return obj
+
+def import_ply_native(filepath, collection=None, voxel_size=0.0):
+    """
+    Import a PLY mesh or point cloud.
+
+    :param filepath: Path to the PLY file
+    :param collection: Collection to link the object to (the active one by default)
+    :param voxel_size: Downsample point clouds to one point per voxel of this size (0 keeps every point)
+    :return: The new object
+    """
+    return build_ply_object(read_mesh_file(filepath, voxel_size), filepath, collection)
+
+def import_stl_native(filepath, collection=None):
+    """
+    Import an STL file as a new object without going through the STL import operator.
+
+    :param filepath: Path to the STL file
+    :param collection: Collection to link the object to (the active one by default)
+    :return: The new object
+    """
+    return build_stl_object(read_mesh_file(filepath), filepath, collection)
+
+def operator_available(module, name):
+    # bpy.ops submodules hand out a wrapper for any attribute name, so hasattr is always true
+    return name in dir(getattr(bpy.ops, module))
+
+def import_stl_operator(filepath):
+    # The STL operator was rewritten in C and renamed in Blender 4.1
+    if operator_available("wm", "stl_import"):
+        bpy.ops.wm.stl_import(filepath=filepath)
+    else:
+        bpy.ops.import_mesh.stl(filepath=filepath)
+
+def create_obj_material(name, settings, directory, pack_images=False):
+    material = bpy.data.materials.new(name)
+    material.use_nodes = True
+    principled = next((node for node in material.node_tree.nodes if node.type == 'BSDF_PRINCIPLED'), None)
+    if principled is None:
+        return material
+
+    if "Kd" in settings:
+        principled.inputs['Base Color'].default_value = settings["Kd"] + (1.0,)
+    if settings.get("d", 1.0) < 1.0:
+        principled.inputs['Alpha'].default_value = settings["d"]
+        if hasattr(material, "blend_method"):
+            material.blend_method = 'BLEND'
+    texture = settings.get("map_Kd")
+    if texture:
+        texture_path = os.path.join(directory, texture.replace("\\", os.sep))
+        if os.path.exists(texture_path):
+            image = bpy.data.images.load(texture_path, check_existing=True)
+            if pack_images:
+                # The file may be a temporary extraction that is about to be deleted
+                image.pack()
+            image_node = material.node_tree.nodes.new('ShaderNodeTexImage')
+            image_node.image = image
+            image_node.location = (principled.location.x - 300, principled.location.y)
+            material.node_tree.links.new(image_node.outputs['Color'], principled.inputs['Base Color'])
+    return material
+
+def import_obj_native(filepath, collection=None, pack_images=False):
+    """
+    Import an OBJ file with its MTL materials, one object per "o" statement.
+
+    :param filepath: Path to the OBJ file
+    :param collection: Collection to link the objects to (the active one by default)
+    :param pack_images: Pack texture images into the .blend file
+    :return: List of new objects
+    """
+    return build_obj_objects(read_mesh_file(filepath), filepath, collection, pack_images)
+
+def import_obj_operator(filepath):
+    # The OBJ operator was rewritten in C++ and renamed in Blender 3.2; the Python one is gone in 4.0
+    if operator_available("wm", "obj_import"):
+        bpy.ops.wm.obj_import(filepath=filepath)
+    else:
+        bpy.ops.import_scene.obj(filepath=filepath)
+
+def use_obj_operator():
+    # The C++ importer parses several times faster than read_obj (see BenchmarkOBJImport)
+    return operator_available("wm", "obj_import")
+
+def parsed_extensions():
+    """Extensions read by mesh_readers in worker processes; OBJ files go to the C++ importer when there is one."""
+    return PARSED_EXTENSIONS - {'.obj'} if use_obj_operator() else PARSED_EXTENSIONS
+
+def import_obj(filepath, collection=None, pack_images=False):
+    """
+    Import an OBJ file with Blender's C++ importer when it exists (3.2+), and with
+    import_obj_native otherwise.
+
+    :param filepath: Path to the OBJ file
+    :param collection: Collection to link the objects to (the active one by default)
+    :param pack_images: Pack texture images into the .blend file
+    :return: List of new objects
+    """
+    if not use_obj_operator():
+        return import_obj_native(filepath, collection, pack_images)
+
+    existing_objects = set(bpy.data.objects)
+    existing_images = set(bpy.data.images)
+    import_obj_operator(filepath)
+    objects = [obj for obj in bpy.data.objects if obj not in existing_objects]
+    if collection is not None:
+        for obj in objects:
+            for user_collection in list(obj.users_collection):
+                if user_collection != collection:
+                    user_collection.objects.unlink(obj)
+            if collection not in obj.users_collection:
+                collection.objects.link(obj)
+    if pack_images:
+        # The file may be a temporary extraction that is about to be deleted
+        for image in bpy.data.images:
+            if image not in existing_images and image.source == 'FILE' and not image.packed_file:
+                image.pack()
+    return objects
+
+def build_obj_objects(data, filepath, collection=None, pack_images=False):
+    return list(iter_obj_objects(data, filepath, collection, pack_images))
+
+def iter_obj_objects(data, filepath, collection=None, pack_images=False):
+    """Create the objects of a parsed OBJ file one at a time. :return: Generator of new objects"""
+    directory = os.path.dirname(filepath)
+    collection = collection or bpy.context.collection
+
+    mtl_settings = {}
+    for mtllib in data["mtllibs"]:
+        mtl_settings.update(parse_mtl(os.path.join(directory, mtllib)))
+    materials = [create_obj_material(name, mtl_settings.get(name, {}), directory, pack_images)
+                 for name in data["material_names"]]
+
+    face_sizes = data["face_sizes"]
+    valid_faces = face_sizes >= 3
+    loop_faces = np.repeat(np.arange(len(face_sizes)), face_sizes)
+    for object_index, object_name in enumerate(data["object_names"]):
+        face_mask = valid_faces & (data["face_objects"] == object_index)
+        if not face_mask.any():
+            continue
+        loop_mask = face_mask[loop_faces]
+        loops = data["face_indices"][loop_mask]
+        used_vertices, local_vertices = np.unique(loops[:, 0], return_inverse=True)
+        sizes = face_sizes[face_mask]
+
+        mesh = build_mesh(object_name, data["positions"][used_vertices], local_vertices.ravel(), sizes)
+
+        if len(data["uvs"]) and np.any(loops[:, 1] >= 0):
+            uv_layer = mesh.uv_layers.new(name="UVMap")
+            uv_layer.data.foreach_set("uv", data["uvs"][np.maximum(loops[:, 1], 0)].ravel())
+
+        face_material_indices = data["face_materials"][face_mask]
+        used_materials = [index for index in np.unique(face_material_indices) if index >= 0]
+        for index in used_materials:
+            mesh.materials.append(materials[index])
+        if used_materials:
+            slots = np.searchsorted(used_materials, np.maximum(face_material_indices, used_materials[0]))
+            mesh.polygons.foreach_set("material_index", slots.astype(np.int32))
+
+        if len(data["normals"]) and np.all(loops[:, 2] >= 0):
+            mesh.polygons.foreach_set("use_smooth", np.ones(len(sizes), dtype=bool))
+            if hasattr(mesh, "use_auto_smooth"):
+                mesh.use_auto_smooth = True
+            mesh.normals_split_custom_set(data["normals"][loops[:, 2]])
+
+        mesh.validate(clean_customdata=False)
+        obj = bpy.data.objects.new(object_name, mesh)
+        collection.objects.link(obj)
+        yield obj
+
+def iter_parsed_objects(data, filepath, collection=None, pack_images=False):
+    """
+    Create objects from the arrays of mesh_readers.read_mesh_file, one at a time.
+
+    :return: Generator of new objects
+    """
+    if data["format"] == "stl":
+        yield build_stl_object(data, filepath, collection)
+    elif data["format"] == "ply":
+        yield build_ply_object(data, filepath, collection)
+    else:
+        yield from iter_obj_objects(data, filepath, collection, pack_images)
+
+def mesh_file_steps(pool, items, objects, errors, collection=None, pack_images=False, cleanup=None, on_import=None):
+    """
+    Parse mesh files in worker processes and build their objects as each one finishes,
+    one object per step.
+
+    :param pool: mesh_readers.ParsePool
+    :param items: Iterable of (name, filepath)
+    :param objects: List the new objects are added to
+    :param errors: List (name, error message) pairs are added to
+    :param collection: Collection to link the objects to (the active one by default)
+    :param pack_images: Pack texture images into the .blend file
+    :param cleanup: Called with each filepath once its objects exist
+    :param on_import: Called with (name, new objects) for each file imported without errors
+    :return: Generator of (name, file finished); (None, False) while waiting on the workers
+    """
+    for name, filepath, data, error in pool.run(items, idle=True):
+        if name is None:
+            yield None, False
+            continue
+        file_objects = []
+        try:
+            if error is None:
+                for obj in iter_parsed_objects(data, filepath, collection, pack_images):
+                    file_objects.append(obj)
+                    objects.append(obj)
+                    yield name, False
+                if on_import is not None:
+                    on_import(name, file_objects)
+            else:
+                errors.append((name, error))
+        except Exception as e:
+            errors.append((name, str(e)))
+        finally:
+            if cleanup is not None:
+                cleanup(filepath)
+        yield name, True
+
+# Scene property mapping the content key of each imported source file to the objects it created
+IMPORT_RECORD_PROPERTY = "epictoolbag_imported_files"
+# Scene property holding the per-file timings of the last modal import, as JSON
+IMPORT_TIMINGS_PROPERTY = "epictoolbag_import_timings"
+
+def zip_member_key(info):
+    # The central directory already stores each member's size and CRC-32: no extraction needed
+    return f"crc32:{info.file_size}:{info.CRC:08x}"
+
+def import_key(key, filepath, voxel_size=0.0):
+    """
+    Import record key of a source file. PLY files imported with voxel downsampling also key
+    on the voxel size, so importing a point cloud at another density is a new import.
+
+    :param key: Content key from utils.file_hash or zip_member_key
+    :param filepath: Path or name of the source, for its extension
+    :param voxel_size: Voxel size used for PLY point clouds
+    """
+    if voxel_size > 0 and filepath.lower().endswith(".ply"):
+        return f"{key}:voxel:{voxel_size!r}"
+    return key
+
+def find_import(scene, key):
+    """
+    Get the objects left in the file from an earlier import of the same source.
+
+    :param scene: Scene the source was imported into
+    :param key: Content key from utils.file_hash or zip_member_key
+    :return: Object names; empty when the source was never imported or all its objects were deleted
+    """
+    record = scene.get(IMPORT_RECORD_PROPERTY)
+    if record is None or key not in record:
+        return []
+    return [name for name in record[key] if name in bpy.data.objects]
+
+def remember_import(scene, key, objects):
+    if scene.get(IMPORT_RECORD_PROPERTY) is None:
+        scene[IMPORT_RECORD_PROPERTY] = {}
+    scene[IMPORT_RECORD_PROPERTY][key] = [obj.name for obj in objects]
+
+def import_once(scene, key, import_file, skip_imported=True):
+    """
+    Run an import unless the same source was already imported into the scene, and record it.
+
+    :param scene: Target scene
+    :param key: Content key of the source
+    :param import_file: Callable performing the import
+    :param skip_imported: Skip sources whose objects are still in the file
+    :return: New objects, or None when the source was skipped
+    """
+    if skip_imported and find_import(scene, key):
+        return None
+    existing = set(bpy.data.objects)
+    import_file()
+    objects = [obj for obj in bpy.data.objects if obj not in existing]
+    remember_import(scene, key, objects)
+    return objects
+
+def mesh_signature(mesh):
+    return len(mesh.vertices), len(mesh.loops), len(mesh.polygons), len(mesh.uv_layers), len(mesh.materials)
+
+def label_steps(steps, label):
+    """Yield label for every step of a step generator and return its return value."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+        yield label
+
+def run_steps(steps):
+    """Run a step generator to its end and return its return value."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+def deduplicate_meshes(objects):
+    """
+    Make objects with identical meshes share one mesh datablock, reusing meshes already in the
+    file where possible, and remove the copies (and materials) left without users.
+
+    :param objects: Newly imported objects
+    :return: Number of meshes removed
+    """
+    return run_steps(deduplicate_mesh_steps(objects))
+
+def deduplicate_mesh_steps(objects):
+    """
+    deduplicate_meshes in steps: the generator yields after each new mesh and returns the
+    number of meshes removed.
+    """
+    new_meshes = list(dict.fromkeys(obj.data for obj in objects if obj.type == 'MESH'))
+    new_set = set(new_meshes)
+
+    # Weights are compared by vertex group name, so meshes whose users disagree on the names are kept
+    group_names = {}
+    for obj in bpy.data.objects:
+        if obj.type == 'MESH':
+            group_names.setdefault(obj.data, set()).add(tuple(group.name for group in obj.vertex_groups))
+
+    def mesh_hash(mesh):
+        names = group_names.get(mesh, {()})
+        if len(names) > 1:
+            return None
+        return geometry_hash(mesh, next(iter(names)) or None)
+
+    # Existing meshes are only hashed when a new mesh has the same element counts
+    candidates = {}
+    for mesh in bpy.data.meshes:
+        if mesh not in new_set and mesh.users and mesh.library is None and mesh.shape_keys is None:
+            candidates.setdefault(mesh_signature(mesh), []).append(mesh)
+
+    by_hash = {}
+    removed = 0
+    for mesh in new_meshes:
+        if mesh.shape_keys is not None:
+            continue
+        signature = mesh_signature(mesh)
+        for existing in candidates.pop(signature, ()):
+            existing_hash = mesh_hash(existing)
+            if existing_hash is not None:
+                by_hash.setdefault((signature, existing_hash), existing)
+        digest = mesh_hash(mesh)
+        yield
+        if digest is None:
+            continue
+        key = (signature, digest)
+        target = by_hash.get(key)
+        if target is None:
+            by_hash[key] = mesh
+            continue
+
+        materials = [material for material in mesh.materials if material is not None]
+        mesh.user_remap(target)
+        bpy.data.meshes.remove(mesh)
+        removed += 1
+        for material in materials:
+            if material.users == 0:
+                bpy.data.materials.remove(material)
+    return removed
+
+def post_import_options(context):
+    addon_prefs = context.preferences.addons[__package__].preferences
+    return {
+        "share_meshes": addon_prefs.share_identical_meshes,
+        "optimize": addon_prefs.optimize_imported_meshes,
+        "merge_distance": addon_prefs.import_merge_distance,
+    }
+
+# Vertices cleaned up per post-import step, so modal imports keep to their time budget
+POST_IMPORT_BATCH_VERTICES = 200000
+
+def mesh_batches(meshes, max_vertices):
+    batch, size = [], 0
+    for mesh in meshes:
+        if batch and size + len(mesh.vertices) > max_vertices:
+            yield batch
+            batch, size = [], 0
+        batch.append(mesh)
+        size += len(mesh.vertices)
+    if batch:
+        yield batch
+
+def post_import(objects, share_meshes=True, optimize=False, merge_distance=1e-5):
+    """
+    Run the optional post-import stages on a batch of new objects: mesh cleanup, then
+    sharing of identical meshes (so cleaned copies still match each other).
+
+    :return: Summary for the import report, e.g. " (3 identical meshes shared)", or ""
+    """
+    return run_steps(post_import_steps(objects, share_meshes, optimize, merge_distance))
+
+def post_import_steps(objects, share_meshes=True, optimize=False, merge_distance=1e-5):
+    """
+    post_import in steps: the generator yields after each batch of cleaned meshes and each
+    mesh compared for sharing, and returns the summary.
+    """
+    notes = []
+    if optimize:
+        stats = {"meshes": 0, "vertices": 0, "faces": 0, "flipped": 0}
+        meshes = list(dict.fromkeys(obj.data for obj in objects if obj.type == 'MESH'))
+        for batch in mesh_batches(meshes, POST_IMPORT_BATCH_VERTICES):
+            for key, value in optimize_meshes(batch, merge_distance).items():
+                stats[key] += value
+            yield
+        summary = cleanup_summary(stats)
+        if summary:
+            notes.append(summary)
+    if share_meshes:
+        shared = yield from deduplicate_mesh_steps(objects)
+        if shared:
+            notes.append(f"{shared} identical meshes shared")
+    return f" ({', '.join(notes)})" if notes else ""
+
+def import_file_once(context, filepath, import_file, voxel_size=0.0):
+    """
+    Import one file with import_once, following the add-on's import preferences, then run
+    the post-import stages on its objects.
+
+    :param filepath: Source file, hashed for the import record
+    :param import_file: Callable performing the import
+    :param voxel_size: Voxel size the import downsamples PLY point clouds with
+    :return: (new objects, or None when the file was skipped, post-import summary)
+    """
+    addon_prefs = context.preferences.addons[__package__].preferences
+    key = import_key(file_hash(filepath), filepath, voxel_size)
+    objects = import_once(context.scene, key, import_file, addon_prefs.skip_imported_files)
+    if objects is None:
+        return None, ""
+    return objects, post_import(objects, **post_import_options(context))
+
+# Datablock types removed again when a modal import is cancelled
+ROLLBACK_DATA = ("objects", "meshes", "materials", "images", "textures", "node_groups", "collections",
+                 "cameras", "lights", "curves", "armatures", "actions", "libraries")
+
+# Events a running modal import lets through: view navigation only. Everything else (undo,
+# clicks on buttons, shortcuts) could free the datablocks the import still refers to
+IMPORT_PASS_THROUGH_EVENTS = {
+    'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE', 'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE',
+    'WHEELINMOUSE', 'WHEELOUTMOUSE', 'TRACKPADPAN', 'TRACKPADZOOM', 'MOUSEROTATE', 'MOUSESMARTZOOM',
+    'NDOF_MOTION', 'WINDOW_DEACTIVATE',
+}
+
+def datablock_key(datablock):
+    # session_uid stays unique for the whole session; pointers can be reused once an ID is freed
+    return getattr(datablock, "session_uid", 0) or datablock.as_pointer()
+
+def datablock_counts():
+    return [len(getattr(bpy.data, attr)) for attr in ROLLBACK_DATA]
+
+def snapshot_datablocks():
+    return {attr: {datablock_key(datablock) for datablock in getattr(bpy.data, attr)} for attr in ROLLBACK_DATA}
+
+def collect_new_datablocks(known, created):
+    """
+    Record the datablocks that appeared since the last snapshot.
+
+    :param known: Keys per type from snapshot_datablocks; updated to the current state
+    :param created: Keys per type of the datablocks recorded as new; new keys are added
+    """
+    for attr in ROLLBACK_DATA:
+        current = {datablock_key(datablock) for datablock in getattr(bpy.data, attr)}
+        created.setdefault(attr, set()).update(current - known[attr])
+        known[attr] = current
+
+def remove_created_datablocks(created):
+    """
+    Remove the datablocks recorded by collect_new_datablocks that still exist.
+
+    :return: Number of datablocks removed
+    """
+    new_ids = [(attr, datablock) for attr, keys in created.items()
+               for datablock in getattr(bpy.data, attr) if datablock_key(datablock) in keys]
+    remove_datablocks(new_ids)
+    return len(new_ids)
+
+class ModalImport:
+    """
+    Mixin running an import operator as a modal operator.
+
+    Subclasses must define import_steps(scene, collection): a generator doing one unit of work
+    per iteration (a file, or one object of a file), yielding the name of the file it worked on,
+    or None while it waits on worker processes. They may override finish_import(context) to
+    report the result. Every timer event runs steps until time_budget
+    seconds are spent, so Blender keeps redrawing. Datablocks appearing while steps run are
+    recorded, and Esc stops the import and removes them again. Other events are blocked apart
+    from view navigation, so undo or other operators cannot free data the import refers to.
+    Time spent per file is logged and kept on the scene.
+    """
+    time_budget = 0.1
+
+    def start_import(self, context, total):
+        self.total = max(total, 1)
+        self.completed = 0
+        self.timings = {}
+        self._known = snapshot_datablocks()
+        self._counts = datablock_counts()
+        self._created = {}
+        self._scene = context.scene
+        self._steps = self.import_steps(context.scene, context.collection)
+        self._start_time = time.perf_counter()
+        wm = context.window_manager
+        wm.progress_begin(0, self.total)
+        self._timer = wm.event_timer_add(0.02, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            removed = self.rollback(context)
+            self.report({'WARNING'}, f"Import cancelled, {removed} new datablocks removed.")
+            return {'CANCELLED'}
+
+        if event.type in IMPORT_PASS_THROUGH_EVENTS:
+            return {'PASS_THROUGH'}
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        # Only datablocks appearing while the steps run belong to the import
+        if datablock_counts() != self._counts:
+            self._known = snapshot_datablocks()
+        deadline = time.perf_counter() + self.time_budget
+        try:
+            try:
+                while time.perf_counter() < deadline:
+                    step_start = time.perf_counter()
+                    name = next(self._steps)
+                    if name is None:
+                        break
+                    self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - step_start
+            finally:
+                collect_new_datablocks(self._known, self._created)
+                self._counts = datablock_counts()
+        except StopIteration:
+            self.end_import(context)
+            self.save_timings()
+            self.finish_import(context)
+            return {'FINISHED'}
+        except Exception as e:
+            removed = self.rollback(context)
+            self.report({'ERROR'}, f"Import failed: {e} ({removed} new datablocks removed)")
+            return {'CANCELLED'}
+
+        context.window_manager.progress_update(min(self.completed, self.total))
+        return {'PASS_THROUGH'}
+
+    def cancel(self, context):
+        self.rollback(context)
+
+    def rollback(self, context):
+        # Closing the generator runs its cleanup: workers are killed and extracted files removed
+        self._steps.close()
+        self.end_import(context)
+        return remove_created_datablocks(self._created)
+
+    def end_import(self, context):
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+
+    def save_timings(self):
+        elapsed = time.perf_counter() - self._start_time
+        slowest = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+        print(f"Epic Toolbag - Import of {self.completed} files took {elapsed:.2f}s")
+        for name, seconds in slowest[:10]:
+            print(f"Epic Toolbag -   {name}: {seconds:.3f}s")
+        # Main thread time per file; parsing done in worker processes is not included
+        self._scene[IMPORT_TIMINGS_PROPERTY] = json.dumps({"total": elapsed, "files": dict(slowest)})
+
+    def run_post_import(self):
+        """Post-import stages of self.objects, one batch per step; sets self.summary."""
+        self.summary = yield from label_steps(
+            post_import_steps(self.objects, **self.post_import_options), "post-import")
+
+    def finish_import(self, context):
+        pass
+
+# Orphan datablock types purged by Clear All Assets
+PURGE_ORPHAN_TYPES = ("meshes", "curves", "armatures", "cameras", "lights", "materials", "node_groups",
+                      "textures", "images", "actions", "collections")
+PURGE_MAX_PASSES = 32
+
+def estimate_datablock_bytes(datablock):
+    """Rough memory used by a mesh or image; other datablocks count as zero."""
+    if isinstance(datablock, bpy.types.Mesh):
+        loops = len(datablock.loops)
+        return (len(datablock.vertices) * 16 + len(datablock.edges) * 8 + loops * 8
+                + len(datablock.polygons) * 12 + loops * 8 * len(datablock.uv_layers))
+    if isinstance(datablock, bpy.types.Image) and datablock.has_data:
+        width, height = datablock.size
+        return width * height * datablock.channels * (4 if datablock.is_float else 1)
+    return 0
+
+def remove_datablocks(datablocks):
+    """Remove (collection name, datablock) pairs in one batch when Blender supports it."""
+    if hasattr(bpy.data, "batch_remove"):
+        bpy.data.batch_remove([datablock for _attr, datablock in datablocks])
+    else:
+        for attr, datablock in datablocks:
+            getattr(bpy.data, attr).remove(datablock)
+
+def scene_collections(scene):
+    collections = [scene.collection]
+    for collection in collections:
+        collections.extend(child for child in collection.children if child not in collections)
+    return collections
+
+def purge_assets(scene):
+    """
+    Remove the objects of a scene, hidden and excluded ones included, and the asset collections,
+    then purge orphan data until nothing is left without users. Targets are gathered before
+    anything is removed, and each pass is a single batch removal, so no datablock is skipped
+    and nothing is removed twice.
+
+    Objects that other scenes also use are only unlinked from the collections of this scene
+    that no other scene contains, so other scenes keep them.
+
+    :param scene: Scene whose objects are removed
+    :return: (count of removed or unlinked datablocks per type, estimated bytes freed)
+    """
+    counts = {"objects": 0, "collections": 0, "unlinked objects": 0}
+    freed = 0
+    shared = [obj for obj in scene.objects if any(user != scene for user in obj.users_scene)]
+    if shared:
+        other_collections = set()
+        for other in bpy.data.scenes:
+            if other != scene:
+                other_collections.update(scene_collections(other))
+        own_collections = [collection for collection in scene_collections(scene) if collection not in other_collections]
+        for obj in shared:
+            linked = [collection for collection in own_collections if collection.objects.get(obj.name) == obj]
+            for collection in linked:
+                collection.objects.unlink(obj)
+            counts["unlinked objects"] += bool(linked)
+    shared = set(shared)
+    targets = [("objects", obj) for obj in scene.objects if obj not in shared]
+    targets.extend(("collections", collection) for collection in bpy.data.collections
+                   if collection.asset_data is not None)
+
+    # Removing a batch leaves the data it used without users: repeat until a fixed point.
+    # Dependency chains are short; the pass limit only guards against data that refuses removal
+    for _pass in range(PURGE_MAX_PASSES):
+        if not targets:
+            break
+        for attr, datablock in targets:
+            counts[attr] = counts.get(attr, 0) + 1
+            freed += estimate_datablock_bytes(datablock)
+        remove_datablocks(targets)
+        targets = [(attr, datablock) for attr in PURGE_ORPHAN_TYPES for datablock in getattr(bpy.data, attr)
+                   if datablock.users == 0 and not datablock.use_fake_user
+                   and getattr(datablock, "type", None) not in {'RENDER_RESULT', 'COMPOSITING'}]
+    return counts, freed
+
 def setup_default_principled_bsdf():
     if "Principled BSDF" not in bpy.data.materials:
         principled_bsdf = bpy.data.materials.new(name="Principled BSDF")
@@ -79,6 +937,9 @@ class Preferences(AddonPreferences):
             ('BLEND', "Blender File", "A single Blender file with assets"),
             ('FBX', "FBX File", "A single FBX file with assets"),
             ('STL', "STL File", "A single STL file with assets"),
+            ('OBJ', "OBJ File", "A single OBJ file with its MTL materials"),
+            ('PLY', "PLY File", "A single PLY mesh or point cloud"),
+            ('FOLDER', "Folder", "Every supported file in a folder"),
 
         ],
         default='ZIP',
@@ -91,6 +952,65 @@ class Preferences(AddonPreferences):
         description="Message to inform the user about the selected file type"
     )
 
+    hdri_library_roots: StringProperty(
+        name="HDRI Libraries",
+        default="",
+        description="Additional HDRI library folders, separated by ';'"
+    )
+
+    hdri_prefetch_budget: IntProperty(
+        name="HDRI Prefetch Memory (MB)",
+        default=512,
+        min=64,
+        max=16384,
+        description="Memory used to keep neighbouring HDRIs ready while browsing"
+    )
+
+    skip_imported_files: BoolProperty(
+        name="Skip Imported Files",
+        default=True,
+        description="Do not import a file again while the objects of its last import are still in this file"
+    )
+
+    share_identical_meshes: BoolProperty(
+        name="Share Identical Meshes",
+        default=True,
+        description="Imported objects with the same geometry, UVs and materials use one mesh datablock"
+    )
+
+    optimize_imported_meshes: BoolProperty(
+        name="Clean Up Imported Meshes",
+        default=False,
+        description="Merge split vertices, remove degenerate faces and loose geometry and fix face winding after importing"
+    )
+
+    import_merge_distance: FloatProperty(
+        name="Merge Distance",
+        default=1e-5,
+        min=1e-9,
+        soft_max=0.01,
+        precision=6,
+        subtype='DISTANCE',
+        description="Imported vertices closer than this are merged"
+    )
+
+    ply_voxel_size: FloatProperty(
+        name="Point Cloud Voxel Size",
+        default=0.0,
+        min=0.0,
+        soft_max=1.0,
+        precision=4,
+        subtype='DISTANCE',
+        description="Downsample imported PLY point clouds to one point per voxel of this size (0 keeps every point)"
+    )
+
+    render_cache_size_mb: IntProperty(
+        name="Render Cache Size (MB)",
+        default=2048,
+        min=64,
+        description="Disk space kept for cached renders before the least recently used are removed"
+    )
+
     def draw(self, context):
         layout = self.layout
         if self.info_message:
@@ -100,6 +1020,21 @@ class Preferences(AddonPreferences):
         row = layout.row()
         row.operator("epictoolbag.confirm_assets_dir", text="Import Assets", icon='IMPORT')
         row.operator("epictoolbag.clear_assets_dir", text="", icon='TRASH')
+        row = layout.row()
+        row.prop(self, "skip_imported_files")
+        row.prop(self, "share_identical_meshes")
+        row = layout.row()
+        row.prop(self, "optimize_imported_meshes")
+        sub = row.row()
+        sub.active = self.optimize_imported_meshes
+        sub.prop(self, "import_merge_distance")
+        layout.prop(self, "ply_voxel_size")
+        row = layout.row(align=True)
+        row.prop(self, "hdri_library_roots")
+        row.operator("epictoolbag.rescan_hdri_library", text="", icon='FILE_REFRESH')
+        layout.prop(self, "hdri_prefetch_budget")
+        layout.prop(self, "render_cache_size_mb")
+        layout.operator("epictoolbag.benchmark_stl_import", icon='TIME')
 
     def clear_info_message(self):
         self.info_message = ""
@@ -113,7 +1048,8 @@ class ClearAssetsDir(Operator):
         name="Clear Type",
         items=[
             ('FILE', "Clear File", "Clear the selected file path"),
-            ('ALL', "Clear All Assets", "Remove all project assets")
+            ('ALL', "Clear All Assets", "Remove every object of this scene, hidden and excluded ones included, "
+                                        "the asset collections and all unused data; objects other scenes use are only unlinked")
         ],
         default='FILE'
     )
@@ -147,6 +1083,12 @@ class ClearAssetsDir(Operator):
                 addon_prefs.info_message = "FBX file uploaded successfully."
             elif assets_type == 'STL':
                 addon_prefs.info_message = "STL file uploaded successfully."
+            elif assets_type == 'OBJ':
+                addon_prefs.info_message = "OBJ file uploaded successfully."
+            elif assets_type == 'PLY':
+                addon_prefs.info_message = "PLY file uploaded successfully."
+            elif assets_type == 'FOLDER':
+                addon_prefs.info_message = "Folder uploaded successfully."
             
             if assets_type == 'ZIP':
                 bpy.ops.epictoolbag.import_zip_assets(filepath=assets_dir)
@@ -156,31 +1098,22 @@ class ClearAssetsDir(Operator):
                 bpy.ops.epictoolbag.import_fbx_assets(filepath=assets_dir)
             elif assets_type == 'STL':
                 bpy.ops.epictoolbag.import_stl_assets(filepath=assets_dir)
+            elif assets_type == 'OBJ':
+                bpy.ops.epictoolbag.import_obj_assets(filepath=assets_dir)
+            elif assets_type == 'PLY':
+                bpy.ops.epictoolbag.import_ply_assets(filepath=assets_dir, voxel_size=addon_prefs.ply_voxel_size)
+            elif assets_type == 'FOLDER':
+                bpy.ops.epictoolbag.import_folder_assets(directory=assets_dir)
         
         elif self.clear_type == 'ALL':
             # Clear all project assets logic
             addon_prefs.assets_dir = ""
-            bpy.ops.object.select_all(action='SELECT')
-            bpy.ops.object.delete()
+            start_time = time.perf_counter()
+            counts, freed = purge_assets(context.scene)
             
-            # Clear unused data
-            for material in bpy.data.materials:
-                if material.users == 0:
-                    bpy.data.materials.remove(material)
-            for texture in bpy.data.textures:
-                if texture.users == 0:
-                    bpy.data.textures.remove(texture)
-            for mesh in bpy.data.meshes:
-                if mesh.users == 0:
-                    bpy.data.meshes.remove(mesh)
-            for image in bpy.data.images:
-                if image.users == 0:
-                    bpy.data.images.remove(image)
-            for collection in bpy.data.collections:
-                if collection.asset_data is not None:
-                    bpy.data.collections.remove(collection)
-            
-            self.report({'INFO'}, "All project assets cleared.")
+            summary = ", ".join(f"{count} {attr.replace('_', ' ')}" for attr, count in counts.items() if count)
+            self.report({'INFO'}, f"All project assets cleared in {time.perf_counter() - start_time:.2f}s: "
+                                  f"{summary or 'nothing to remove'} (~{freed / (1024 * 1024):.1f} MB).")
         
         return {'FINISHED'}
 
@@ -190,81 +1123,107 @@ class ClearAssetsDir(Operator):
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "clear_type")
+        if self.clear_type == 'ALL':
+            column = layout.column(align=True)
+            column.label(text=f"Removes all {len(context.scene.objects)} objects of this scene,", icon='ERROR')
+            column.label(text="hidden and excluded ones included, and all unused data.")
+            column.label(text="Objects other scenes use are only unlinked from this scene.")
 
-class ImportZIPAssets(Operator, ImportHelper):
+class ImportZIPAssets(ModalImport, Operator, ImportHelper):
+    """Import the assets of a ZIP archive in the background; Esc cancels and removes what was imported"""
     bl_idname = "epictoolbag.import_zip_assets"
     bl_label = "Import ZIP Assets"
     filename_ext = ".zip;.cats"
 
     def execute(self, context):
-        assets_dir = bpy.path.abspath(self.filepath)
-        temp_dir = tempfile.mkdtemp()
-        obj_files_not_supported = []
-        supported_files_found = False
+        self.assets_dir = bpy.path.abspath(self.filepath)
+        addon_prefs = context.preferences.addons[__package__].preferences
+        self.post_import_options = post_import_options(context)
+        self.voxel_size = addon_prefs.ply_voxel_size
+        self.member_keys = {}
+        self.skipped = 0
+        self.objects = []
+        self.errors = []
+        self.summary = ""
 
         try:
-            with zipfile.ZipFile(assets_dir, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            self.report({'INFO'}, f"Assets extracted to temporary directory: {temp_dir}")
-            
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if file.endswith(".blend"):
-                        self.import_blend(file_path)
-                        supported_files_found = True
-                    elif file.endswith(".fbx"):
-                        self.import_fbx(file_path)
-                        supported_files_found = True
-                    elif file.endswith(".stl"):
-                        self.import_stl(file_path)
-                        supported_files_found = True
-                    elif file.endswith(".obj"):
-                        obj_files_not_supported.append(file)
-
-            if not supported_files_found:
+            with zipfile.ZipFile(self.assets_dir, 'r') as zip_ref:
+                members = [info for info in zip_ref.infolist() if not info.is_dir()
+                           and os.path.splitext(info.filename)[1].lower() in ZIP_IMPORT_EXTENSIONS]
+        except (OSError, zipfile.BadZipFile) as e:
+            self.report({'ERROR'}, f"Failed to read the ZIP archive: {e}")
+            return {'CANCELLED'}
+
+        for info in members:
+            key = import_key(zip_member_key(info), info.filename, self.voxel_size)
+            if addon_prefs.skip_imported_files and find_import(context.scene, key):
+                self.skipped += 1
+            else:
+                self.member_keys[info.filename] = key
+
+        if not self.member_keys:
+            if self.skipped:
+                self.report({'INFO'}, f"All {self.skipped} assets of the ZIP archive are already imported.")
+            else:
                 self.report({'WARNING'}, "No supported files found in the ZIP archive.")
                 context.window_manager.popup_menu(
-                    lambda self, context: self.layout.label(text="No supported files found in the ZIP archive."), 
-                    title="Warning", 
+                    lambda self, context: self.layout.label(text="No supported files found in the ZIP archive."),
+                    title="Warning",
                     icon='ERROR'
                 )
+            return {'FINISHED'}
 
-        except Exception as e:
-            self.report({'ERROR'}, f"Failed to extract or import assets: {str(e)}")
-            return {'CANCELLED'}
-        finally:
-            shutil.rmtree(temp_dir)
-
-        if obj_files_not_supported:
-            warning_message = "OBJ files not supported:\n" + "\n".join(obj_files_not_supported)
-            self.report({'WARNING'}, warning_message)
-            context.window_manager.popup_menu(lambda self, context: self.layout.label(text=warning_message), title="Warning: OBJ Files Not Supported", icon='ERROR')
-
-        return {'FINISHED'}
+        self.report({'INFO'}, f"Importing {len(self.member_keys)} assets, press Esc to cancel...")
+        return self.start_import(context, len(self.member_keys))
 
-    def import_blend(self, filepath):
+    def import_steps(self, scene, collection):
+        temp_dir = tempfile.mkdtemp()
+        skip = lambda info: info.filename not in self.member_keys
         try:
-            with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
-                data_to.objects = [name for name in data_from.objects]
+            # STL/OBJ members are parsed in worker processes while the next ones are extracted
+            pool = ParsePool(temp_dir, voxel_size=self.voxel_size)
+            members = iter_zip_members(self.assets_dir, parsed_extensions(), temp_dir, prefetch=max(1, pool.max_workers),
+                                       companions=OBJ_COMPANIONS, cleanup=False, skip=skip)
+            # Textures are packed: the extracted files are deleted right after the import
+            steps = mesh_file_steps(
+                pool, members, self.objects, self.errors, collection, pack_images=True,
+                cleanup=lambda path: shutil.rmtree(os.path.dirname(path), ignore_errors=True),
+                on_import=lambda name, file_objects: remember_import(scene, self.member_keys[name], file_objects))
+            for name, finished in steps:
+                if finished:
+                    self.completed += 1
+                yield name
 
-            for obj in data_to.objects:
-                if obj is not None:
-                    bpy.context.collection.objects.link(obj)
-        except Exception as e:
-            self.report({'ERROR'}, f"Error importing Blend file: {str(e)}")
+            # Blend, FBX and (with the C++ importer) OBJ files go through Blender itself, one at a time
+            other_extensions = ZIP_IMPORT_EXTENSIONS - parsed_extensions()
+            for name, file_path in iter_zip_members(self.assets_dir, other_extensions, temp_dir,
+                                                    companions=OBJ_COMPANIONS, skip=skip):
+                file_ext = os.path.splitext(name)[1].lower()
+                if file_ext == ".blend":
+                    import_file = lambda: append_blend_objects(file_path, collection)
+                elif file_ext == ".obj":
+                    import_file = lambda: import_obj(file_path, collection, pack_images=True)
+                else:
+                    import_file = lambda: bpy.ops.import_scene.fbx(filepath=file_path)
+                try:
+                    self.objects.extend(import_once(scene, self.member_keys[name], import_file, skip_imported=False))
+                except Exception as e:
+                    self.errors.append((name, str(e)))
+                self.completed += 1
+                yield name
 
-    def import_fbx(self, filepath):
-        try:
-            bpy.ops.import_scene.fbx(filepath=filepath)
-        except Exception as e:
-            self.report({'ERROR'}, f"Error importing FBX file: {str(e)}")
+            yield from self.run_post_import()
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def finish_import(self, context):
+        for name, error in self.errors:
+            self.report({'ERROR'}, f"Error importing {name}: {error}")
+        message = f"Imported {self.completed - len(self.errors)} assets from the ZIP archive"
+        if self.skipped:
+            message += f", skipped {self.skipped} already imported"
+        self.report({'INFO'}, message + "." + self.summary)
 
-    def import_stl(self, filepath):
-        try:
-            bpy.ops.import_mesh.stl(filepath=filepath)
-        except Exception as e:
-            self.report({'ERROR'}, f"Error importing STL file: {str(e)}")
 
 class ImportBlendAssets(Operator, ImportHelper):
     bl_idname = "epictoolbag.import_blend_assets"
@@ -276,17 +1235,26 @@ class ImportBlendAssets(Operator, ImportHelper):
         maxlen=255,
     )
 
+    choose_assets: BoolProperty(
+        name="Choose Assets",
+        default=True,
+        description="Pick the objects and collections to append or link instead of appending every object"
+    )
+
     def execute(self, context):
         blend_file_path = bpy.path.abspath(self.filepath)
         if not os.path.isfile(blend_file_path):
             self.report({'ERROR'}, "File does not exist: " + blend_file_path)
             return {'CANCELLED'}
-        with bpy.data.libraries.load(blend_file_path, link=False) as (data_from, data_to):
-            data_to.objects = [name for name in data_from.objects]
-        for obj in data_to.objects:
-            if obj is not None:
-                bpy.context.collection.objects.link(obj)
-        self.report({'INFO'}, "Blender file imported.")
+        if self.choose_assets:
+            # The picker dialog appends or links the chosen assets itself
+            bpy.ops.epictoolbag.pick_blend_assets('INVOKE_DEFAULT', filepath=blend_file_path)
+            return {'FINISHED'}
+        objects, summary = import_file_once(context, blend_file_path, lambda: append_blend_objects(blend_file_path))
+        if objects is None:
+            self.report({'INFO'}, "Blender file is already imported.")
+            return {'FINISHED'}
+        self.report({'INFO'}, "Blender file imported." + summary)
         return {'FINISHED'}
     
 class ImportFBXAssets(Operator, ImportHelper):
@@ -300,8 +1268,12 @@ class ImportFBXAssets(Operator, ImportHelper):
     )
 
     def execute(self, context):
-        bpy.ops.import_scene.fbx(filepath=bpy.path.abspath(self.filepath))
-        self.report({'INFO'}, "FBX imported.")
+        filepath = bpy.path.abspath(self.filepath)
+        objects, summary = import_file_once(context, filepath, lambda: bpy.ops.import_scene.fbx(filepath=filepath))
+        if objects is None:
+            self.report({'INFO'}, "FBX file is already imported.")
+            return {'FINISHED'}
+        self.report({'INFO'}, "FBX imported." + summary)
         return {'FINISHED'}
 
 class ImportSTLAssets(Operator, ImportHelper):
@@ -315,9 +1287,266 @@ class ImportSTLAssets(Operator, ImportHelper):
     )
 
     def execute(self, context):
-        bpy.ops.import_mesh.stl(filepath=bpy.path.abspath(self.filepath))
-        self.report({'INFO'}, "STL imported.")
+        filepath = bpy.path.abspath(self.filepath)
+        objects, summary = import_file_once(context, filepath, lambda: import_stl_native(filepath, context.collection))
+        if objects is None:
+            self.report({'INFO'}, "STL file is already imported.")
+            return {'FINISHED'}
+        obj = objects[0]
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+        self.report({'INFO'}, f"STL imported: {len(obj.data.polygons)} triangles." + summary)
+        return {'FINISHED'}
+
+class ImportOBJAssets(Operator, ImportHelper):
+    bl_idname = "epictoolbag.import_obj_assets"
+    bl_label = "Import OBJ Assets"
+    filename_ext = ".obj"
+    filter_glob: StringProperty(
+        default="*.obj",
+        options={'HIDDEN'},
+        maxlen=255,
+    )
+
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+        objects, summary = import_file_once(context, filepath, lambda: import_obj(filepath, context.collection))
+        if objects is None:
+            self.report({'INFO'}, "OBJ file is already imported.")
+            return {'FINISHED'}
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+        if objects:
+            context.view_layer.objects.active = objects[0]
+        self.report({'INFO'}, f"OBJ imported: {len(objects)} objects." + summary)
+        return {'FINISHED'}
+
+class ImportPLYAssets(Operator, ImportHelper):
+    bl_idname = "epictoolbag.import_ply_assets"
+    bl_label = "Import PLY Assets"
+    filename_ext = ".ply"
+    filter_glob: StringProperty(
+        default="*.ply",
+        options={'HIDDEN'},
+        maxlen=255,
+    )
+
+    voxel_size: FloatProperty(
+        name="Voxel Size",
+        default=0.0,
+        min=0.0,
+        soft_max=1.0,
+        precision=4,
+        subtype='DISTANCE',
+        description="Downsample point clouds to one point per voxel of this size (0 keeps every point)"
+    )
+
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+        objects, summary = import_file_once(
+            context, filepath, lambda: import_ply_native(filepath, context.collection, self.voxel_size),
+            self.voxel_size)
+        if objects is None:
+            self.report({'INFO'}, "PLY file is already imported.")
+            return {'FINISHED'}
+        obj = objects[0]
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+        mesh = obj.data
+        if mesh.polygons:
+            self.report({'INFO'}, f"PLY imported: {len(mesh.polygons)} faces." + summary)
+        else:
+            self.report({'INFO'}, f"PLY point cloud imported: {len(mesh.vertices)} points." + summary)
+        return {'FINISHED'}
+
+class ImportFolderAssets(ModalImport, Operator):
+    """Import every supported file in a folder, parsing STL, OBJ and PLY files in parallel; Esc cancels"""
+    bl_idname = "epictoolbag.import_folder_assets"
+    bl_label = "Import Folder Assets"
+
+    directory: StringProperty(
+        name="Folder",
+        subtype='DIR_PATH'
+    )
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        self.folder = bpy.path.abspath(self.directory)
+        if not os.path.isdir(self.folder):
+            self.report({'ERROR'}, "Folder does not exist: " + self.folder)
+            return {'CANCELLED'}
+
+        addon_prefs = context.preferences.addons[__package__].preferences
+        self.skip_imported = addon_prefs.skip_imported_files
+        self.post_import_options = post_import_options(context)
+        self.voxel_size = addon_prefs.ply_voxel_size
+        self.parsed_files = []
+        self.other_files = []
+        parsed = parsed_extensions()
+        for root, dirs, files in os.walk(self.folder):
+            for file in sorted(files):
+                file_ext = os.path.splitext(file)[1].lower()
+                file_path = os.path.join(root, file)
+                if file_ext in parsed:
+                    self.parsed_files.append((os.path.relpath(file_path, self.folder), file_path))
+                elif file_ext in {".blend", ".fbx", ".obj"}:
+                    self.other_files.append((os.path.relpath(file_path, self.folder), file_path))
+
+        self.file_keys = {}
+        self.skipped = 0
+        self.objects = []
+        self.errors = []
+        self.summary = ""
+        total = len(self.parsed_files) + len(self.other_files)
+        if not total:
+            self.report({'WARNING'}, "No supported files found in the folder.")
+            return {'FINISHED'}
+        return self.start_import(context, total)
+
+    def pending_files(self, scene, files):
+        # Files are hashed as they are reached, so hashing a large folder is spread over the steps
+        for name, file_path in files:
+            key = import_key(file_hash(file_path), file_path, self.voxel_size)
+            if self.skip_imported and find_import(scene, key):
+                self.skipped += 1
+                self.completed += 1
+                continue
+            self.file_keys[name] = key
+            yield name, file_path
+
+    def import_steps(self, scene, collection):
+        work_dir = tempfile.mkdtemp(prefix="epictoolbag_parse_")
+        try:
+            steps = mesh_file_steps(
+                ParsePool(work_dir, voxel_size=self.voxel_size), self.pending_files(scene, self.parsed_files), self.objects, self.errors,
+                collection, on_import=lambda name, file_objects: remember_import(scene, self.file_keys[name], file_objects))
+            for name, finished in steps:
+                if finished:
+                    self.completed += 1
+                yield name
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        for name, file_path in self.pending_files(scene, self.other_files):
+            if file_path.lower().endswith(".blend"):
+                import_file = lambda: append_blend_objects(file_path, collection)
+            elif file_path.lower().endswith(".obj"):
+                import_file = lambda: import_obj(file_path, collection)
+            else:
+                import_file = lambda: bpy.ops.import_scene.fbx(filepath=file_path)
+            try:
+                self.objects.extend(import_once(scene, self.file_keys[name], import_file, skip_imported=False))
+            except Exception as e:
+                self.errors.append((name, str(e)))
+            self.completed += 1
+            yield name
+
+        yield from self.run_post_import()
+
+    def finish_import(self, context):
+        for name, error in self.errors:
+            self.report({'ERROR'}, f"Error importing {name}: {error}")
+        message = f"Imported {self.completed - self.skipped - len(self.errors)} files from the folder"
+        if self.skipped:
+            message += f", skipped {self.skipped} already imported"
+        self.report({'INFO'}, message + "." + self.summary)
+
+class BenchmarkSTLImport(Operator, ImportHelper):
+    """Time the native STL reader against Blender's STL import operator on one file"""
+    bl_idname = "epictoolbag.benchmark_stl_import"
+    bl_label = "Benchmark STL Import"
+    filename_ext = ".stl"
+    filter_glob: StringProperty(
+        default="*.stl",
+        options={'HIDDEN'},
+        maxlen=255,
+    )
+
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+        timings = {}
+
+        start_time = time.perf_counter()
+        obj = import_stl_native(filepath, context.collection)
+        timings["native"] = time.perf_counter() - start_time
+        triangles = len(obj.data.polygons)
+        remove_objects_and_meshes([obj])
+
+        existing = set(bpy.data.objects)
+        start_time = time.perf_counter()
+        try:
+            import_stl_operator(filepath)
+            timings["operator"] = time.perf_counter() - start_time
+        except (RuntimeError, AttributeError) as e:
+            self.report({'WARNING'}, f"STL operator unavailable: {e}")
+        remove_objects_and_meshes([obj for obj in bpy.data.objects if obj not in existing])
+
+        message = f"{triangles} triangles - native {timings['native']:.3f}s"
+        if "operator" in timings:
+            message += f", operator {timings['operator']:.3f}s ({timings['operator'] / max(timings['native'], 1e-9):.1f}x)"
+        print(f"Epic Toolbag - STL benchmark: {message}")
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+class BenchmarkOBJImport(Operator, ImportHelper):
+    """Time the native OBJ reader against Blender's OBJ import operator on one file"""
+    bl_idname = "epictoolbag.benchmark_obj_import"
+    bl_label = "Benchmark OBJ Import"
+    filename_ext = ".obj"
+    filter_glob: StringProperty(
+        default="*.obj",
+        options={'HIDDEN'},
+        maxlen=255,
+    )
+
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+        size_mb = os.path.getsize(filepath) / (1024 * 1024)
+        timings = {}
+
+        existing_materials = set(bpy.data.materials)
+        start_time = time.perf_counter()
+        objects = import_obj_native(filepath, context.collection)
+        timings["native"] = time.perf_counter() - start_time
+        faces = sum(len(obj.data.polygons) for obj in objects)
+        remove_objects_and_meshes(objects)
+
+        existing = set(bpy.data.objects)
+        start_time = time.perf_counter()
+        try:
+            import_obj_operator(filepath)
+            timings["operator"] = time.perf_counter() - start_time
+        except (RuntimeError, AttributeError) as e:
+            self.report({'WARNING'}, f"OBJ operator unavailable: {e}")
+        remove_objects_and_meshes([obj for obj in bpy.data.objects if obj not in existing])
+        for material in [material for material in bpy.data.materials if material not in existing_materials]:
+            if material.users == 0:
+                bpy.data.materials.remove(material)
+
+        message = f"{faces} faces, {size_mb:.1f} MB - native {timings['native']:.3f}s ({size_mb / max(timings['native'], 1e-9):.0f} MB/s)"
+        if "operator" in timings:
+            message += (f", operator {timings['operator']:.3f}s ({size_mb / max(timings['operator'], 1e-9):.0f} MB/s, "
+                        f"speedup {timings['native'] / max(timings['operator'], 1e-9):.1f}x)")
+        print(f"Epic Toolbag - OBJ benchmark: {message}")
+        self.report({'INFO'}, message)
         return {'FINISHED'}
+
+def remove_objects_and_meshes(objects):
+    meshes = [obj.data for obj in objects if obj.type == 'MESH']
+    for obj in objects:
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in meshes:
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
     
 class ConfirmAssetsDir(Operator):
     bl_idname = "epictoolbag.confirm_assets_dir"
@@ -342,15 +1571,25 @@ class ConfirmAssetsDir(Operator):
         assets_dir = addon_prefs.assets_dir
         
         if assets_type == 'ZIP':
-            bpy.ops.epictoolbag.import_zip_assets(filepath=assets_dir)
+            result = bpy.ops.epictoolbag.import_zip_assets(filepath=assets_dir)
         elif assets_type == 'BLEND':
-            bpy.ops.epictoolbag.import_blend_assets(filepath=assets_dir)
+            result = bpy.ops.epictoolbag.import_blend_assets(filepath=assets_dir)
         elif assets_type == 'FBX':
-            bpy.ops.epictoolbag.import_fbx_assets(filepath=assets_dir)
+            result = bpy.ops.epictoolbag.import_fbx_assets(filepath=assets_dir)
         elif assets_type == 'STL':
-            bpy.ops.epictoolbag.import_stl_assets(filepath=assets_dir)
+            result = bpy.ops.epictoolbag.import_stl_assets(filepath=assets_dir)
+        elif assets_type == 'OBJ':
+            result = bpy.ops.epictoolbag.import_obj_assets(filepath=assets_dir)
+        elif assets_type == 'PLY':
+            result = bpy.ops.epictoolbag.import_ply_assets(filepath=assets_dir, voxel_size=addon_prefs.ply_voxel_size)
+        elif assets_type == 'FOLDER':
+            result = bpy.ops.epictoolbag.import_folder_assets(directory=assets_dir)
         
-        self.report({'INFO'}, f"Imported {assets_type} file successfully.")
+        if 'RUNNING_MODAL' in result:
+            # ZIP and folder imports continue in the background and report when they finish
+            self.report({'INFO'}, f"Importing {assets_type} assets, press Esc to cancel...")
+        else:
+            self.report({'INFO'}, f"Imported {assets_type} file successfully.")
         return {'FINISHED'}
 
 classes = [
@@ -361,6 +1600,11 @@ classes = [
     ImportBlendAssets,
     ImportFBXAssets,
     ImportSTLAssets,
+    ImportOBJAssets,
+    ImportPLYAssets,
+    ImportFolderAssets,
+    BenchmarkSTLImport,
+    BenchmarkOBJImport,
 ]
 
 def register():
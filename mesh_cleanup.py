@@ -0,0 +1,418 @@
+import bpy
+import bmesh
+import numpy as np
+from bpy.props import FloatProperty
+from bpy.types import Operator
+from .utils import ATTRIBUTE_VALUES, EDGE_FLAGS
+
+def log_message(message):
+    print(f"[Epic Toolbag - MeshCleanup]: {message}")
+
+# Attributes written through their own properties below instead of the generic attribute copy
+HANDLED_ATTRIBUTES = {"position", "material_index", "sharp_face", "sharp_edge", "custom_normal"}
+
+def clean_mesh_arrays(positions, loop_vertices, face_sizes, vertex_counts, face_counts, merge_distance=1e-5):
+    """
+    Weld close vertices, drop collapsed and zero-area faces and remove the vertices no face uses,
+    for a batch of meshes stored back to back. Vertices are only welded within their own mesh.
+
+    :param positions: (V, 3) vertex positions of all meshes
+    :param loop_vertices: (L,) vertex index of every loop, into positions
+    :param face_sizes: (F,) number of loops of every face
+    :param vertex_counts: Number of vertices of each mesh
+    :param face_counts: Number of faces of each mesh
+    :param merge_distance: Quantization step of the weld
+    :return: Dict with the kept "positions" (V2, 3), "loop_vertices" (L2,) local to each mesh,
+             "face_sizes" (F2,), the original index of every kept vertex, loop and face
+             ("vertex_source", "loop_source", "face_source"), the new index of every original
+             vertex or -1 ("vertex_map") and per-mesh "vertex_counts", "loop_counts" and "face_counts"
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    face_sizes = np.asarray(face_sizes, dtype=np.int64)
+    mesh_count = len(vertex_counts)
+    vertex_mesh = np.repeat(np.arange(mesh_count), vertex_counts)
+    face_mesh = np.repeat(np.arange(mesh_count), face_counts)
+
+    # Spatial hash: quantized coordinates with the mesh index as the most significant part
+    quantized = np.round(positions / merge_distance).astype(np.int64)
+    if len(quantized):
+        quantized -= quantized.min(axis=0)
+    extent = (quantized.max(axis=0) + 1) if len(quantized) else np.ones(3, dtype=np.int64)
+    if float(mesh_count) * float(np.prod(extent.astype(np.float64))) < 2 ** 62:
+        keys = ((vertex_mesh * extent[0] + quantized[:, 0]) * extent[1] + quantized[:, 1]) * extent[2] + quantized[:, 2]
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        is_first = np.ones(len(keys), dtype=bool)
+        is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    else:
+        order = np.lexsort((quantized[:, 2], quantized[:, 1], quantized[:, 0], vertex_mesh))
+        rows = np.column_stack((vertex_mesh, quantized))[order]
+        is_first = np.ones(len(rows), dtype=bool)
+        is_first[1:] = np.any(rows[1:] != rows[:-1], axis=1)
+    welded = np.empty(len(order), dtype=np.int64)
+    welded[order] = np.cumsum(is_first) - 1
+    representative = order[is_first]
+
+    # Drop loops that repeat the previous vertex of their face after welding
+    loop_count = len(loop_vertices)
+    loop_welded = welded[np.asarray(loop_vertices, dtype=np.int64)]
+    face_starts = np.zeros(len(face_sizes), dtype=np.int64)
+    np.cumsum(face_sizes[:-1], out=face_starts[1:])
+    loop_face = np.repeat(np.arange(len(face_sizes)), face_sizes)
+    previous = np.arange(loop_count) - 1
+    previous[face_starts] = face_starts + face_sizes - 1
+    keep_loop = loop_welded != loop_welded[previous]
+    kept_sizes = np.bincount(loop_face[keep_loop], minlength=len(face_sizes))
+
+    # Face areas from the Newell normal of the remaining loops
+    kept = np.flatnonzero(keep_loop)
+    kept_points = positions[representative[loop_welded[kept]]]
+    kept_starts = np.zeros(len(face_sizes), dtype=np.int64)
+    np.cumsum(kept_sizes[:-1], out=kept_starts[1:])
+    following = np.arange(len(kept)) + 1
+    non_empty = kept_sizes > 0
+    following[kept_starts[non_empty] + kept_sizes[non_empty] - 1] = kept_starts[non_empty]
+    area = np.zeros(len(face_sizes))
+    if len(kept):
+        cross = np.cross(kept_points, kept_points[following])
+        newell = np.add.reduceat(cross, kept_starts[non_empty], axis=0)
+        area[non_empty] = 0.5 * np.linalg.norm(newell, axis=1)
+    valid_face = (kept_sizes >= 3) & (area > merge_distance * merge_distance * 1e-3)
+
+    loop_source = np.flatnonzero(keep_loop & valid_face[loop_face])
+    face_source = np.flatnonzero(valid_face)
+    final_welded = loop_welded[loop_source]
+
+    # Vertices no face uses any more (loose or merged away) are dropped
+    used, new_loop_vertices = np.unique(final_welded, return_inverse=True)
+    vertex_source = representative[used]
+    welded_new = np.full(len(representative), -1, dtype=np.int64)
+    welded_new[used] = np.arange(len(used))
+    new_vertex_counts = np.bincount(vertex_mesh[vertex_source], minlength=mesh_count)
+    vertex_offsets = np.zeros(mesh_count, dtype=np.int64)
+    np.cumsum(new_vertex_counts[:-1], out=vertex_offsets[1:])
+    loop_mesh = face_mesh[loop_face[loop_source]]
+
+    return {
+        "positions": positions[vertex_source],
+        "loop_vertices": new_loop_vertices.ravel() - vertex_offsets[loop_mesh],
+        "face_sizes": kept_sizes[face_source],
+        "vertex_source": vertex_source,
+        "loop_source": loop_source,
+        "face_source": face_source,
+        "vertex_map": welded_new[welded],
+        "vertex_counts": new_vertex_counts,
+        "loop_counts": np.bincount(loop_mesh, minlength=mesh_count),
+        "face_counts": np.bincount(face_mesh[face_source], minlength=mesh_count),
+    }
+
+def read_custom_normals(mesh):
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if hasattr(mesh, "corner_normals"):
+        mesh.corner_normals.foreach_get("vector", normals)
+    else:
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", normals)
+    return normals.reshape(-1, 3)
+
+def generic_attributes(mesh):
+    """Attributes copied through the generic attribute API, or None when one cannot be copied."""
+    skip = HANDLED_ATTRIBUTES | {layer.name for layer in mesh.uv_layers}
+    skip.update(attribute.name for attribute in getattr(mesh, "color_attributes", ()))
+    attributes = []
+    for attribute in getattr(mesh, "attributes", ()):
+        if attribute.name in skip or attribute.name.startswith("."):
+            continue
+        if attribute.data_type not in ATTRIBUTE_VALUES or attribute.domain not in {'POINT', 'EDGE', 'CORNER', 'FACE'}:
+            return None
+        attributes.append(attribute)
+    return attributes
+
+def can_clean(mesh):
+    return (mesh.polygons and mesh.shape_keys is None and mesh.library is None
+            and hasattr(mesh, "clear_geometry") and generic_attributes(mesh) is not None)
+
+def read_deform_weights(mesh):
+    """Vertex group weights as (vertex, group, weight) arrays."""
+    vertices, groups, weights = [], [], []
+    for vertex in mesh.vertices:
+        for element in vertex.groups:
+            vertices.append(vertex.index)
+            groups.append(element.group)
+            weights.append(element.weight)
+    return np.array(vertices, dtype=np.int64), np.array(groups, dtype=np.int32), np.array(weights, dtype=np.float32)
+
+def write_deform_weights(mesh, vertices, groups, weights):
+    # Meshes have no bulk API for weights; bmesh writes them without going through the objects
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        layer = bm.verts.layers.deform.verify()
+        bm.verts.ensure_lookup_table()
+        for vertex, group, weight in zip(vertices.tolist(), groups.tolist(), weights.tolist()):
+            bm.verts[vertex][layer][group] = weight
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+
+def remap_edges(old_edges, vertex_map, new_edges, vertex_count):
+    """
+    Match the edges of a rebuilt mesh to the original edges by their vertex pairs.
+
+    :param old_edges: (E, 2) original edge vertices
+    :param vertex_map: New index of every original vertex, or -1
+    :param new_edges: (E2, 2) edge vertices of the rebuilt mesh
+    :param vertex_count: Number of vertices of the rebuilt mesh
+    :return: Original edge index of every new edge, or -1 for edges that did not exist before
+    """
+    mapped = np.sort(vertex_map[old_edges], axis=1)
+    candidates = np.flatnonzero((mapped[:, 0] >= 0) & (mapped[:, 0] != mapped[:, 1]))
+    old_keys = mapped[candidates, 0] * vertex_count + mapped[candidates, 1]
+    order = np.argsort(old_keys, kind='stable')
+    old_keys = old_keys[order]
+    new_sorted = np.sort(new_edges.astype(np.int64), axis=1)
+    new_keys = new_sorted[:, 0] * vertex_count + new_sorted[:, 1]
+    if not len(old_keys):
+        return np.full(len(new_keys), -1, dtype=np.int64)
+    position = np.minimum(np.searchsorted(old_keys, new_keys), len(old_keys) - 1)
+    return np.where(old_keys[position] == new_keys, candidates[order[position]], -1)
+
+def read_mesh_arrays(mesh, read_weights=False):
+    """Geometry and the per-vertex, per-edge, per-loop and per-face data kept through the cleanup."""
+    vertex_count, loop_count, face_count = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+    data = {
+        "positions": np.empty(vertex_count * 3, dtype=np.float32),
+        "loop_vertices": np.empty(loop_count, dtype=np.int32),
+        "face_sizes": np.empty(face_count, dtype=np.int32),
+        "material_index": np.empty(face_count, dtype=np.int32),
+        "use_smooth": np.empty(face_count, dtype=bool),
+        "uvs": {},
+        "colors": {},
+        "normals": read_custom_normals(mesh) if mesh.has_custom_normals else None,
+        "attributes": {},
+        "edge_properties": {},
+        "edges": None,
+        "weights": read_deform_weights(mesh) if read_weights else None,
+    }
+    mesh.vertices.foreach_get("co", data["positions"])
+    data["positions"] = data["positions"].reshape(-1, 3)
+    mesh.loops.foreach_get("vertex_index", data["loop_vertices"])
+    mesh.polygons.foreach_get("loop_total", data["face_sizes"])
+    mesh.polygons.foreach_get("material_index", data["material_index"])
+    mesh.polygons.foreach_get("use_smooth", data["use_smooth"])
+    for uv_layer in mesh.uv_layers:
+        uvs = np.empty(loop_count * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        data["uvs"][uv_layer.name] = uvs.reshape(-1, 2)
+    for attribute in getattr(mesh, "color_attributes", ()):
+        if attribute.domain in {'POINT', 'CORNER'}:
+            colors = np.empty(len(attribute.data) * 4, dtype=np.float32)
+            attribute.data.foreach_get("color", colors)
+            data["colors"][attribute.name] = (attribute.domain, attribute.data_type, colors.reshape(-1, 4))
+    for attribute in generic_attributes(mesh):
+        prop, width, dtype = ATTRIBUTE_VALUES[attribute.data_type]
+        values = np.empty(len(attribute.data) * width, dtype=dtype)
+        attribute.data.foreach_get(prop, values)
+        data["attributes"][attribute.name] = (attribute.domain, attribute.data_type, values.reshape(len(attribute.data), width))
+
+    edge_rna = bpy.types.MeshEdge.bl_rna.properties
+    for prop in EDGE_FLAGS:
+        if prop in edge_rna:
+            values = np.empty(len(mesh.edges), dtype=bool if edge_rna[prop].type == 'BOOLEAN' else np.float32)
+            mesh.edges.foreach_get(prop, values)
+            if values.any():
+                data["edge_properties"][prop] = values
+    if data["edge_properties"] or any(domain == 'EDGE' for domain, _type, _values in data["attributes"].values()):
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        data["edges"] = edges.reshape(-1, 2)
+    return data
+
+def write_mesh_arrays(mesh, data, cleaned, vertex_map, vertex_slice, loop_slice, face_slice):
+    vertex_source = cleaned["vertex_source"][vertex_slice]
+    loop_source = cleaned["loop_source"][loop_slice]
+    face_source = cleaned["face_source"][face_slice]
+    face_sizes = cleaned["face_sizes"][face_slice].astype(np.int32)
+    active_uv = mesh.uv_layers.active.name if mesh.uv_layers.active else None
+
+    mesh.clear_geometry()
+    mesh.vertices.add(len(vertex_source))
+    mesh.vertices.foreach_set("co", cleaned["positions"][vertex_slice].astype(np.float32).ravel())
+    mesh.loops.add(len(loop_source))
+    mesh.loops.foreach_set("vertex_index", cleaned["loop_vertices"][loop_slice].astype(np.int32))
+    mesh.polygons.add(len(face_source))
+    loop_starts = np.zeros(len(face_sizes), dtype=np.int32)
+    np.cumsum(face_sizes[:-1], out=loop_starts[1:])
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", face_sizes)
+    mesh.polygons.foreach_set("material_index", data["material_index"][face_source])
+    mesh.polygons.foreach_set("use_smooth", data["use_smooth"][face_source])
+    mesh.update(calc_edges=True)
+
+    if data["weights"] is not None and len(data["weights"][0]):
+        vertices, groups, weights = data["weights"]
+        new_index = np.full(len(data["positions"]), -1, dtype=np.int64)
+        new_index[vertex_source] = np.arange(len(vertex_source))
+        # Welded vertices take the weights of the vertex they were merged into
+        kept = new_index[vertices] >= 0
+        write_deform_weights(mesh, new_index[vertices[kept]], groups[kept], weights[kept])
+
+    edge_source = None
+    if data["edges"] is not None:
+        new_edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", new_edges)
+        edge_source = remap_edges(data["edges"], vertex_map, new_edges.reshape(-1, 2), len(vertex_source))
+        for prop, values in data["edge_properties"].items():
+            mesh.edges.foreach_set(prop, np.where(edge_source >= 0, values[edge_source], 0).astype(values.dtype))
+
+    sources = {'POINT': vertex_source, 'EDGE': edge_source, 'CORNER': loop_source, 'FACE': face_source}
+    for name, (domain, data_type, values) in data["attributes"].items():
+        attribute = mesh.attributes.get(name) or mesh.attributes.new(name, data_type, domain)
+        source = sources[domain]
+        carried = values[source]
+        if domain == 'EDGE':
+            carried[source < 0] = 0
+        attribute.data.foreach_set(ATTRIBUTE_VALUES[data_type][0], carried.ravel())
+
+    for name, uvs in data["uvs"].items():
+        uv_layer = mesh.uv_layers.get(name) or mesh.uv_layers.new(name=name)
+        uv_layer.data.foreach_set("uv", uvs[loop_source].ravel())
+    if active_uv and active_uv in mesh.uv_layers:
+        mesh.uv_layers.active = mesh.uv_layers[active_uv]
+    for name, (domain, data_type, colors) in data["colors"].items():
+        attribute = mesh.color_attributes.get(name) or mesh.color_attributes.new(name, data_type, domain)
+        source = vertex_source if domain == 'POINT' else loop_source
+        attribute.data.foreach_set("color", colors[source].ravel())
+    if data["normals"] is not None:
+        if hasattr(mesh, "use_auto_smooth"):
+            mesh.use_auto_smooth = True
+        mesh.normals_split_custom_set(data["normals"][loop_source])
+    mesh.validate(clean_customdata=False)
+
+def recalc_winding(mesh):
+    """
+    Make the faces of each connected part wind the same way, pointing outwards.
+
+    :return: Number of faces that were flipped
+    """
+    before = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", before)
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    mesh.update()
+    after = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", after)
+    return int(np.count_nonzero(np.einsum('ij,ij->i', before.reshape(-1, 3), after.reshape(-1, 3)) < 0))
+
+def optimize_meshes(meshes, merge_distance=1e-5, recalc_normals=True):
+    """
+    Clean up imported meshes in one vectorized pass: merge by distance, remove collapsed and
+    zero-area faces and loose geometry, then recompute consistent face winding.
+
+    UVs, colors, custom normals, vertex group weights, edge flags and generic attributes are
+    carried over. Meshes without faces (point clouds, curves converted to edges), meshes with
+    shape keys and meshes with attributes of types that cannot be copied are left untouched.
+
+    :param meshes: Mesh datablocks
+    :param merge_distance: Vertices closer than this are merged
+    :param recalc_normals: Recompute the face winding
+    :return: Dict with the numbers of "meshes" processed, "vertices" and "faces" removed and "flipped" faces
+    """
+    meshes = [mesh for mesh in dict.fromkeys(meshes) if can_clean(mesh)]
+    stats = {"meshes": len(meshes), "vertices": 0, "faces": 0, "flipped": 0}
+    if not meshes:
+        return stats
+
+    # Weights live on the mesh but only mean something to objects with vertex groups
+    weighted = {obj.data for obj in bpy.data.objects if obj.type == 'MESH' and obj.vertex_groups}
+    arrays = [read_mesh_arrays(mesh, mesh in weighted) for mesh in meshes]
+    vertex_counts = [len(data["positions"]) for data in arrays]
+    face_counts = [len(data["face_sizes"]) for data in arrays]
+    vertex_offsets = np.concatenate(([0], np.cumsum(vertex_counts)[:-1])).astype(np.int64)
+    loop_vertices = np.concatenate([data["loop_vertices"].astype(np.int64) + offset
+                                    for data, offset in zip(arrays, vertex_offsets)])
+    cleaned = clean_mesh_arrays(
+        np.concatenate([data["positions"] for data in arrays]),
+        loop_vertices,
+        np.concatenate([data["face_sizes"] for data in arrays]),
+        vertex_counts, face_counts, merge_distance
+    )
+
+    # Sources are global indices; each mesh reads its data with indices local to it
+    loop_offsets = np.concatenate(([0], np.cumsum([len(data["loop_vertices"]) for data in arrays])[:-1]))
+    face_offsets = np.concatenate(([0], np.cumsum(face_counts)[:-1]))
+    bounds = {}
+    for key, counts in (("vertex", "vertex_counts"), ("loop", "loop_counts"), ("face", "face_counts")):
+        ends = np.cumsum(cleaned[counts])
+        bounds[key] = [slice(end - count, end) for end, count in zip(ends, cleaned[counts])]
+    cleaned["vertex_source"] = cleaned["vertex_source"] - np.repeat(vertex_offsets, cleaned["vertex_counts"])
+    cleaned["loop_source"] = cleaned["loop_source"] - np.repeat(loop_offsets, cleaned["loop_counts"])
+    cleaned["face_source"] = cleaned["face_source"] - np.repeat(face_offsets, cleaned["face_counts"])
+
+    for index, (mesh, data) in enumerate(zip(meshes, arrays)):
+        removed_vertices = vertex_counts[index] - int(cleaned["vertex_counts"][index])
+        removed_faces = face_counts[index] - int(cleaned["face_counts"][index])
+        if removed_vertices or removed_faces:
+            vertex_map = cleaned["vertex_map"][vertex_offsets[index]:vertex_offsets[index] + vertex_counts[index]]
+            vertex_map = np.where(vertex_map >= 0, vertex_map - bounds["vertex"][index].start, -1)
+            write_mesh_arrays(mesh, data, cleaned, vertex_map,
+                              bounds["vertex"][index], bounds["loop"][index], bounds["face"][index])
+        stats["vertices"] += removed_vertices
+        stats["faces"] += removed_faces
+        if recalc_normals:
+            stats["flipped"] += recalc_winding(mesh)
+
+    log_message(f"{stats['meshes']} meshes: {stats['vertices']} vertices and {stats['faces']} faces removed, "
+                f"{stats['flipped']} faces flipped")
+    return stats
+
+def cleanup_summary(stats):
+    if not stats or not (stats["vertices"] or stats["faces"] or stats["flipped"]):
+        return ""
+    return f"{stats['vertices']} vertices and {stats['faces']} faces removed, {stats['flipped']} faces flipped"
+
+class OptimizeMeshes(Operator):
+    """Merge by distance, remove degenerate and loose geometry and fix the face winding of the selected meshes"""
+    bl_idname = "epictoolbag.optimize_meshes"
+    bl_label = "Clean Up Meshes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    merge_distance: FloatProperty(
+        name="Merge Distance",
+        default=1e-5,
+        min=0.0,
+        soft_max=0.01,
+        precision=6,
+        subtype='DISTANCE'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and any(obj.type == 'MESH' for obj in context.selected_objects)
+
+    def execute(self, context):
+        meshes = [obj.data for obj in context.selected_objects if obj.type == 'MESH']
+        stats = optimize_meshes(meshes, max(self.merge_distance, 1e-9))
+        self.report({'INFO'}, f"Cleaned {stats['meshes']} meshes: {cleanup_summary(stats) or 'nothing to remove'}.")
+        return {'FINISHED'}
+
+classes = [
+    OptimizeMeshes,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,843 @@
+'''
+    Epic Toolbag mesh file readers.
+
+    Pure NumPy parsers for STL, OBJ and PLY files, with no dependency on bpy, so they can run
+    both inside Blender and in separate worker processes started with Blender's Python:
+
+        python mesh_readers.py input.stl output.npz [voxel size]
+
+    The add-on builds the datablocks from the parsed arrays on the main thread.
+'''
+
+import os
+import sys
+import mmap
+import time
+import subprocess
+import numpy as np
+
+STL_BINARY_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attributes', '<u2'),
+])
+
+def read_stl_triangles(filepath, chunk_size=16 * 1024 * 1024):
+    """
+    Read the triangles of a binary or ASCII STL file.
+
+    :param filepath: Path to the STL file
+    :param chunk_size: Bytes tokenized at a time for ASCII files
+    :return: float32 array of shape (triangles, 3, 3)
+    """
+    file_size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as f:
+        header = f.read(84)
+        if len(header) == 84:
+            count = int(np.frombuffer(header, dtype='<u4', count=1, offset=80)[0])
+            if file_size == 84 + count * STL_BINARY_DTYPE.itemsize:
+                if count == 0:
+                    return np.empty((0, 3, 3), dtype=np.float32)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    records = np.frombuffer(mapped, dtype=STL_BINARY_DTYPE, count=count, offset=84)
+                    # Copy out and drop the view, or the map can't close
+                    triangles = records['vertices'].copy()
+                    del records
+                    return triangles
+
+        # ASCII: only the three numbers after each "vertex" keyword matter
+        f.seek(0)
+        chunks = []
+        remainder = b""
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            data = remainder + data
+            cut = data.rfind(b"\n") + 1
+            remainder, data = data[cut:], data[:cut]
+            chunks.append(ascii_stl_vertices(data))
+        chunks.append(ascii_stl_vertices(remainder))
+
+    vertices = np.concatenate(chunks) if chunks else np.empty((0, 3), dtype=np.float32)
+    return vertices[:len(vertices) // 3 * 3].reshape(-1, 3, 3)
+
+def ascii_stl_vertices(data):
+    tokens = np.array(data.split())
+    if not len(tokens):
+        return np.empty((0, 3), dtype=np.float32)
+    starts = np.flatnonzero(tokens == b"vertex")
+    starts = starts[starts + 3 < len(tokens)]
+    return tokens[starts[:, None] + np.arange(1, 4)].astype(np.float32)
+
+def weld_vertices(vertices, tolerance=1e-6):
+    """
+    Merge vertices closer than a tolerance by quantizing their coordinates.
+
+    :param vertices: float32 array of shape (N, 3)
+    :param tolerance: Quantization step
+    :return: (unique vertices (U, 3), index into them for each input vertex (N,))
+    """
+    if not len(vertices):
+        return vertices, np.empty(0, dtype=np.int64)
+    quantized = np.round(vertices / tolerance).astype(np.int64)
+    quantized -= quantized.min(axis=0)
+    extent = quantized.max(axis=0).astype(np.float64) + 1
+    if np.prod(extent) < 2 ** 62:
+        # Pack the three coordinates into one integer: sorting int64 is far faster than rows
+        keys = (quantized[:, 0] * int(extent[1]) + quantized[:, 1]) * int(extent[2]) + quantized[:, 2]
+    else:
+        quantized = np.ascontiguousarray(quantized)
+        keys = quantized.view(np.dtype((np.void, quantized.dtype.itemsize * 3))).ravel()
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    is_first = np.empty(len(keys), dtype=bool)
+    is_first[0] = True
+    is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    inverse = np.empty(len(keys), dtype=np.int64)
+    inverse[order] = np.cumsum(is_first) - 1
+    return vertices[order[is_first]], inverse
+
+def read_stl(filepath, weld_tolerance=1e-6):
+    """
+    Read an STL file into welded vertices and triangle indices.
+
+    :return: (vertices (V, 3) float32, faces (F, 3) int32)
+    """
+    triangles = read_stl_triangles(filepath)
+    vertices, inverse = weld_vertices(triangles.reshape(-1, 3), weld_tolerance)
+    faces = inverse.reshape(-1, 3).astype(np.int32)
+    # Triangles collapsed by welding are not valid polygons
+    faces = faces[(faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])]
+    return vertices, faces
+
+class GrowableArray:
+    """Append-only NumPy buffer that doubles its capacity when full."""
+
+    def __init__(self, dtype, width=1, capacity=1024):
+        self.width = width
+        self.size = 0
+        shape = (capacity, width) if width > 1 else (capacity,)
+        self.data = np.empty(shape, dtype=dtype)
+
+    def extend(self, values):
+        count = len(values)
+        if self.size + count > len(self.data):
+            capacity = len(self.data)
+            while capacity < self.size + count:
+                capacity *= 2
+            grown = np.empty((capacity,) + self.data.shape[1:], dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:self.size + count] = values
+        self.size += count
+
+    @property
+    def array(self):
+        return self.data[:self.size]
+
+# Any whitespace between OBJ fields ("v\t1 2 3") becomes a plain space
+OBJ_WHITESPACE = bytes.maketrans(b"\t\r\v\f", b"    ")
+
+def join_obj_lines(lines):
+    """Join stripped OBJ lines of one keyword into a single space separated string without the keywords."""
+    keyword = lines[0].split(None, 1)[0] + b" "
+    return b" ".join(lines).translate(OBJ_WHITESPACE).replace(keyword, b" ")
+
+def parse_obj_floats(lines, width):
+    """Parse stripped "v x y z ..." style lines into an (N, width) array, ignoring extra components."""
+    values = np.fromstring(join_obj_lines(lines).decode('ascii', 'replace'), dtype=np.float32, sep=" ")
+    if len(values) == len(lines) * width:
+        return values.reshape(-1, width)
+    rows = [line.split()[1:width + 1] for line in lines]
+    return np.array([row + [b"0"] * (width - len(row)) for row in rows], dtype=np.float32)
+
+def parse_obj_faces(lines):
+    """
+    Parse stripped "f v/vt/vn ..." lines.
+
+    :return: (face sizes (F,), indices (L, 3) with 0 for missing vt/vn)
+    """
+    joined = join_obj_lines(lines).replace(b"//", b"/0/")
+    fields = lines[0].split()[1].count(b"/") + 1
+    values = np.fromstring(joined.replace(b"/", b" ").decode('ascii', 'replace'), dtype=np.int64, sep=" ")
+
+    if len(values) == len(lines) * 3 * fields:
+        # All triangles, the common case
+        sizes = np.full(len(lines), 3, dtype=np.int32)
+    else:
+        sizes = np.array([len(line.split()) - 1 for line in lines], dtype=np.int32)
+    if len(values) != sizes.sum() * fields:
+        # Mixed corner formats ("1/2" next to "3//4"): split every corner
+        fields = 3
+        corners = joined.split()
+        values = np.array([(corner.split(b"/") + [b"0", b"0"])[:3] for corner in corners], dtype=np.int64)
+    values = values.reshape(-1, fields)
+
+    indices = np.zeros((len(values), 3), dtype=np.int64)
+    indices[:, :min(fields, 3)] = values[:, :3]
+    return sizes, indices
+
+def parse_mtl(filepath):
+    """
+    Read the materials of an MTL file.
+
+    :return: Dict of material name -> {"Kd": (r, g, b), "d": alpha, "map_Kd": texture path, ...}
+    """
+    materials = {}
+    current = None
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                parts = line.strip().split(None, 1)
+                if len(parts) < 2:
+                    continue
+                key, value = parts
+                if key == "newmtl":
+                    current = materials.setdefault(value.strip(), {})
+                elif current is None:
+                    continue
+                elif key in {"Kd", "Ks", "Ke"}:
+                    current[key] = tuple(float(component) for component in value.split()[:3])
+                elif key in {"d", "Ns"}:
+                    current[key] = float(value.split()[0])
+                elif key == "Tr":
+                    current["d"] = 1.0 - float(value.split()[0])
+                elif key in {"map_Kd", "map_Bump", "bump", "norm"}:
+                    # Texture options ("-bm 1 file.png") come before the file name
+                    current[key] = value.split()[-1]
+    except OSError as e:
+        print(f"Epic Toolbag - Failed to read MTL {filepath}: {e}")
+    return materials
+
+def iter_line_blocks(f, block_size):
+    """Read a binary file in blocks that always end on a line break."""
+    remainder = b""
+    while True:
+        data = f.read(block_size)
+        if not data:
+            if remainder:
+                yield remainder
+            return
+        data = remainder + data
+        cut = data.rfind(b"\n") + 1
+        remainder, data = data[cut:], data[:cut]
+        if data:
+            yield data
+
+def read_obj(filepath, block_size=32 * 1024 * 1024):
+    """
+    Stream an OBJ file in large blocks into flat NumPy arrays.
+
+    :param filepath: Path to the OBJ file
+    :param block_size: Bytes parsed at a time
+    :return: Dict with positions, uvs, normals, face_sizes, face_indices (L, 3: v, vt, vn; 0-based, -1 missing),
+             face_materials, face_objects, material_names, object_names and mtllibs
+    """
+    positions = GrowableArray(np.float32, 3)
+    uvs = GrowableArray(np.float32, 2)
+    normals = GrowableArray(np.float32, 3)
+    face_sizes = GrowableArray(np.int32)
+    face_indices = GrowableArray(np.int64, 3)
+    face_materials = GrowableArray(np.int32)
+    face_objects = GrowableArray(np.int32)
+
+    material_names = []
+    object_names = [os.path.splitext(os.path.basename(filepath))[0]]
+    mtllibs = []
+    current_material = -1
+    current_object = 0
+    object_first_face = 0
+
+    with open(filepath, 'rb') as f:
+        for data in iter_line_blocks(f, block_size):
+            # Object array: selecting lines never pads them to the longest one
+            lines = np.array([line.strip() for line in data.split(b"\n")], dtype=object)
+            # Lines are told apart by their first token: keywords may be indented or followed by a tab
+            heads = np.array([line.split(None, 1)[0] if line else b"" for line in lines], dtype='S7')
+            counts_before = (positions.size, uvs.size, normals.size)
+
+            is_v = heads == b"v"
+            is_vt = heads == b"vt"
+            is_vn = heads == b"vn"
+            if is_v.any():
+                positions.extend(parse_obj_floats(lines[is_v].tolist(), 3))
+            if is_vt.any():
+                uvs.extend(parse_obj_floats(lines[is_vt].tolist(), 2))
+            if is_vn.any():
+                normals.extend(parse_obj_floats(lines[is_vn].tolist(), 3))
+
+            face_lines = np.flatnonzero(heads == b"f")
+            block_materials = np.full(len(face_lines), current_material, dtype=np.int32)
+            block_objects = np.full(len(face_lines), current_object, dtype=np.int32)
+
+            # State changes are rare: walk only those lines
+            state_lines = np.flatnonzero((heads == b"o") | (heads == b"usemtl") | (heads == b"mtllib"))
+            for line_index in state_lines:
+                keyword, value = (lines[line_index].decode('utf-8', 'replace').split(None, 1) + [""])[:2]
+                value = value.strip()
+                later = face_lines > line_index
+                if keyword == "usemtl":
+                    if value not in material_names:
+                        material_names.append(value)
+                    current_material = material_names.index(value)
+                    block_materials[later] = current_material
+                elif keyword == "o":
+                    faces_so_far = face_sizes.size + int(np.count_nonzero(face_lines < line_index))
+                    if faces_so_far > object_first_face:
+                        object_names.append(value)
+                        current_object = len(object_names) - 1
+                    else:
+                        # No faces yet: name the current object instead of leaving an empty one
+                        object_names[current_object] = value
+                    object_first_face = faces_so_far
+                    block_objects[later] = current_object
+                elif keyword == "mtllib":
+                    mtllibs.append(value)
+
+            if len(face_lines):
+                sizes, indices = parse_obj_faces(lines[face_lines].tolist())
+                if np.any(indices < 0):
+                    # Negative indices count back from the elements defined so far
+                    corner_lines = np.repeat(face_lines, sizes)
+                    for column, mask in enumerate((is_v, is_vt, is_vn)):
+                        defined = counts_before[column] + np.cumsum(mask)[corner_lines]
+                        negative = indices[:, column] < 0
+                        indices[negative, column] += defined[negative] + 1
+                face_sizes.extend(sizes)
+                face_indices.extend(indices - 1)
+                face_materials.extend(block_materials)
+                face_objects.extend(block_objects)
+
+    return {
+        "positions": positions.array,
+        "uvs": uvs.array,
+        "normals": normals.array,
+        "face_sizes": face_sizes.array,
+        "face_indices": face_indices.array,
+        "face_materials": face_materials.array,
+        "face_objects": face_objects.array,
+        "material_names": material_names,
+        "object_names": object_names,
+        "mtllibs": mtllibs,
+    }
+
+MESH_READERS_SCRIPT = os.path.abspath(__file__)
+
+# Extensions read_mesh_file understands
+PARSED_EXTENSIONS = {'.stl', '.obj', '.ply'}
+
+PLY_TYPES = {
+    'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8',
+}
+
+def read_ply_header(f):
+    """
+    Parse the header of a PLY file.
+
+    :param f: File opened in binary mode, positioned at the start
+    :return: (format, elements, body offset); elements are dicts with "name", "count" and
+             "properties", a list of (name, type) or (name, (count type, item type)) for lists
+    """
+    if f.readline().strip() != b"ply":
+        raise ValueError("Not a PLY file")
+    file_format = None
+    elements = []
+    while True:
+        line = f.readline()
+        if not line:
+            raise ValueError("PLY header has no end_header")
+        words = line.decode('ascii', errors='replace').split()
+        if not words or words[0] in {"comment", "obj_info"}:
+            continue
+        if words[0] == "format":
+            file_format = words[1]
+        elif words[0] == "element":
+            elements.append({"name": words[1], "count": int(words[2]), "properties": []})
+        elif words[0] == "property":
+            if words[1] == "list":
+                elements[-1]["properties"].append((words[4], (PLY_TYPES[words[2]], PLY_TYPES[words[3]])))
+            else:
+                elements[-1]["properties"].append((words[2], PLY_TYPES[words[1]]))
+        elif words[0] == "end_header":
+            break
+    if file_format not in {"ascii", "binary_little_endian", "binary_big_endian"}:
+        raise ValueError(f"Unsupported PLY format: {file_format}")
+    return file_format, elements, f.tell()
+
+def read_ply_list_element(buffer, offset, element, byte_order):
+    """
+    Read a binary element with list properties (faces), taking the fixed-size fast path when
+    every list has the same length.
+
+    :return: (dict of property name -> (flat values, lengths) for lists or values for scalars, end offset)
+    """
+    count = element["count"]
+    properties = element["properties"]
+    if len(properties) == 1 and isinstance(properties[0][1], tuple) and count:
+        name, (count_type, item_type) = properties[0]
+        first = int(np.frombuffer(buffer, dtype=byte_order + count_type, count=1, offset=offset)[0])
+        fixed = np.dtype([('n', byte_order + count_type), ('items', byte_order + item_type, (first,))])
+        if offset + count * fixed.itemsize <= len(buffer):
+            records = np.frombuffer(buffer, dtype=fixed, count=count, offset=offset)
+            if np.all(records['n'] == first):
+                lengths = np.full(count, first, dtype=np.int32)
+                return {name: (records['items'].reshape(-1).copy(), lengths)}, offset + count * fixed.itemsize
+
+    # Mixed list lengths: find the record starts with vectorized passes, a window at a time
+    values = {name: ([], []) if isinstance(kind, tuple) else [] for name, kind in properties}
+    found = 0
+    while found < count:
+        starts, next_offset = ply_record_starts(buffer, offset, properties, byte_order, count - found)
+        read_ply_records(buffer, starts, properties, byte_order, values)
+        found += len(starts)
+        offset = next_offset
+    result = {}
+    for name, kind in properties:
+        if isinstance(kind, tuple):
+            items, lengths = values[name]
+            result[name] = (np.concatenate(items) if items else np.empty(0, dtype=kind[1]),
+                            np.concatenate(lengths).astype(np.int32) if lengths else np.empty(0, dtype=np.int32))
+        else:
+            result[name] = np.concatenate(values[name]) if values[name] else np.empty(0, dtype=kind)
+    return result, offset
+
+# Records reached per jump when following the record chain of a PLY element (a power of two)
+PLY_JUMP_STRIDE = 32
+
+def read_ply_uints(buffer, positions, size, byte_order):
+    """Unsigned integers of size bytes at arbitrary byte positions (clamped to the buffer)."""
+    value = np.zeros(len(positions), dtype=np.int64)
+    last = len(buffer) - 1
+    for index in range(size):
+        shift = 8 * (index if byte_order == '<' else size - 1 - index)
+        value |= buffer[np.minimum(positions + index, last)].astype(np.int64) << shift
+    return value
+
+def read_ply_values(buffer, positions, dtype):
+    """Values of a binary dtype stored at arbitrary byte positions."""
+    if not len(positions):
+        return np.empty(0, dtype=dtype)
+    gathered = buffer[positions[:, None] + np.arange(dtype.itemsize)]
+    return np.ascontiguousarray(gathered).view(dtype).ravel()
+
+def ply_record_ends(buffer, positions, properties, byte_order):
+    """End offset of a record for every candidate start position."""
+    positions = positions.copy()
+    for _name, kind in properties:
+        if isinstance(kind, tuple):
+            count_size, item_size = np.dtype(kind[0]).itemsize, np.dtype(kind[1]).itemsize
+            positions += count_size + read_ply_uints(buffer, positions, count_size, byte_order) * item_size
+        else:
+            positions += np.dtype(kind).itemsize
+    return positions
+
+def ply_record_starts(buffer, offset, properties, byte_order, limit, window=1 << 22):
+    """
+    Find the start offsets of consecutive records whose lists vary in length.
+
+    Where a record starts depends on the lengths of all records before it. Instead of
+    walking them, the end of a record starting at every byte of a window is computed in one
+    pass; squaring that jump table PLY_JUMP_STRIDE times over gives every PLY_JUMP_STRIDE-th
+    start with a short chain walk, and the starts in between are filled in by vectorized steps.
+
+    :param offset: Start of the first record
+    :param limit: Number of records left in the element
+    :return: (record starts in this window, offset of the record after them)
+    """
+    window_end = min(offset + window, len(buffer))
+    size = window_end - offset
+    ends = ply_record_ends(buffer, np.arange(offset, window_end, dtype=np.int64), properties, byte_order)
+    # Jumps relative to the window; records ending outside it all lead to the sentinel (size)
+    jump = np.append(np.where(ends < window_end, ends - offset, size), size).astype(np.int32)
+
+    stride_jump = jump
+    for _step in range(PLY_JUMP_STRIDE.bit_length() - 1):
+        stride_jump = np.take(stride_jump, stride_jump)
+
+    checkpoints = [0]
+    while stride_jump[checkpoints[-1]] != size and len(checkpoints) * PLY_JUMP_STRIDE < limit:
+        checkpoints.append(int(stride_jump[checkpoints[-1]]))
+    rows = [np.array(checkpoints, dtype=np.int64)]
+    for _step in range(PLY_JUMP_STRIDE - 1):
+        rows.append(np.take(jump, rows[-1]))
+    starts = np.stack(rows, axis=1).ravel()
+    starts = starts[starts != size][:limit]
+    next_offset = int(ends[starts[-1]])
+    if next_offset > len(buffer):
+        raise ValueError("PLY file is truncated")
+    return starts + offset, next_offset
+
+def read_ply_records(buffer, starts, properties, byte_order, values):
+    """Read the properties of records at known start offsets, appending to values."""
+    positions = starts.copy()
+    for name, kind in properties:
+        if isinstance(kind, tuple):
+            count_size = np.dtype(kind[0]).itemsize
+            item_dtype = np.dtype(byte_order + kind[1])
+            lengths = read_ply_uints(buffer, positions, count_size, byte_order)
+            first = np.repeat(positions + count_size, lengths)
+            record_offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+            item_positions = first + (np.arange(len(first)) - record_offsets) * item_dtype.itemsize
+            values[name][0].append(read_ply_values(buffer, item_positions, item_dtype).astype(kind[1]))
+            values[name][1].append(lengths)
+            positions = positions + count_size + lengths * item_dtype.itemsize
+        else:
+            scalar_dtype = np.dtype(byte_order + kind)
+            values[name].append(read_ply_values(buffer, positions, scalar_dtype).astype(kind))
+            positions = positions + scalar_dtype.itemsize
+
+def read_ply_elements(filepath):
+    """
+    Read the elements of a PLY file. Binary elements made of scalar properties only (vertices)
+    are memory-mapped as structured arrays without copying; elements with lists are parsed.
+
+    :param filepath: Path to the PLY file
+    :return: Dict of element name -> structured array (scalar elements) or dict of property arrays
+    """
+    with open(filepath, 'rb') as f:
+        file_format, elements, body_offset = read_ply_header(f)
+
+    if file_format == "ascii":
+        return read_ply_ascii(filepath, elements, body_offset)
+
+    byte_order = '<' if file_format == "binary_little_endian" else '>'
+    result = {}
+    offset = body_offset
+    buffer = None
+    for element in elements:
+        if all(not isinstance(kind, tuple) for _name, kind in element["properties"]):
+            dtype = np.dtype([(name, byte_order + kind) for name, kind in element["properties"]])
+            if element["count"]:
+                result[element["name"]] = np.memmap(filepath, dtype=dtype, mode='r', offset=offset,
+                                                    shape=(element["count"],))
+            else:
+                result[element["name"]] = np.empty(0, dtype=dtype)
+            offset += dtype.itemsize * element["count"]
+        else:
+            if buffer is None:
+                buffer = np.memmap(filepath, dtype=np.uint8, mode='r')
+            result[element["name"]], offset = read_ply_list_element(buffer, offset, element, byte_order)
+    return result
+
+def read_ply_ascii(filepath, elements, body_offset):
+    with open(filepath, 'rb') as f:
+        f.seek(body_offset)
+        lines = f.read().split(b"\n")
+    lines = [line for line in lines if line.strip()]
+
+    result = {}
+    start = 0
+    for element in elements:
+        block = lines[start:start + element["count"]]
+        start += element["count"]
+        properties = element["properties"]
+        if all(not isinstance(kind, tuple) for _name, kind in properties):
+            values = np.fromstring(b" ".join(block), dtype=np.float64, sep=" ").reshape(len(block), len(properties))
+            dtype = np.dtype([(name, kind) for name, kind in properties])
+            records = np.empty(len(block), dtype=dtype)
+            for column, (name, _kind) in enumerate(properties):
+                records[name] = values[:, column]
+            result[element["name"]] = records
+        else:
+            values = {name: ([], []) if isinstance(kind, tuple) else [] for name, kind in properties}
+            for line in block:
+                numbers = np.fromstring(line, dtype=np.float64, sep=" ")
+                position = 0
+                for name, kind in properties:
+                    if isinstance(kind, tuple):
+                        length = int(numbers[position])
+                        values[name][0].append(numbers[position + 1:position + 1 + length])
+                        values[name][1].append(length)
+                        position += 1 + length
+                    else:
+                        values[name].append(numbers[position])
+                        position += 1
+            parsed = {}
+            for name, kind in properties:
+                if isinstance(kind, tuple):
+                    items, lengths = values[name]
+                    parsed[name] = (np.concatenate(items).astype(kind[1]) if items else np.empty(0, dtype=kind[1]),
+                                    np.array(lengths, dtype=np.int32))
+                else:
+                    parsed[name] = np.array(values[name], dtype=kind)
+            result[element["name"]] = parsed
+    return result
+
+def ply_columns(records, names, chunk_size):
+    """Stack structured fields into a float32 (N, len(names)) array, reading the map in chunks."""
+    output = np.empty((len(records), len(names)), dtype=np.float32)
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start:start + chunk_size]
+        for column, name in enumerate(names):
+            output[start:start + len(chunk), column] = chunk[name]
+    return output
+
+def voxel_downsample(records, voxel_size, position_names=("x", "y", "z"), color_names=(), color_scale=1.0,
+                     chunk_size=4 * 1024 * 1024):
+    """
+    Replace the points of each cell of a regular grid by their centroid (and mean color).
+    The structured (possibly memory-mapped) records are reduced chunk by chunk, so memory
+    follows the output size, not the input.
+
+    :param records: Structured array of points
+    :param voxel_size: Edge length of the grid cells
+    :param position_names: Fields holding x, y and z
+    :param color_names: Fields holding the color channels, if any
+    :param color_scale: Factor converting the color fields to 0-1
+    :return: (positions (M, 3) float32, colors (M, len(color_names)) float32)
+    """
+    if not len(records):
+        return np.empty((0, 3), dtype=np.float32), np.empty((0, len(color_names)), dtype=np.float32)
+    low = np.floor(np.array([records[name].min() for name in position_names], dtype=np.float64) / voxel_size)
+    high = np.floor(np.array([records[name].max() for name in position_names], dtype=np.float64) / voxel_size)
+    extent = (high - low + 1).astype(np.int64)
+    if np.prod(extent.astype(np.float64)) >= 2 ** 62:
+        raise ValueError("Voxel size too small for the extent of the point cloud")
+
+    names = tuple(position_names) + tuple(color_names)
+    keys_parts = []
+    sums_parts = []
+    counts_parts = []
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start:start + chunk_size]
+        values = np.column_stack([chunk[name].astype(np.float64) for name in names])
+        cells = (np.floor(values[:, :3] / voxel_size) - low).astype(np.int64)
+        keys = (cells[:, 0] * extent[1] + cells[:, 1]) * extent[2] + cells[:, 2]
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        inverse = inverse.ravel()
+        keys_parts.append(unique_keys)
+        sums_parts.append(np.column_stack([np.bincount(inverse, weights=values[:, column], minlength=len(unique_keys))
+                                          for column in range(len(names))]))
+        counts_parts.append(np.bincount(inverse, minlength=len(unique_keys)))
+
+    # Cells split across chunks are merged in a second reduction
+    unique_keys, inverse = np.unique(np.concatenate(keys_parts), return_inverse=True)
+    inverse = inverse.ravel()
+    sums = np.concatenate(sums_parts)
+    counts = np.bincount(inverse, weights=np.concatenate(counts_parts), minlength=len(unique_keys))
+    means = np.column_stack([np.bincount(inverse, weights=sums[:, column], minlength=len(unique_keys))
+                             for column in range(len(names))]) / counts[:, None]
+    return means[:, :3].astype(np.float32), (means[:, 3:] * color_scale).astype(np.float32)
+
+def read_ply(filepath, voxel_size=0.0, chunk_size=4 * 1024 * 1024):
+    """
+    Read a PLY mesh or point cloud.
+
+    :param filepath: Path to the PLY file
+    :param voxel_size: Downsample point clouds (files without faces) to one point per voxel; 0 keeps all points
+    :return: Dict with "positions" (V, 3) float32, "faces" flat vertex indices and "face_sizes",
+             "colors" (V, 4) float32, "normals" (V, 3) and "uvs" (V, 2); missing data is empty
+    """
+    elements = read_ply_elements(filepath)
+    vertices = elements.get("vertex")
+    if vertices is None:
+        raise ValueError("PLY file has no vertex element")
+    names = set(vertices.dtype.names)
+
+    faces = np.empty(0, dtype=np.int32)
+    face_sizes = np.empty(0, dtype=np.int32)
+    face_element = elements.get("face")
+    if face_element is not None:
+        indices = face_element.get("vertex_indices", face_element.get("vertex_index"))
+        if indices is not None:
+            faces, face_sizes = indices
+            faces = faces.astype(np.int32)
+            # Points, lines and faces pointing outside the vertex list are not polygons
+            valid = face_sizes >= 3
+            if len(faces) and (faces.min() < 0 or faces.max() >= len(vertices)):
+                loop_faces = np.repeat(np.arange(len(face_sizes)), face_sizes)
+                bad = np.unique(loop_faces[(faces < 0) | (faces >= len(vertices))])
+                valid[bad] = False
+            if not valid.all():
+                faces = faces[np.repeat(valid, face_sizes)]
+                face_sizes = face_sizes[valid]
+
+    color_names = ()
+    color_scale = 1.0
+    if {"red", "green", "blue"} <= names:
+        color_names = ("red", "green", "blue") + (("alpha",) if "alpha" in names else ())
+        if vertices.dtype["red"].kind in "iu":
+            color_scale = 1.0 / np.iinfo(vertices.dtype["red"]).max
+
+    normals = np.empty((0, 3), dtype=np.float32)
+    uvs = np.empty((0, 2), dtype=np.float32)
+    if voxel_size > 0 and not len(face_sizes):
+        # Normals and UVs have no meaning once points are averaged
+        positions, colors = voxel_downsample(vertices, voxel_size, color_names=color_names,
+                                             color_scale=color_scale, chunk_size=chunk_size)
+    else:
+        positions = ply_columns(vertices, ("x", "y", "z"), chunk_size)
+        colors = ply_columns(vertices, color_names, chunk_size) * color_scale
+        if {"nx", "ny", "nz"} <= names:
+            normals = ply_columns(vertices, ("nx", "ny", "nz"), chunk_size)
+        uv_names = next((pair for pair in (("s", "t"), ("u", "v"), ("texture_u", "texture_v")) if set(pair) <= names), None)
+        if uv_names:
+            uvs = ply_columns(vertices, uv_names, chunk_size)
+    del vertices, elements
+
+    if not color_names:
+        colors = np.empty((0, 4), dtype=np.float32)
+    elif colors.shape[1] == 3:
+        colors = np.hstack((colors, np.ones((len(colors), 1), dtype=np.float32)))
+
+    return {"positions": positions, "faces": faces, "face_sizes": face_sizes,
+            "colors": colors, "normals": normals, "uvs": uvs}
+
+def read_mesh_file(filepath, voxel_size=0.0):
+    """
+    Parse a mesh file into arrays.
+
+    :param filepath: STL, OBJ or PLY file
+    :param voxel_size: Voxel grid size PLY point clouds are downsampled to (0 keeps every point)
+    :return: Dict of arrays, with "format" set to the lowercase extension without the dot
+    """
+    file_ext = os.path.splitext(filepath)[1].lower()
+    if file_ext == '.stl':
+        vertices, faces = read_stl(filepath)
+        return {"format": "stl", "positions": vertices, "faces": faces}
+    if file_ext == '.obj':
+        data = read_obj(filepath)
+        data["format"] = "obj"
+        return data
+    if file_ext == '.ply':
+        data = read_ply(filepath, voxel_size)
+        data["format"] = "ply"
+        return data
+    raise ValueError(f"Unsupported mesh file: {filepath}")
+
+def save_parsed(data, filepath):
+    """Write the result of read_mesh_file to an uncompressed .npz file."""
+    arrays = {key: (np.array(value, dtype=str) if isinstance(value, (list, str)) else value)
+              for key, value in data.items()}
+    with open(filepath, 'wb') as f:
+        np.savez(f, **arrays)
+
+def load_parsed(filepath):
+    """Read an .npz file written by save_parsed back into a read_mesh_file dict."""
+    data = {}
+    with np.load(filepath, allow_pickle=False) as archive:
+        for key in archive.files:
+            value = archive[key]
+            if value.dtype.kind == 'U':
+                value = value.tolist()
+            data[key] = value
+    return data
+
+def can_parse_in_subprocess():
+    # Blender 2.92+ points sys.executable at its bundled Python; older versions at Blender itself
+    return os.path.basename(sys.executable).lower().startswith("python")
+
+class ParsePool:
+    """
+    Parse mesh files in separate Python processes, at most max_workers at a time.
+
+    Files are pulled from the source iterator only when a worker is free, and each finished
+    result is handed back before more are loaded, so memory holds one parsed mesh on the
+    main side and at most max_workers .npz results on disk. With max_workers=0 the files are
+    parsed in the current process, and so is any file a worker fails on.
+    """
+
+    def __init__(self, work_dir, max_workers=None, voxel_size=0.0):
+        self.work_dir = work_dir
+        self.voxel_size = voxel_size
+        if max_workers is None:
+            # Leave a core for Blender; with fewer than two workers the process overhead isn't worth it
+            max_workers = (os.cpu_count() or 1) - 1
+            if max_workers < 2:
+                max_workers = 0
+        self.max_workers = max_workers if can_parse_in_subprocess() else 0
+        self.started = 0
+
+    def run(self, items, idle=False):
+        """
+        Parse files as they come.
+
+        :param items: Iterable of (key, filepath)
+        :param idle: Yield (None, None, None, None) instead of sleeping while every worker is busy,
+                     so a modal caller can return to the event loop
+        :return: Generator of (key, filepath, parsed dict or None, error message or None), in completion order
+        """
+        items = iter(items)
+        if self.max_workers:
+            yield from self.run_workers(items, idle)
+        # Without workers, or once they turned out not to work, the rest is parsed here
+        for key, filepath in items:
+            yield self.parse_here(key, filepath)
+
+    def parse_here(self, key, filepath):
+        try:
+            return key, filepath, read_mesh_file(filepath, self.voxel_size), None
+        except Exception as e:
+            return key, filepath, None, str(e)
+
+    def run_workers(self, items, idle):
+        running = []
+        exhausted = False
+        try:
+            while running or (not exhausted and self.max_workers):
+                while not exhausted and len(running) < self.max_workers:
+                    try:
+                        key, filepath = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    self.started += 1
+                    output = os.path.join(self.work_dir, f"parsed_{self.started}.npz")
+                    # stderr goes to a file: a full pipe would block the worker
+                    with open(output + ".log", 'w') as log:
+                        process = subprocess.Popen(
+                            [sys.executable, MESH_READERS_SCRIPT, filepath, output, repr(self.voxel_size)],
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=log
+                        )
+                    running.append((process, key, filepath, output))
+
+                finished = [job for job in running if job[0].poll() is not None]
+                if not finished:
+                    if idle:
+                        yield None, None, None, None
+                    else:
+                        time.sleep(0.005)
+                    continue
+                for job in finished:
+                    running.remove(job)
+                    process, key, filepath, output = job
+                    with open(output + ".log", 'r', errors='replace') as log:
+                        error = log.read().strip()
+                    os.remove(output + ".log")
+                    if process.returncode == 0 and os.path.exists(output):
+                        try:
+                            data = load_parsed(output)
+                        finally:
+                            os.remove(output)
+                        yield key, filepath, data, None
+                        continue
+                    # A worker that cannot run the script at all (e.g. a system Python without NumPy)
+                    # fails on every file: parse this one here, and if that works start no more workers
+                    result = self.parse_here(key, filepath)
+                    if result[3] is None:
+                        error = error.splitlines()[-1] if error else f"Exit code {process.returncode}"
+                        print(f"Epic Toolbag - Parse worker failed ({error}), parsing in Blender instead")
+                        self.max_workers = 0
+                    yield result
+        finally:
+            for process, _key, _filepath, output in running:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                for path in (output, output + ".log"):
+                    if os.path.exists(path):
+                        os.remove(path)
+
+def main():
+    if len(sys.argv) not in {3, 4}:
+        print("Usage: mesh_readers.py INPUT OUTPUT.npz [VOXEL_SIZE]", file=sys.stderr)
+        sys.exit(2)
+    voxel_size = float(sys.argv[3]) if len(sys.argv) == 4 else 0.0
+    save_parsed(read_mesh_file(sys.argv[1], voxel_size), sys.argv[2])
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,12 @@ import bpy
 import json
 import os
 import math
+import time
 from bpy.utils import previews
 from bpy.types import AddonPreferences, Panel, Scene, WindowManager
-from bpy.props import EnumProperty, BoolProperty, StringProperty, FloatProperty, IntProperty, FloatVectorProperty
+from bpy.app.handlers import persistent
+from bpy.props import EnumProperty, BoolProperty, StringProperty, FloatProperty, IntProperty, FloatVectorProperty, PointerProperty
+from .hdri import get_hdri_index, parse_library_roots, get_thumbnail_generator, shutdown_thumbnail_generator
 
 preview_collections = {}
 
@@ -17,7 +20,7 @@ def update_world_transparency(self, context):
     else:
         context.scene.render.film_transparent = False
 
-def load_hdri_previews(path):
+def load_hdri_previews(path, library_roots=()):
     global preview_collections
     if "hdri_previews" not in preview_collections:
         pcoll = previews.new()
@@ -28,22 +31,75 @@ def load_hdri_previews(path):
 
     if not os.path.exists(path):
         print(f"HDRI directory not found: {path}")
-        return None
 
-    hdri_files = [f for f in os.listdir(path) if f.endswith('.hdr') or f.endswith('.exr')]
-    
-    for file in hdri_files:
-        if file not in pcoll:
-            thumbnail_name = os.path.splitext(file)[0] + '.png'
-            thumbnail_path = os.path.join(path, thumbnail_name)
-            if os.path.exists(thumbnail_path):
-                pcoll.load(file, thumbnail_path, 'IMAGE')
-                preview_collections["hdri_paths"][file] = os.path.join(path, file)
-                log_message(f"HDRI load: {file}")
+    # The enum and previews are fed from the on-disk index; only changed directories are listed again
+    roots = [path] + [root for root in library_roots if root != path]
+    index = get_hdri_index()
+    rescanned = index.scan(roots)
+    index.save()
+    if rescanned:
+        log_message(f"HDRI index updated ({rescanned} directories rescanned)")
+
+    hdri_paths = preview_collections["hdri_paths"]
+    missing_thumbnails = {}
+    for root in roots:
+        for file_path, record in index.entries(root):
+            key = os.path.relpath(file_path, root).replace(os.sep, '/')
+            if hdri_paths.get(key, file_path) != file_path:
+                key = file_path
+            if key in pcoll:
+                continue
+            thumbnail_path = record.get("thumbnail") or record.get("cache_thumbnail")
+            if thumbnail_path and os.path.exists(thumbnail_path):
+                pcoll.load(key, thumbnail_path, 'IMAGE')
+                hdri_paths[key] = file_path
+            else:
+                missing_thumbnails[file_path] = key
+
+    preview_collections.pop("hdri_items", None)
+
+    # HDRIs without a PNG sidecar get a generated thumbnail, added to the collection when ready
+    if missing_thumbnails:
+        preview_collections.setdefault("hdri_pending", {}).update(missing_thumbnails)
+        get_thumbnail_generator().submit(list(missing_thumbnails), add_generated_hdri_preview)
+
+def add_generated_hdri_preview(file_path, thumbnail_path):
+    pcoll = preview_collections.get("hdri_previews")
+    key = preview_collections.get("hdri_pending", {}).pop(file_path, None)
+    if pcoll is None or key is None:
+        return
+
+    index = get_hdri_index()
+    record = index.files.get(file_path)
+    if record is not None:
+        record["cache_thumbnail"] = thumbnail_path
+        index.dirty = True
+    if not preview_collections["hdri_pending"]:
+        index.save()
+
+    if key not in pcoll:
+        pcoll.load(key, thumbnail_path, 'IMAGE')
+        preview_collections["hdri_paths"][key] = file_path
+        preview_collections.pop("hdri_items", None)
+
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def get_hdri_library_roots(context):
+    try:
+        addon_prefs = context.preferences.addons[__package__].preferences
+        roots_string = addon_prefs.hdri_library_roots
+    except (KeyError, AttributeError):
+        return []
+    return parse_library_roots(bpy.path.abspath(roots_string))
 
 def unload_hdri_previews():
     global preview_collections
-    for pcoll in preview_collections.values():
+    shutdown_thumbnail_generator()
+    pcoll = preview_collections.get("hdri_previews")
+    if pcoll:
         bpy.utils.previews.remove(pcoll)
     preview_collections.clear()
 
@@ -52,20 +108,215 @@ def update_hdri(self, context):
     print(f"Selected HDRI: {selected_hdri_name}")
     apply_hdri_rotation(context)
 
+# World name -> name of its MAPPING node, so slider updates don't search the node tree
+mapping_node_names = {}
+# Scene names with a rotation waiting for the throttle timer
+pending_hdri_rotations = set()
+
+def find_world_node(world, node_type, cache=None):
+    nodes = world.node_tree.nodes
+    if cache is not None:
+        node = nodes.get(cache.get(world.name, ""))
+        if node is not None and node.type == node_type:
+            return node
+    node = next((node for node in nodes if node.type == node_type), None)
+    if cache is not None and node is not None:
+        cache[world.name] = node.name
+    return node
+
 def apply_hdri_rotation(context):
-    world = context.scene.world
-    if world and world.use_nodes:
-        nodes = world.node_tree.nodes
-        mapping_node = next((node for node in nodes if node.type == 'MAPPING'), None)
+    apply_scene_hdri_rotation(context.scene)
+
+def apply_scene_hdri_rotation(scene):
+    world = scene.world
+    if not (world and world.use_nodes):
+        return
+
+    rotation_in_radians = math.radians(scene.hdri_rotation_degrees) % (2 * math.pi)
+    if scene.hdri_rotation_mode == 'OBJECT':
+        # Rotating an empty only updates its transform; the world shader isn't rebuilt
+        empty = ensure_hdri_rotation_object(scene)
+        if empty is not None:
+            empty.rotation_euler[2] = -rotation_in_radians
+        return
+
+    mapping_node = find_world_node(world, 'MAPPING', mapping_node_names)
+    if mapping_node:
+        mapping_node.inputs['Rotation'].default_value[2] = rotation_in_radians
+
+def ensure_hdri_rotation_object(scene):
+    world = scene.world
+    tex_coord_node = find_world_node(world, 'TEX_COORD')
+    if tex_coord_node is None:
+        return None
+
+    empty = scene.hdri_rotation_object
+    if empty is None:
+        empty = bpy.data.objects.new("HDRI Rotation", None)
+        empty.empty_display_type = 'SPHERE'
+        scene.collection.objects.link(empty)
+        scene.hdri_rotation_object = empty
+
+    if tex_coord_node.object != empty:
+        tex_coord_node.object = empty
+        mapping_node = find_world_node(world, 'MAPPING', mapping_node_names)
         if mapping_node:
-            rotation_in_radians = math.radians(context.scene.hdri_rotation_degrees) % (2 * math.pi)
-            mapping_node.inputs['Rotation'].default_value[2] = rotation_in_radians
+            mapping_node.inputs['Rotation'].default_value[2] = 0.0
+    return empty
+
+def update_hdri_rotation_mode(self, context):
+    scene = context.scene
+    world = scene.world
+    if scene.hdri_rotation_mode == 'MAPPING' and world and world.use_nodes:
+        tex_coord_node = find_world_node(world, 'TEX_COORD')
+        if tex_coord_node and tex_coord_node.object is not None:
+            tex_coord_node.object = None
+    apply_scene_hdri_rotation(scene)
+
+def update_hdri_rotation(self, context):
+    # Coalesce slider ticks: at most one world update per timer interval while dragging
+    pending_hdri_rotations.add(context.scene.name)
+    begin_interactive_preview(context.scene)
+    if not bpy.app.timers.is_registered(flush_hdri_rotation):
+        bpy.app.timers.register(flush_hdri_rotation, first_interval=1 / 60)
+
+def flush_hdri_rotation():
+    while pending_hdri_rotations:
+        scene = bpy.data.scenes.get(pending_hdri_rotations.pop())
+        if scene is not None:
+            apply_scene_hdri_rotation(scene)
+    return None
+
+# Interactive preview: while render-affecting sliders are dragged, rendered viewports drop to
+# a coarse pixel size and few samples, then return to full quality shortly after the last change
+INTERACTIVE_PREVIEW_DELAY = 0.35
+interactive_preview = {}
+# Scene name -> (original, lowered) settings of its last preview, to repair undo steps pushed during one
+finished_previews = {}
+interactive_preview_owner = object()
+last_interactive_change = [0.0]
+
+def rendered_viewport_open():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D' and area.spaces.active.shading.type == 'RENDERED':
+                return True
+    return False
+
+def read_preview_settings(scene):
+    render = scene.render
+    values = {
+        "preview_pixel_size": render.preview_pixel_size,
+        "use_simplify": render.use_simplify,
+        "simplify_subdivision": render.simplify_subdivision,
+        "taa_samples": scene.eevee.taa_samples,
+    }
+    if hasattr(scene, "cycles"):
+        values["preview_samples"] = scene.cycles.preview_samples
+    return values
+
+def write_preview_settings(scene, values):
+    scene.render.preview_pixel_size = values["preview_pixel_size"]
+    scene.render.use_simplify = values["use_simplify"]
+    scene.render.simplify_subdivision = values["simplify_subdivision"]
+    scene.eevee.taa_samples = values["taa_samples"]
+    if "preview_samples" in values and hasattr(scene, "cycles"):
+        scene.cycles.preview_samples = values["preview_samples"]
+
+def begin_interactive_preview(scene):
+    """
+    Lower viewport render quality while a slider is being dragged.
+
+    :param scene: Scene whose preview settings are lowered until restore_interactive_preview
+    """
+    last_interactive_change[0] = time.time()
+    if scene.name not in interactive_preview:
+        if not rendered_viewport_open():
+            return
+        saved = read_preview_settings(scene)
+        render = scene.render
+        render.preview_pixel_size = '4'
+        render.use_simplify = True
+        render.simplify_subdivision = min(render.simplify_subdivision, 1)
+        scene.eevee.taa_samples = min(scene.eevee.taa_samples, 4)
+        if hasattr(scene, "cycles"):
+            scene.cycles.preview_samples = min(scene.cycles.preview_samples, 8)
+        interactive_preview[scene.name] = (saved, read_preview_settings(scene))
+
+    if not bpy.app.timers.is_registered(restore_interactive_preview):
+        bpy.app.timers.register(restore_interactive_preview, first_interval=INTERACTIVE_PREVIEW_DELAY)
+
+def restore_interactive_preview(force=False):
+    remaining = INTERACTIVE_PREVIEW_DELAY - (time.time() - last_interactive_change[0])
+    if remaining > 0 and not force:
+        return remaining
+
+    while interactive_preview:
+        scene_name, (saved, lowered) = interactive_preview.popitem()
+        scene = bpy.data.scenes.get(scene_name)
+        if scene is None:
+            continue
+        write_preview_settings(scene, saved)
+        finished_previews[scene_name] = (saved, lowered)
+    return None
+
+def on_render_setting_changed():
+    begin_interactive_preview(bpy.context.scene)
+
+def subscribe_interactive_preview():
+    keys = [(bpy.types.SceneEEVEE, attr) for attr in ("gtao_distance", "bloom_radius")
+            if attr in bpy.types.SceneEEVEE.bl_rna.properties]
+    keys.append((bpy.types.Light, "energy"))
+    for key in keys:
+        bpy.msgbus.subscribe_rna(key=key, owner=interactive_preview_owner, args=(),
+                                 notify=on_render_setting_changed)
+
+@persistent
+def resubscribe_interactive_preview(*args):
+    # Message bus subscriptions don't survive loading a file
+    interactive_preview.clear()
+    finished_previews.clear()
+    bpy.msgbus.clear_by_owner(interactive_preview_owner)
+    subscribe_interactive_preview()
+
+@persistent
+def restore_preview_before_save(*args):
+    # Never save the file with the temporary low quality settings
+    restore_interactive_preview(force=True)
+
+@persistent
+def restore_preview_before_undo(*args):
+    # Leave the temporary settings before an undo step is loaded, so none is left half restored
+    restore_interactive_preview(force=True)
+
+@persistent
+def repair_preview_after_undo(*args):
+    # A slider drag pushes its undo step on release, before the preview ends, so that step holds
+    # the lowered settings: put the originals back when it is loaded
+    for scene_name, (saved, lowered) in finished_previews.items():
+        scene = bpy.data.scenes.get(scene_name)
+        if scene is not None and saved != lowered and read_preview_settings(scene) == lowered:
+            write_preview_settings(scene, saved)
+
+PREVIEW_HANDLERS = (
+    ("load_post", resubscribe_interactive_preview),
+    ("save_pre", restore_preview_before_save),
+    ("undo_pre", restore_preview_before_undo),
+    ("redo_pre", restore_preview_before_undo),
+    ("undo_post", repair_preview_after_undo),
+    ("redo_post", repair_preview_after_undo),
+)
             
 def get_hdri_items(self, context):
     pcoll = preview_collections.get("hdri_previews")
-    if pcoll:
-        return [(name, name, "", pcoll[name].icon_id, index) for index, name in enumerate(pcoll.keys())]
-    return []
+    if not pcoll:
+        return []
+    # Cached so large libraries don't rebuild thousands of items on every redraw
+    items = preview_collections.get("hdri_items")
+    if items is None:
+        items = [(name, name, "", pcoll[name].icon_id, index) for index, name in enumerate(pcoll.keys())]
+        preview_collections["hdri_items"] = items
+    return items
 
 def update_material_list(self, context):
     obj = context.object
@@ -185,7 +436,7 @@ def add_properties():
 
     # HDRI properties
     hdri_path = os.path.join(os.path.dirname(__file__), "Source", "HDRI")
-    load_hdri_previews(hdri_path)
+    load_hdri_previews(hdri_path, get_hdri_library_roots(bpy.context))
 
     Scene.hdri_enum = EnumProperty(
         name="HDRI",
@@ -234,13 +485,73 @@ def add_properties():
         update=update_world_transparency
     )
 
+    Scene.hdri_proxy_resolution = EnumProperty(
+        name="Viewport HDRI",
+        description="Resolution of the HDRI used in the viewport; final renders always use the full resolution file",
+        items=[
+            ('FULL', "Full", "Use the original HDRI in the viewport"),
+            ('2K', "2K Proxy", "Use a cached 2048px proxy in the viewport"),
+            ('1K', "1K Proxy", "Use a cached 1024px proxy in the viewport"),
+        ],
+        default='2K'
+    )
+
     Scene.hdri_rotation_degrees = FloatProperty(
         name="HDRI Rotation (Degrees)",
         description="Rotate the HDRI environment in degrees",
         default=0.0,
         min=0.0,
         max=360.0,
-        update=lambda self, context: apply_hdri_rotation(context)
+        update=update_hdri_rotation
+    )
+
+    Scene.hdri_auto_strength = BoolProperty(
+        name="Auto Strength",
+        description="Normalize the background strength from the HDRI's mean luminance when applying it",
+        default=False
+    )
+
+    Scene.hdri_target_luminance = FloatProperty(
+        name="Target Luminance",
+        description="Mean luminance the background is normalized to when Auto Strength is enabled",
+        default=1.0,
+        min=0.01,
+        max=100.0
+    )
+
+    Scene.render_profile = EnumProperty(
+        name="Render Profile",
+        description="Quality profile last applied to the render settings",
+        items=[
+            ('CUSTOM', "Custom", "Settings edited by hand"),
+            ('DRAFT', "Draft", ""),
+            ('PREVIEW', "Preview", ""),
+            ('FINAL', "Final", ""),
+        ],
+        default='CUSTOM'
+    )
+
+    Scene.render_profile_benchmark = StringProperty(
+        name="Render Profile Benchmark",
+        description="Render time of each profile measured on this scene (JSON)",
+        default=""
+    )
+
+    Scene.hdri_rotation_mode = EnumProperty(
+        name="HDRI Rotation Mode",
+        description="How the HDRI rotation is applied to the world",
+        items=[
+            ('MAPPING', "Mapping Node", "Write the rotation into the world Mapping node"),
+            ('OBJECT', "Empty Object", "Rotate an empty used as the texture coordinate object; avoids world shader updates"),
+        ],
+        default='MAPPING',
+        update=update_hdri_rotation_mode
+    )
+
+    Scene.hdri_rotation_object = PointerProperty(
+        name="HDRI Rotation Object",
+        description="Empty whose rotation drives the HDRI in Empty Object mode",
+        type=bpy.types.Object
     )
 
     Scene.expand_light_controls = BoolProperty(
@@ -1085,6 +1396,10 @@ class EpicToolBagAddonPanel(Panel):
             row.scale_y = 1.5
             row.operator("epictoolbag.confirm_assets_dir", text="Import Assets", icon='IMPORT')
             row.operator("epictoolbag.clear_assets_dir", text="", icon='TRASH')
+
+            row = box.row(align=True)
+            row.prop(addon_prefs, "optimize_imported_meshes", text="Clean Up on Import")
+            row.operator("epictoolbag.optimize_meshes", text="", icon='BRUSH_DATA')
                     
     def draw_render_tab(self, layout, context):
         box = layout.box()
@@ -1094,6 +1409,7 @@ class EpicToolBagAddonPanel(Panel):
         row = col.row(align=True)
         row.scale_y = 1.5
         row.prop(context.scene, "hdri_enum", text="")
+        row.operator("epictoolbag.rescan_hdri_library", text="", icon='FILE_REFRESH')
 
         pcoll = preview_collections.get("hdri_previews")
         if pcoll:
@@ -1142,6 +1458,16 @@ class EpicToolBagAddonPanel(Panel):
         row = col.row(align=True)
         row.scale_y = 1.5
         row.prop(context.scene, "hdri_rotation_degrees", text="Rotation", icon='ARROW_LEFTRIGHT')
+        row.prop(context.scene, "hdri_rotation_mode", text="", icon='ORIENTATION_GIMBAL', icon_only=True)
+        row.prop(context.scene, "hdri_proxy_resolution", text="")
+
+        row = col.row(align=True)
+        row.scale_y = 1.5
+        row.prop(context.scene, "hdri_auto_strength", text="Auto Strength", toggle=True)
+        if context.scene.hdri_auto_strength:
+            row.prop(context.scene, "hdri_target_luminance", text="")
+        row.operator("epictoolbag.align_hdri_sun", text="", icon='LIGHT_SUN')
+        row.operator("epictoolbag.hdri_contact_sheet", text="", icon='IMGDISPLAY')
 
         # Chama o método de renderização
         self.draw_render_section(layout, context)
@@ -1168,7 +1494,9 @@ class EpicToolBagAddonPanel(Panel):
             row = col.row(align=True)
             row.scale_y = 1.5
             row.operator("epictoolbag.create_light", text="Add Light", icon='LIGHT')
+            row.operator("epictoolbag.create_light_rig", text="", icon='OUTLINER_OB_LIGHT')
             row.operator("epictoolbag.create_camera", text="Add Camera", icon='CAMERA_DATA')
+            row.operator("epictoolbag.create_turntable", text="", icon='CON_FOLLOWPATH')
             row.operator("epictoolbag.remove_light_camera", text="", icon='X')
 
             # Nota informativa em um box com texto brando
@@ -1280,6 +1608,20 @@ class EpicToolBagAddonPanel(Panel):
 
             col.scale_y = 1.5
             col.prop(context.scene.render, "engine", text="")
+
+            row = col.row(align=True)
+            for profile, label in (('DRAFT', "Draft"), ('PREVIEW', "Preview"), ('FINAL', "Final")):
+                row.operator("epictoolbag.apply_render_profile", text=label,
+                             depress=scene.render_profile == profile).profile = profile
+            row.operator("epictoolbag.benchmark_render_profiles", text="", icon='TIME')
+            if scene.render_profile_benchmark:
+                try:
+                    benchmark = json.loads(scene.render_profile_benchmark)
+                    col.label(text=" / ".join(f"{profile.title()} {seconds:.1f}s"
+                                              for profile, seconds in benchmark["timings"].items()),
+                              icon='TIME')
+                except (ValueError, KeyError, AttributeError):
+                    pass
             col.separator()
 
             col.prop(context.scene, "world_transparent", text="Transparent")
@@ -1317,8 +1659,18 @@ class EpicToolBagAddonPanel(Panel):
             # Botões de Render com layout similar a outros elementos
             row = col.row(align=True)
             row.scale_y = 1.5
-            row.operator("render.render", text="Render", icon='IMAGE_DATA')
+            row.operator("epictoolbag.cached_render", text="Render", icon='IMAGE_DATA')
             row.operator("render.render", text="Render Animation", icon='VIEW_CAMERA_UNSELECTED').animation = True
+
+            row = col.row(align=True)
+            row.operator("epictoolbag.tiled_render", text="Tiled Render", icon='MESH_GRID')
+
+            from .render_cache import draw_render_cache_stats
+            draw_render_cache_stats(col, context)
+
+            from .render_queue import draw_render_queue
+            col.separator()
+            draw_render_queue(col, context)
         
 classes = [Preferences,EpicToolBagAddonPanel]
 
@@ -1326,12 +1678,26 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     add_properties()
+    subscribe_interactive_preview()
+    for name, handler in PREVIEW_HANDLERS:
+        getattr(bpy.app.handlers, name).append(handler)
 
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     remove_properties()
     unload_hdri_previews()
+    if bpy.app.timers.is_registered(flush_hdri_rotation):
+        bpy.app.timers.unregister(flush_hdri_rotation)
+
+    bpy.msgbus.clear_by_owner(interactive_preview_owner)
+    for name, handler in PREVIEW_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler in handlers:
+            handlers.remove(handler)
+    if bpy.app.timers.is_registered(restore_interactive_preview):
+        bpy.app.timers.unregister(restore_interactive_preview)
+    restore_interactive_preview(force=True)
 
 def remove_properties():
     props_to_remove = [
@@ -1341,6 +1707,13 @@ def remove_properties():
         "hdri_files",
         "world_transparent",
         "hdri_rotation_degrees",
+        "hdri_rotation_mode",
+        "render_profile",
+        "render_profile_benchmark",
+        "hdri_auto_strength",
+        "hdri_target_luminance",
+        "hdri_rotation_object",
+        "hdri_proxy_resolution",
         "hdri_enum",
         "expand_light_controls",
         "outline_color",
@@ -1,10 +1,75 @@
 import bpy
 import os
 import math
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import numpy as np
 from mathutils import Vector
 from bpy.types import Operator
-from bpy.props import StringProperty, EnumProperty, FloatProperty, FloatVectorProperty
-from .panels import apply_hdri_rotation, preview_collections
+from bpy.props import StringProperty, EnumProperty, FloatProperty, FloatVectorProperty, IntProperty
+from bpy.app.handlers import persistent
+from .panels import apply_hdri_rotation, preview_collections, load_hdri_previews, get_hdri_library_roots
+from .utils import get_cache_dir, scene_state_hash
+from .scene_index import get_scene_index
+from .background import (
+    RenderWorkerPool, default_worker_count, save_scene_copy, split_tasks,
+    load_image_pixels, save_image_pixels, show_image,
+    tile_regions, region_border, iter_blended_bands, write_exr_bands, write_png_bands, physical_memory_mb
+)
+from .hdri import PROXY_WIDTHS, get_hdri_proxy, get_hdri_analysis, get_prefetch_cache, clear_prefetch_cache
+
+# World name -> proxy image name, while the full resolution HDRI is swapped in for rendering
+proxy_swaps = {}
+
+def release_image(image):
+    """Free an HDRI image datablock once nothing uses it anymore."""
+    if image is not None and image.users == 0:
+        bpy.data.images.remove(image)
+
+def get_environment_node(world):
+    if world is None or not world.use_nodes:
+        return None
+    return next((node for node in world.node_tree.nodes if node.type == 'TEX_ENVIRONMENT'), None)
+
+@persistent
+def swap_in_full_resolution_hdri(scene, *args):
+    # render_init passes no scene on most Blender versions: the job renders the active one, and
+    # render_pre, which runs for every frame, catches any other scene (a no-op once swapped)
+    scene = scene if isinstance(scene, bpy.types.Scene) else bpy.context.scene
+    world = scene.world if scene is not None else None
+    env_tex_node = get_environment_node(world)
+    if env_tex_node is None or world.name in proxy_swaps:
+        return
+
+    hdri_path = world.get("epictoolbag_hdri_path")
+    proxy_image = env_tex_node.image
+    if not hdri_path or proxy_image is None or bpy.path.abspath(proxy_image.filepath) == hdri_path:
+        return
+    if not os.path.exists(hdri_path):
+        print(f"Epic Toolbag - Full resolution HDRI not found, rendering proxy: {hdri_path}")
+        return
+
+    proxy_image.use_fake_user = True
+    env_tex_node.image = bpy.data.images.load(hdri_path, check_existing=True)
+    proxy_swaps[world.name] = proxy_image.name
+
+@persistent
+def swap_out_full_resolution_hdri(*args):
+    # Runs once the whole render job ends, so an animation loads the full resolution HDRI only once
+    while proxy_swaps:
+        world_name, proxy_name = proxy_swaps.popitem()
+        env_tex_node = get_environment_node(bpy.data.worlds.get(world_name))
+        proxy_image = bpy.data.images.get(proxy_name)
+        if env_tex_node is None or proxy_image is None:
+            continue
+
+        full_image = env_tex_node.image
+        env_tex_node.image = proxy_image
+        proxy_image.use_fake_user = False
+        release_image(full_image)
 
 class AddOrApplyHDRI(Operator):
     bl_idname = "epictoolbag.add_or_apply_hdri" 
@@ -40,8 +105,19 @@ class AddOrApplyHDRI(Operator):
             # If found, just update the image
             background_node = next((node for node in nodes if node.type == 'BACKGROUND'), None)
 
-        # Load and apply the new HDRI image
-        env_tex_node.image = bpy.data.images.load(hdri_path, check_existing=True)
+        # Load and apply the new HDRI image, using a downsampled proxy for the viewport if enabled
+        proxy_width = PROXY_WIDTHS.get(context.scene.hdri_proxy_resolution)
+        image_path = get_prefetch_cache().get(hdri_path, proxy_width) or hdri_path
+        if proxy_width and image_path == hdri_path:
+            try:
+                image_path = get_hdri_proxy(hdri_path, proxy_width)
+            except (OSError, ValueError) as e:
+                self.report({'WARNING'}, f"Using full resolution HDRI, proxy failed: {e}")
+
+        previous_image = env_tex_node.image
+        env_tex_node.image = bpy.data.images.load(image_path, check_existing=True)
+        world["epictoolbag_hdri_path"] = hdri_path
+        release_image(previous_image)
 
         # Add or update the mapping node for rotation control
         mapping_node = next((node for node in nodes if node.type == 'MAPPING'), None)
@@ -54,9 +130,559 @@ class AddOrApplyHDRI(Operator):
         # Apply HDRI rotation
         apply_hdri_rotation(context)
 
+        # Normalize the background strength from the HDRI's mean luminance
+        if context.scene.hdri_auto_strength and background_node:
+            try:
+                analysis = get_hdri_analysis(hdri_path)
+                background_node.inputs['Strength'].default_value = auto_strength(context.scene, analysis)
+            except (OSError, ValueError) as e:
+                self.report({'WARNING'}, f"HDRI analysis failed: {e}")
+
         self.report({'INFO'}, "HDRI applied.")
         return {'FINISHED'}
 
+def auto_strength(scene, analysis):
+    mean_luminance = max(analysis["mean_luminance"], 1e-6)
+    return min(max(scene.hdri_target_luminance / mean_luminance, 0.01), 100.0)
+
+def get_key_light(context):
+    """Get the active light, or the strongest light in the scene."""
+    obj = context.active_object
+    if obj and obj.type == 'LIGHT':
+        return obj
+    lights = get_scene_index(context.scene).light_objects(context.scene)
+    return max(lights, key=lambda obj: obj.data.energy, default=None)
+
+def get_light_azimuth(context, light_obj):
+    """Azimuth (degrees) of the direction the light comes from, as seen from the 3D cursor."""
+    if light_obj.data.type in {'SUN', 'SPOT', 'AREA'}:
+        # Lights shine along their local -Z axis, so they come from +Z
+        direction = light_obj.matrix_world.to_3x3() @ Vector((0.0, 0.0, 1.0))
+    else:
+        direction = light_obj.matrix_world.translation - context.scene.cursor.location
+    return math.degrees(math.atan2(direction.y, direction.x))
+
+class AlignHDRISunToLight(Operator):
+    """Rotate the HDRI so its brightest region lines up with the key light"""
+    bl_idname = "epictoolbag.align_hdri_sun"
+    bl_label = "Align Sun to Key Light"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        hdri_path = scene.world.get("epictoolbag_hdri_path") if scene.world else None
+        if not hdri_path or not os.path.exists(hdri_path):
+            self.report({'ERROR'}, "Apply an HDRI first.")
+            return {'CANCELLED'}
+
+        light_obj = get_key_light(context)
+        if light_obj is None:
+            self.report({'ERROR'}, "No light in the scene to align to.")
+            return {'CANCELLED'}
+
+        try:
+            analysis = get_hdri_analysis(hdri_path)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"HDRI analysis failed: {e}")
+            return {'CANCELLED'}
+
+        # The mapping rotation turns the lookup vector, so the sun appears at (sun azimuth - rotation)
+        rotation = (analysis["sun_azimuth"] - get_light_azimuth(context, light_obj)) % 360.0
+        scene.hdri_rotation_degrees = rotation
+        apply_hdri_rotation(context)
+
+        self.report({'INFO'}, f"HDRI sun aligned to '{light_obj.name}' ({rotation:.1f}°).")
+        return {'FINISHED'}
+
+class HDRIContactSheet(Operator):
+    """Render the scene under every HDRI in background processes and stitch the frames into a grid"""
+    bl_idname = "epictoolbag.hdri_contact_sheet"
+    bl_label = "HDRI Contact Sheet"
+
+    worker_count: IntProperty(
+        name="Workers",
+        description="Number of background Blender processes rendering at the same time",
+        default=default_worker_count(),
+        min=1,
+        max=64
+    )
+
+    tile_width: IntProperty(
+        name="Tile Width",
+        description="Width in pixels of each frame in the sheet",
+        default=320,
+        min=64,
+        max=2048
+    )
+
+    columns: IntProperty(
+        name="Columns",
+        description="Number of columns in the sheet (0 for automatic)",
+        default=0,
+        min=0,
+        max=32
+    )
+
+    _timer = None
+    _pool = None
+    _work_dir = None
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        scene = context.scene
+        if scene.camera is None:
+            self.report({'ERROR'}, "The scene has no active camera.")
+            return {'CANCELLED'}
+
+        pcoll = preview_collections.get("hdri_previews")
+        pcoll_paths = preview_collections.get("hdri_paths", {})
+        self.hdri_names = [name for name in (pcoll.keys() if pcoll else []) if name in pcoll_paths]
+        if not self.hdri_names:
+            self.report({'ERROR'}, "No HDRIs in the library.")
+            return {'CANCELLED'}
+
+        render = scene.render
+        tile_height = max(1, round(self.tile_width * render.resolution_y / max(render.resolution_x, 1)))
+        scene_hash = scene_state_hash(scene, include_world=False)
+        cache_dir = get_cache_dir("contact_sheet")
+
+        # Frames are cached by scene state + HDRI file, so re-runs only render what changed
+        self.frame_paths = []
+        tasks = []
+        for name in self.hdri_names:
+            hdri_path = pcoll_paths[name]
+            stat = os.stat(hdri_path)
+            # The leading version drops frames cached by workers that rendered the wrong HDRI
+            key = hashlib.sha1(repr((2, scene_hash, hdri_path, stat.st_size, stat.st_mtime, self.tile_width,
+                                     scene.hdri_rotation_degrees)).encode()).hexdigest()
+            frame_path = os.path.join(cache_dir, f"{key}.png")
+            self.frame_paths.append(frame_path)
+            if not os.path.exists(frame_path):
+                tasks.append({
+                    "id": key,
+                    "hdri": hdri_path,
+                    "hdri_rotation": scene.hdri_rotation_degrees,
+                    "label": name,
+                    "camera": scene.camera.name,
+                    "resolution": [self.tile_width, tile_height],
+                    "percentage": 100,
+                    "transparent": False,
+                    "file_format": 'PNG',
+                    "output": frame_path,
+                })
+
+        self.sheet_path = os.path.join(cache_dir, f"sheet_{scene_hash[:12]}.png")
+        if not tasks:
+            return self.finish(context)
+
+        self._work_dir = tempfile.mkdtemp(prefix="epictoolbag_sheet_")
+        blend_path = save_scene_copy(os.path.join(self._work_dir, "scene.blend"))
+        self._pool = RenderWorkerPool(blend_path, self._work_dir, self.worker_count)
+        for batch in split_tasks(tasks, self.worker_count):
+            self._pool.add(batch)
+
+        self.total = len(tasks)
+        self.completed = 0
+        self.failed = 0
+        wm = context.window_manager
+        wm.progress_begin(0, self.total)
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+        self.report({'INFO'}, f"Rendering {self.total} of {len(self.hdri_names)} HDRI frames...")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._pool.cancel()
+            self.cleanup(context)
+            self.report({'WARNING'}, "Contact sheet cancelled.")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        for progress in self._pool.update():
+            if progress.get("event") == "done":
+                self.completed += 1
+            elif progress.get("event") == "error":
+                self.failed += 1
+                print(f"Epic Toolbag - Contact sheet frame failed: {progress.get('error')}")
+        context.window_manager.progress_update(self.completed + self.failed)
+
+        if not self._pool.finished:
+            return {'PASS_THROUGH'}
+
+        self.cleanup(context)
+        return self.finish(context)
+
+    def finish(self, context):
+        frames = [(name, path) for name, path in zip(self.hdri_names, self.frame_paths) if os.path.exists(path)]
+        if not frames:
+            self.report({'ERROR'}, "No frames were rendered.")
+            return {'CANCELLED'}
+
+        tiles = [load_image_pixels(path)[::-1] for _name, path in frames]
+        tile_height, tile_width = tiles[0].shape[:2]
+        columns = self.columns or math.ceil(math.sqrt(len(tiles)))
+        rows = math.ceil(len(tiles) / columns)
+
+        # Assemble top row first, then flip to Blender's bottom-up pixel order
+        sheet = np.zeros((rows * tile_height, columns * tile_width, 4), dtype=np.float32)
+        sheet[..., 3] = 1.0
+        for index, tile in enumerate(tiles):
+            row, column = divmod(index, columns)
+            height, width = min(tile.shape[0], tile_height), min(tile.shape[1], tile_width)
+            sheet[row * tile_height:row * tile_height + height,
+                  column * tile_width:column * tile_width + width] = tile[:height, :width]
+
+        image = save_image_pixels(sheet[::-1], self.sheet_path, "HDRI Contact Sheet")
+        show_image(context, image)
+
+        message = f"Contact sheet saved: {self.sheet_path}"
+        if getattr(self, "failed", 0):
+            message += f" ({self.failed} frames failed)"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+    def cleanup(self, context):
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        if self._work_dir:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+
+class TiledRender(Operator):
+    """Render the frame as overlapping tiles in background processes and blend them into one image"""
+    bl_idname = "epictoolbag.tiled_render"
+    bl_label = "Tiled Render"
+
+    tiles_x: IntProperty(
+        name="Columns",
+        default=4,
+        min=1,
+        max=64
+    )
+
+    tiles_y: IntProperty(
+        name="Rows",
+        default=4,
+        min=1,
+        max=64
+    )
+
+    overlap: IntProperty(
+        name="Overlap",
+        description="Pixels each tile extends into its neighbours, cross-faded to hide denoising seams",
+        default=32,
+        min=0,
+        max=512
+    )
+
+    worker_count: IntProperty(
+        name="Workers",
+        description="Number of background Blender processes rendering at the same time",
+        default=default_worker_count(),
+        min=1,
+        max=64
+    )
+
+    memory_per_worker: IntProperty(
+        name="Memory per Worker (MB)",
+        description="Expected peak memory of one tile process, used to limit the number of workers",
+        default=4096,
+        min=256
+    )
+
+    file_format: EnumProperty(
+        name="Format",
+        items=[
+            ('OPEN_EXR', "OpenEXR", "32-bit float, scene linear"),
+            ('PNG', "PNG", "8-bit, view transform applied"),
+        ],
+        default='OPEN_EXR'
+    )
+
+    _timer = None
+    _pool = None
+    _work_dir = None
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        scene = context.scene
+        if scene.camera is None:
+            self.report({'ERROR'}, "The scene has no active camera.")
+            return {'CANCELLED'}
+
+        render = scene.render
+        self.width = max(1, render.resolution_x * render.resolution_percentage // 100)
+        self.height = max(1, render.resolution_y * render.resolution_percentage // 100)
+        self.regions, self.used_overlap = tile_regions(self.width, self.height, self.tiles_x, self.tiles_y, self.overlap)
+
+        workers = min(self.worker_count, len(self.regions))
+        memory = physical_memory_mb()
+        if memory:
+            workers = max(1, min(workers, int(memory * 0.75) // self.memory_per_worker))
+
+        extension = ".exr" if self.file_format == 'OPEN_EXR' else ".png"
+        self.output_path = bpy.path.abspath(render.filepath) or bpy.app.tempdir
+        if self.output_path.endswith(("/", "\\")) or os.path.isdir(self.output_path):
+            self.output_path = os.path.join(self.output_path, "tiled_render")
+        if not os.path.splitext(self.output_path)[1]:
+            self.output_path += extension
+
+        self._work_dir = tempfile.mkdtemp(prefix="epictoolbag_tiles_")
+        blend_path = save_scene_copy(os.path.join(self._work_dir, "scene.blend"))
+        self.tile_paths = []
+        tasks = []
+        for index, region in enumerate(self.regions):
+            tile_path = os.path.join(self._work_dir, f"tile_{index:04d}{extension}")
+            self.tile_paths.append(tile_path)
+            tasks.append({
+                "id": str(index),
+                "camera": scene.camera.name,
+                "border": region_border(region, self.width, self.height),
+                "file_format": self.file_format,
+                "output": tile_path,
+            })
+
+        self._pool = RenderWorkerPool(blend_path, self._work_dir, workers)
+        for batch in split_tasks(tasks, workers):
+            self._pool.add(batch)
+
+        self.completed = 0
+        self.failed = []
+        wm = context.window_manager
+        wm.progress_begin(0, len(tasks))
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+        self.report({'INFO'}, f"Rendering {len(tasks)} tiles with {workers} workers...")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._pool.cancel()
+            self.cleanup(context)
+            self.report({'WARNING'}, "Tiled render cancelled.")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        for progress in self._pool.update():
+            if progress.get("event") == "done":
+                self.completed += 1
+            elif progress.get("event") == "error":
+                self.failed.append(progress.get("task"))
+                print(f"Epic Toolbag - Tile {progress.get('task')} failed: {progress.get('error')}")
+        context.window_manager.progress_update(self.completed + len(self.failed))
+
+        if not self._pool.finished:
+            return {'PASS_THROUGH'}
+
+        if self.failed:
+            self.cleanup(context)
+            self.report({'ERROR'}, f"{len(self.failed)} tiles failed, see the console for details.")
+            return {'CANCELLED'}
+
+        # Tiles are blended and written a band at a time: the frame is never held in memory here
+        bands = iter_blended_bands(lambda index: load_image_pixels(self.tile_paths[index]),
+                                   self.regions, self.width, self.height, self.used_overlap)
+        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+        if self.file_format == 'OPEN_EXR':
+            write_exr_bands(self.output_path, self.width, self.height, bands)
+        else:
+            write_png_bands(self.output_path, self.width, self.height, bands)
+
+        previous = bpy.data.images.get("Tiled Render")
+        if previous is not None:
+            bpy.data.images.remove(previous)
+        image = bpy.data.images.load(self.output_path)
+        image.name = "Tiled Render"
+        show_image(context, image)
+
+        self.cleanup(context)
+        self.report({'INFO'}, f"Tiled render saved: {self.output_path}")
+        return {'FINISHED'}
+
+    def cleanup(self, context):
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        if self._work_dir:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+
+# Settings bundled by each render profile, as (path, value); paths missing in the running
+# Blender version or render engine (e.g. EEVEE bloom, Cycles texture limit) are skipped
+RENDER_PROFILES = {
+    'DRAFT': {
+        "eevee.taa_render_samples": 8,
+        "cycles.samples": 16,
+        "render.resolution_percentage": 25,
+        "eevee.gtao_distance": 0.1,
+        "eevee.use_bloom": False,
+        "render.use_simplify": True,
+        "render.simplify_subdivision_render": 0,
+        "cycles.texture_limit_render": '512',
+        "outlines": False,
+    },
+    'PREVIEW': {
+        "eevee.taa_render_samples": 32,
+        "cycles.samples": 64,
+        "render.resolution_percentage": 50,
+        "eevee.gtao_distance": 0.2,
+        "eevee.use_bloom": True,
+        "render.use_simplify": True,
+        "render.simplify_subdivision_render": 2,
+        "cycles.texture_limit_render": '2048',
+        "outlines": True,
+    },
+    'FINAL': {
+        "eevee.taa_render_samples": 128,
+        "cycles.samples": 512,
+        "render.resolution_percentage": 100,
+        "eevee.gtao_distance": 0.2,
+        "eevee.use_bloom": True,
+        "render.use_simplify": False,
+        "render.simplify_subdivision_render": 6,
+        "cycles.texture_limit_render": 'OFF',
+        "outlines": True,
+    },
+}
+
+def get_outline_modifiers(scene):
+    return [mod for obj in scene.objects for mod in obj.modifiers
+            if mod.type == 'NODES' and mod.node_group and "outline" in mod.node_group.name.lower()]
+
+def resolve_profile_setting(scene, path):
+    owner_name, attr = path.split(".")
+    owner = scene.render if owner_name == "render" else getattr(scene, owner_name, None)
+    if owner is None or not hasattr(owner, attr):
+        return None, attr
+    return owner, attr
+
+def capture_render_profile(scene):
+    """Snapshot every setting a render profile touches, to restore with restore_render_profile."""
+    values = {}
+    for path in RENDER_PROFILES['FINAL']:
+        if path == "outlines":
+            values[path] = [(mod.id_data.name, mod.name, mod.show_render) for mod in get_outline_modifiers(scene)]
+            continue
+        owner, attr = resolve_profile_setting(scene, path)
+        if owner is not None:
+            values[path] = getattr(owner, attr)
+    return values
+
+def restore_render_profile(scene, values):
+    for path, value in values.items():
+        if path == "outlines":
+            for object_name, mod_name, show_render in value:
+                obj = bpy.data.objects.get(object_name)
+                mod = obj.modifiers.get(mod_name) if obj else None
+                if mod is not None:
+                    mod.show_render = show_render
+            continue
+        owner, attr = resolve_profile_setting(scene, path)
+        if owner is not None:
+            setattr(owner, attr, value)
+
+def apply_render_profile(scene, profile):
+    """
+    Apply a render profile. All targets are resolved before anything changes, so the
+    profile is applied completely or not at all.
+
+    :param scene: Scene to configure
+    :param profile: Key of RENDER_PROFILES
+    """
+    changes = []
+    for path, value in RENDER_PROFILES[profile].items():
+        if path == "outlines":
+            changes.extend((mod, "show_render", value) for mod in get_outline_modifiers(scene))
+            continue
+        owner, attr = resolve_profile_setting(scene, path)
+        if owner is not None:
+            changes.append((owner, attr, value))
+
+    for owner, attr, value in changes:
+        setattr(owner, attr, value)
+    scene.render_profile = profile
+
+class ApplyRenderProfile(Operator):
+    """Switch samples, resolution, AO, bloom, simplify, texture limit and outlines in one undo step"""
+    bl_idname = "epictoolbag.apply_render_profile"
+    bl_label = "Apply Render Profile"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    profile: EnumProperty(
+        name="Profile",
+        items=[
+            ('DRAFT', "Draft", "Fast, low quality renders for blocking out"),
+            ('PREVIEW', "Preview", "Balanced quality for look development"),
+            ('FINAL', "Final", "Full quality for delivery"),
+        ],
+        default='PREVIEW'
+    )
+
+    def execute(self, context):
+        apply_render_profile(context.scene, self.profile)
+        self.report({'INFO'}, f"Render profile: {self.profile.title()}")
+        return {'FINISHED'}
+
+class BenchmarkRenderProfiles(Operator):
+    """Render the current frame with each profile and record how long each one takes"""
+    bl_idname = "epictoolbag.benchmark_render_profiles"
+    bl_label = "Benchmark Render Profiles"
+
+    def execute(self, context):
+        scene = context.scene
+        if scene.camera is None:
+            self.report({'ERROR'}, "The scene has no active camera.")
+            return {'CANCELLED'}
+
+        original = capture_render_profile(scene)
+        original_profile = scene.render_profile
+        wm = context.window_manager
+        wm.progress_begin(0, len(RENDER_PROFILES))
+        timings = {}
+        try:
+            for index, profile in enumerate(RENDER_PROFILES):
+                apply_render_profile(scene, profile)
+                start_time = time.time()
+                bpy.ops.render.render()
+                timings[profile] = round(time.time() - start_time, 2)
+                wm.progress_update(index + 1)
+        finally:
+            restore_render_profile(scene, original)
+            scene.render_profile = original_profile
+            wm.progress_end()
+
+        scene.render_profile_benchmark = json.dumps({"engine": scene.render.engine, "timings": timings})
+        summary = ", ".join(f"{profile.title()} {seconds:.2f}s" for profile, seconds in timings.items())
+        self.report({'INFO'}, f"Render times: {summary}")
+        return {'FINISHED'}
+
+class RescanHDRILibrary(Operator):
+    """Update the HDRI index with new or changed files from the library folders"""
+    bl_idname = "epictoolbag.rescan_hdri_library"
+    bl_label = "Rescan HDRI Library"
+
+    def execute(self, context):
+        hdri_path = os.path.join(os.path.dirname(__file__), "Source", "HDRI")
+        load_hdri_previews(hdri_path, get_hdri_library_roots(context))
+
+        pcoll = preview_collections.get("hdri_previews")
+        self.report({'INFO'}, f"HDRI library: {len(pcoll) if pcoll else 0} environments.")
+        return {'FINISHED'}
+
 class RemoveHDRI(Operator):
     bl_idname = "epictoolbag.remove_hdri"
     bl_label = "Remove HDRI"
@@ -109,40 +735,27 @@ class CreateLight(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        # Definir um nome único para a luz
-        light_name = f"Light_{len(bpy.data.lights) + 1}"
-        
-        # Criar luz padrão (Point light)
-        light_data = bpy.data.lights.new(name=light_name, type='POINT')
-        light_object = bpy.data.objects.new(name=light_name, object_data=light_data)
+        # Blender makes the name unique (Light.001, ...), even after deletions
+        light_data = bpy.data.lights.new(name="Light", type='POINT')
+        light_object = bpy.data.objects.new(name=light_data.name, object_data=light_data)
         
         # Adicionar à cena
         context.collection.objects.link(light_object)
 
-        # Posicionamento randômico
-        if context.scene.objects:
-            # Se já existem objetos na cena, posicionar próximo ao centro
-            center = context.scene.cursor.location
-            offset = random.uniform(3, 7)
-            angle = random.uniform(0, 2 * math.pi)
-            
-            light_object.location = (
-                center.x + offset * math.cos(angle),
-                center.y + offset * math.sin(angle),
-                center.z + random.uniform(2, 5)
-            )
-        else:
-            # Posição padrão se não houver objetos
-            light_object.location = (0, 0, 5)
+        # Posicionamento randômico, afastado da geometria da cena (via índice espacial)
+        center = context.scene.cursor.location
+        angle = random.uniform(0, 2 * math.pi)
+        elevation = random.uniform(math.radians(20), math.radians(50))
+        direction = (math.cos(angle) * math.cos(elevation), math.sin(angle) * math.cos(elevation), math.sin(elevation))
+        position = get_scene_index(context.scene).find_clear_position(context.scene, center, direction, clearance=2.0)
+        light_object.location = Vector(position)
 
         # Configurações padrão da luz
         light_data.energy = 1000.0
         light_data.color = (1.0, 1.0, 1.0)
 
         # Selecionar a nova luz
-        bpy.ops.object.select_all(action='DESELECT')
-        light_object.select_set(True)
-        context.view_layer.objects.active = light_object
+        select_only(context, [light_object])
 
         return {'FINISHED'}
 
@@ -150,6 +763,151 @@ class CreateLight(Operator):
     def log_message(message):
         """Log messages for debugging purposes."""
         print(f"[Epic Toolbag - CreateLight]: {message}")
+
+def select_only(context, objects):
+    """Select the given objects, touching only the current selection instead of every object."""
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    if objects:
+        context.view_layer.objects.active = objects[0]
+
+def fibonacci_hemisphere(count):
+    """Evenly spread unit directions over the upper hemisphere."""
+    golden_angle = math.pi * (3 - math.sqrt(5))
+    directions = []
+    for index in range(count):
+        z = 1 - (index + 0.5) / count
+        radius = math.sqrt(1 - z * z)
+        angle = index * golden_angle
+        directions.append(Vector((radius * math.cos(angle), radius * math.sin(angle), z)))
+    return directions
+
+def light_rig_layout(rig_type, count, radius, height):
+    """
+    Positions and roles of the lights of a rig, relative to its target.
+
+    :return: List of (role, position) with position as a Vector
+    """
+    if rig_type == 'THREE_POINT':
+        return [
+            ("Key", Vector((radius * math.cos(math.radians(-45)), radius * math.sin(math.radians(-45)), height))),
+            ("Fill", Vector((radius * math.cos(math.radians(-135)), radius * math.sin(math.radians(-135)), height * 0.5))),
+            ("Rim", Vector((0.0, radius, height * 1.2))),
+        ]
+    if rig_type == 'RING':
+        return [("Ring", Vector((radius * math.cos(2 * math.pi * index / count),
+                                 radius * math.sin(2 * math.pi * index / count), height)))
+                for index in range(count)]
+    if rig_type == 'DOME':
+        return [("Dome", direction * radius) for direction in fibonacci_hemisphere(count)]
+
+    columns = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / columns)
+    spacing = 2 * radius / max(columns - 1, 1)
+    return [("Grid", Vector(((index % columns - (columns - 1) / 2) * spacing,
+                             (index // columns - (rows - 1) / 2) * spacing, height)))
+            for index in range(count)]
+
+# Share of the rig energy per light of each role
+LIGHT_ROLE_WEIGHTS = {"Key": 1.0, "Fill": 0.4, "Rim": 0.7}
+
+class CreateLightRig(Operator):
+    """Create a rig of lights around the 3D cursor, sharing one light datablock per role"""
+    bl_idname = "epictoolbag.create_light_rig"
+    bl_label = "Create Light Rig"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    rig_type: EnumProperty(
+        name="Rig",
+        items=[
+            ('THREE_POINT', "Three Point", "Key, fill and rim lights"),
+            ('RING', "Ring", "Lights on a circle around the target"),
+            ('DOME', "Dome", "Lights spread over a hemisphere"),
+            ('GRID', "Grid", "Overhead grid of area lights"),
+        ],
+        default='THREE_POINT'
+    )
+
+    count: IntProperty(
+        name="Lights",
+        description="Number of lights (ring, dome and grid rigs)",
+        default=8,
+        min=1,
+        max=1024
+    )
+
+    light_type: EnumProperty(
+        name="Type",
+        items=[
+            ('AREA', "Area", ""),
+            ('POINT', "Point", ""),
+            ('SPOT', "Spot", ""),
+        ],
+        default='AREA'
+    )
+
+    radius: FloatProperty(
+        name="Radius",
+        default=5.0,
+        min=0.1,
+        unit='LENGTH'
+    )
+
+    height: FloatProperty(
+        name="Height",
+        default=3.0,
+        unit='LENGTH'
+    )
+
+    total_energy: FloatProperty(
+        name="Total Power",
+        description="Power of the whole rig, divided among its lights so adding lights keeps the exposure",
+        default=2000.0,
+        min=0.0,
+        unit='POWER'
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        target = context.scene.cursor.location.copy()
+        layout = light_rig_layout(self.rig_type, self.count, self.radius, self.height)
+
+        # Energy normalization: every role gets its weighted share of the total, split over its lights
+        role_counts = {}
+        for role, _position in layout:
+            role_counts[role] = role_counts.get(role, 0) + 1
+        total_weight = sum(LIGHT_ROLE_WEIGHTS.get(role, 1.0) * role_count for role, role_count in role_counts.items())
+
+        rig_name = f"Light Rig {self.rig_type.replace('_', ' ').title()}"
+        collection = bpy.data.collections.new(rig_name)
+        context.scene.collection.children.link(collection)
+
+        light_datas = {}
+        for role in role_counts:
+            light_data = bpy.data.lights.new(name=f"{rig_name} {role}", type=self.light_type)
+            light_data.energy = self.total_energy * LIGHT_ROLE_WEIGHTS.get(role, 1.0) / total_weight
+            if self.light_type == 'AREA':
+                light_data.size = max(0.1, self.radius * (0.4 if len(layout) <= 3 else 1.5 / math.sqrt(len(layout))))
+            light_datas[role] = light_data
+
+        objects = []
+        for role, position in layout:
+            light_object = bpy.data.objects.new(light_datas[role].name, light_datas[role])
+            light_object.location = target + position
+            direction = -position if position.length > 0 else Vector((0.0, 0.0, -1.0))
+            if self.rig_type == 'GRID':
+                direction = Vector((0.0, 0.0, -1.0))
+            light_object.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+            collection.objects.link(light_object)
+            objects.append(light_object)
+
+        select_only(context, objects)
+        self.report({'INFO'}, f"Created {len(objects)} lights sharing {len(light_datas)} light datablocks.")
+        return {'FINISHED'}
             
 class LightCustomProperties(bpy.types.Panel):
     """Panel for custom light properties"""
@@ -243,6 +1001,176 @@ class CreateCamera(Operator):
         """Log messages for debugging purposes."""
         print(f"[Epic Toolbag - CreateCamera]: {message}")
 
+def selection_bounding_sphere(objects):
+    """World-space bounding sphere (center, radius) of the bounding boxes of some objects."""
+    corners = []
+    for obj in objects:
+        local = np.array([corner[:] for corner in obj.bound_box], dtype=np.float64)
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        corners.append(local @ matrix[:3, :3].T + matrix[:3, 3])
+    corners = np.concatenate(corners)
+    center = (corners.min(axis=0) + corners.max(axis=0)) / 2
+    radius = float(np.linalg.norm(corners - center, axis=1).max())
+    return center, max(radius, 1e-3)
+
+def orbit_transforms(center, radius, frames, revolutions, elevation_start, elevation_end,
+                     distance_start, distance_end, sensor_size, margin):
+    """
+    Precompute every frame of an orbit around a bounding sphere.
+
+    Distances are given in multiples of the sphere radius; the focal length of each frame
+    is solved so the sphere (plus margin) always fills the smaller frame dimension.
+
+    :param sensor_size: Size of the sensor across the smaller frame dimension, in millimeters
+
+    :return: (locations (N, 3), rotations (N, 3) XYZ Euler, lenses (N,))
+    """
+    t = np.arange(frames, dtype=np.float64) / frames
+    azimuth = -np.pi / 2 + 2 * np.pi * revolutions * t
+    elevation = np.radians(elevation_start + (elevation_end - elevation_start) * t)
+    distance = radius * (distance_start + (distance_end - distance_start) * t)
+
+    offsets = np.stack([
+        np.cos(elevation) * np.cos(azimuth),
+        np.cos(elevation) * np.sin(azimuth),
+        np.sin(elevation),
+    ], axis=1) * distance[:, None]
+    locations = center + offsets
+
+    # A camera with Euler (pitch, 0, yaw) looks along (-sin(yaw) sin(pitch), cos(yaw) sin(pitch), -cos(pitch))
+    forward = -offsets / distance[:, None]
+    pitch = np.arccos(np.clip(-forward[:, 2], -1.0, 1.0))
+    yaw = np.unwrap(np.arctan2(-forward[:, 0], forward[:, 1]))
+    rotations = np.stack([pitch, np.zeros(frames), yaw], axis=1)
+
+    half_angle = np.arcsin(np.clip(radius * margin / distance, 1e-6, 0.999))
+    lenses = sensor_size / (2 * np.tan(half_angle))
+    return locations, rotations, lenses
+
+def write_keyframes(action, data_path, index, frames, values):
+    """Write a whole F-Curve in one go instead of one keyframe_insert per frame."""
+    fcurve = action.fcurves.find(data_path, index=index) or action.fcurves.new(data_path, index=index)
+    fcurve.keyframe_points.clear()
+    fcurve.keyframe_points.add(len(frames))
+    coords = np.empty(len(frames) * 2, dtype=np.float32)
+    coords[0::2] = frames
+    coords[1::2] = values
+    fcurve.keyframe_points.foreach_set("co", coords)
+    fcurve.keyframe_points.foreach_set("handle_left", coords)
+    fcurve.keyframe_points.foreach_set("handle_right", coords)
+    linear = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items["LINEAR"].value
+    fcurve.keyframe_points.foreach_set("interpolation", [linear] * len(frames))
+    fcurve.update()
+    return fcurve
+
+class CreateTurntable(Operator):
+    """Create a camera orbiting the selection, framed to its bounding sphere on every frame"""
+    bl_idname = "epictoolbag.create_turntable"
+    bl_label = "Create Turntable"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frames: IntProperty(
+        name="Frames",
+        default=120,
+        min=2,
+        max=100000
+    )
+
+    revolutions: FloatProperty(
+        name="Revolutions",
+        default=1.0,
+        min=0.01
+    )
+
+    elevation_start: FloatProperty(
+        name="Elevation Start",
+        description="Camera elevation above the target in degrees at the first frame",
+        default=20.0,
+        min=-89.0,
+        max=89.0
+    )
+
+    elevation_end: FloatProperty(
+        name="Elevation End",
+        description="Camera elevation above the target in degrees at the last frame",
+        default=20.0,
+        min=-89.0,
+        max=89.0
+    )
+
+    distance_start: FloatProperty(
+        name="Distance Start",
+        description="Orbit radius at the first frame, in multiples of the selection's bounding sphere",
+        default=3.0,
+        min=1.1
+    )
+
+    distance_end: FloatProperty(
+        name="Distance End",
+        description="Orbit radius at the last frame, in multiples of the selection's bounding sphere",
+        default=3.0,
+        min=1.1
+    )
+
+    margin: FloatProperty(
+        name="Margin",
+        description="Extra framing space around the selection",
+        default=1.1,
+        min=1.0,
+        max=3.0
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        objects = [obj for obj in context.selected_objects if obj.type not in {'CAMERA', 'LIGHT'}]
+        if not objects:
+            self.report({'ERROR'}, "Select the objects to orbit around.")
+            return {'CANCELLED'}
+
+        scene = context.scene
+        center, radius = selection_bounding_sphere(objects)
+
+        camera_data = bpy.data.cameras.new(name="Turntable Camera")
+        camera_data.sensor_fit = 'HORIZONTAL'
+        camera_object = bpy.data.objects.new(camera_data.name, camera_data)
+        context.collection.objects.link(camera_object)
+        scene.camera = camera_object
+
+        # The sensor spans the frame width; on landscape frames the height is the tighter fit
+        render = scene.render
+        frame_width = render.resolution_x * render.pixel_aspect_x
+        frame_height = render.resolution_y * render.pixel_aspect_y
+        sensor_size = camera_data.sensor_width * min(frame_width, frame_height) / max(frame_width, 1e-6)
+
+        locations, rotations, lenses = orbit_transforms(
+            center, radius, self.frames, self.revolutions,
+            self.elevation_start, self.elevation_end,
+            self.distance_start, self.distance_end,
+            sensor_size, self.margin
+        )
+        frame_numbers = scene.frame_start + np.arange(self.frames, dtype=np.float32)
+
+        object_action = bpy.data.actions.new(f"{camera_object.name} Orbit")
+        camera_object.animation_data_create().action = object_action
+        for axis in range(3):
+            write_keyframes(object_action, "location", axis, frame_numbers, locations[:, axis])
+            write_keyframes(object_action, "rotation_euler", axis, frame_numbers, rotations[:, axis])
+
+        lens_action = bpy.data.actions.new(f"{camera_data.name} Lens")
+        camera_data.animation_data_create().action = lens_action
+        write_keyframes(lens_action, "lens", 0, frame_numbers, lenses)
+
+        camera_object.location = locations[0]
+        camera_object.rotation_euler = rotations[0]
+        camera_data.lens = lenses[0]
+        scene.frame_end = scene.frame_start + self.frames - 1
+
+        select_only(context, [camera_object])
+        self.report({'INFO'}, f"Turntable with {self.frames} frames created.")
+        return {'FINISHED'}
+
 class RemoveLightCamera(bpy.types.Operator):
     bl_idname = "epictoolbag.remove_light_camera"
     bl_label = "Remove Light/Camera"
@@ -281,16 +1209,18 @@ class RemoveCamera(Operator):
             return {'CANCELLED'}
 
         try:
+            camera_name = camera.name
             bpy.data.objects.remove(camera, do_unlink=True)
-            self.report({'INFO'}, f"Camera '{camera.name}' deleted successfully.")
-            self.log_message(f"Camera '{camera.name}' deleted.")
-
-            for obj in scene.objects:
-                if obj.type == 'CAMERA':
-                    scene.camera = obj
-                    self.report({'INFO'}, f"Camera '{obj.name}' set as active.")
-                    self.log_message(f"Camera '{obj.name}' set as active.")
-                    break
+            self.report({'INFO'}, f"Camera '{camera_name}' deleted successfully.")
+            self.log_message(f"Camera '{camera_name}' deleted.")
+
+            index = get_scene_index(scene)
+            index.remove_object(camera_name)
+            obj = index.first_camera(scene, exclude=(camera_name,))
+            if obj is not None:
+                scene.camera = obj
+                self.report({'INFO'}, f"Camera '{obj.name}' set as active.")
+                self.log_message(f"Camera '{obj.name}' set as active.")
             else:
                 scene.camera = None
                 self.report({'WARNING'}, "No camera left in the scene.")
@@ -337,30 +1267,65 @@ class NavigateHDRI(Operator):
 
         if self.direction == 'NEXT':
             # Vai para o próximo HDRI, voltando ao início se chegar ao fim
-            next_index = (current_index + 1) % len(hdri_list)
-            context.scene.hdri_enum = hdri_list[next_index]
+            new_index = (current_index + 1) % len(hdri_list)
         else:
             # Vai para o HDRI anterior, voltando ao fim se chegar ao início
-            prev_index = (current_index - 1 + len(hdri_list)) % len(hdri_list)
-            context.scene.hdri_enum = hdri_list[prev_index]
+            new_index = (current_index - 1 + len(hdri_list)) % len(hdri_list)
+        context.scene.hdri_enum = hdri_list[new_index]
 
+        self.prefetch_neighbours(context, hdri_list, new_index)
         return {'FINISHED'}
 
+    def prefetch_neighbours(self, context, hdri_list, index):
+        """Read the current HDRI and the ones around it in the background."""
+        pcoll_paths = preview_collections.get("hdri_paths", {})
+        step = 1 if self.direction == 'NEXT' else -1
+        # The current one first, then the next one in the browsing direction, then the other side
+        names = [hdri_list[(index + offset) % len(hdri_list)] for offset in (0, step, -step)]
+        paths = [pcoll_paths[name] for name in dict.fromkeys(names) if name in pcoll_paths]
+
+        cache = get_prefetch_cache()
+        addon_prefs = context.preferences.addons[__package__].preferences
+        cache.budget = getattr(addon_prefs, "hdri_prefetch_budget", 512) * 1024 * 1024
+        cache.prefetch(paths, PROXY_WIDTHS.get(context.scene.hdri_proxy_resolution))
+
 classes = [
     AddOrApplyHDRI, 
+    RescanHDRILibrary,
+    AlignHDRISunToLight,
+    HDRIContactSheet,
+    TiledRender,
+    ApplyRenderProfile,
+    BenchmarkRenderProfiles,
     RemoveHDRI, 
     CreateLight, 
+    CreateLightRig,
     RemoveLight, 
     CreateCamera, 
+    CreateTurntable,
     RemoveCamera, 
     NavigateHDRI,
 ]
 
+render_handlers = [
+    (bpy.app.handlers.render_init, swap_in_full_resolution_hdri),
+    (bpy.app.handlers.render_pre, swap_in_full_resolution_hdri),
+    (bpy.app.handlers.render_complete, swap_out_full_resolution_hdri),
+    (bpy.app.handlers.render_cancel, swap_out_full_resolution_hdri),
+]
+
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    for handlers, handler in render_handlers:
+        if handler not in handlers:
+            handlers.append(handler)
 
 def unregister():
+    for handlers, handler in render_handlers:
+        if handler in handlers:
+            handlers.remove(handler)
+    clear_prefetch_cache()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
@@ -0,0 +1,236 @@
+import bpy
+import os
+import json
+import time
+import shutil
+from bpy.types import Operator
+from bpy.app.handlers import persistent
+from .utils import get_cache_dir, scene_state_hash, write_replacing
+from .background import show_image
+
+def log_message(message):
+    print(f"[Epic Toolbag - RenderCache]: {message}")
+
+class RenderCache:
+    """
+    On-disk store of rendered images keyed by the scene-state hash.
+
+    Entries are evicted least recently used first once the store exceeds its size cap.
+    Hit/miss counts are kept in the same index file, so they survive restarts.
+    """
+
+    def __init__(self, cache_dir=None, max_size_mb=2048):
+        self.cache_dir = cache_dir or get_cache_dir("render_cache")
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.max_size = max_size_mb * 1024 * 1024
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.entries = data.get("entries", {})
+        self.hits = data.get("hits", 0)
+        self.misses = data.get("misses", 0)
+
+    def save(self):
+        data = json.dumps({"entries": self.entries, "hits": self.hits, "misses": self.misses})
+        try:
+            write_replacing(self.index_path, lambda f: f.write(data.encode('utf-8')))
+        except OSError as e:
+            log_message(f"Failed to save index: {e}")
+
+    def lookup(self, state_hash):
+        """
+        Get the cached render for a scene state, counting the hit or miss.
+
+        :param state_hash: Hash from scene_state_hash
+        :return: Path of the cached image or None
+        """
+        entry = self.entries.get(state_hash)
+        if entry and os.path.exists(entry["path"]):
+            entry["last_used"] = time.time()
+            self.hits += 1
+            self.save()
+            return entry["path"]
+
+        self.entries.pop(state_hash, None)
+        self.misses += 1
+        self.save()
+        return None
+
+    def store(self, state_hash, source_path):
+        """
+        Move a rendered image into the cache.
+
+        :param state_hash: Hash from scene_state_hash
+        :param source_path: Rendered image file
+        :return: Path of the cached image
+        """
+        cached_path = os.path.join(self.cache_dir, state_hash + os.path.splitext(source_path)[1])
+        shutil.move(source_path, cached_path)
+        self.entries[state_hash] = {
+            "path": cached_path,
+            "size": os.path.getsize(cached_path),
+            "last_used": time.time(),
+        }
+        self.evict()
+        self.save()
+        return cached_path
+
+    def evict(self):
+        total = sum(entry["size"] for entry in self.entries.values())
+        for state_hash, entry in sorted(self.entries.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(entry["path"])
+            except OSError:
+                pass
+            total -= entry["size"]
+            del self.entries[state_hash]
+
+    def clear(self):
+        for entry in self.entries.values():
+            try:
+                os.remove(entry["path"])
+            except OSError:
+                pass
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.save()
+
+    @property
+    def size(self):
+        return sum(entry["size"] for entry in self.entries.values())
+
+_render_cache = None
+
+def get_render_cache(context=None):
+    """Get the shared render cache, applying the size cap from the add-on preferences."""
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = RenderCache()
+    context = context or bpy.context
+    try:
+        addon_prefs = context.preferences.addons[__package__].preferences
+        _render_cache.max_size = addon_prefs.render_cache_size_mb * 1024 * 1024
+    except (KeyError, AttributeError):
+        pass
+    return _render_cache
+
+# Scene name -> scene-state hash of the render currently running because of a cache miss.
+# The handlers stay registered and only act while it holds an entry; render_complete and
+# render_cancel pass no scene, so the scene is taken from here.
+pending_render = {}
+
+@persistent
+def store_finished_render(*args):
+    if not pending_render:
+        return
+    scene_name, state_hash = pending_render.popitem()
+    scene = bpy.data.scenes.get(scene_name)
+    if scene is None:
+        return
+
+    render_path = os.path.join(get_cache_dir("render_cache"), "pending" + scene.render.file_extension)
+    try:
+        bpy.data.images['Render Result'].save_render(filepath=render_path, scene=scene)
+        get_render_cache().store(state_hash, render_path)
+    except (KeyError, RuntimeError, OSError) as e:
+        log_message(f"Failed to cache render: {e}")
+
+@persistent
+def discard_cancelled_render(*args):
+    pending_render.clear()
+
+render_handlers = (
+    (bpy.app.handlers.render_complete, store_finished_render),
+    (bpy.app.handlers.render_cancel, discard_cancelled_render),
+)
+
+class CachedRender(Operator):
+    """Render the current frame, reusing a cached result when nothing visible has changed"""
+    bl_idname = "epictoolbag.cached_render"
+    bl_label = "Cached Render"
+
+    def execute(self, context):
+        scene = context.scene
+        if scene.camera is None:
+            self.report({'ERROR'}, "The scene has no active camera.")
+            return {'CANCELLED'}
+        if pending_render:
+            self.report({'WARNING'}, "A render is already running.")
+            return {'CANCELLED'}
+
+        start_time = time.time()
+        state_hash = scene_state_hash(scene)
+        cache = get_render_cache(context)
+        cached_path = cache.lookup(state_hash)
+
+        if cached_path:
+            previous = bpy.data.images.get("Cached Render")
+            if previous is not None:
+                bpy.data.images.remove(previous)
+            image = bpy.data.images.load(cached_path)
+            image.name = "Cached Render"
+            if not show_image(context, image):
+                self.report({'WARNING'}, "Render cache hit, but no Image Editor could be opened; "
+                                         "the result is in the image \"Cached Render\".")
+                return {'FINISHED'}
+            self.report({'INFO'}, f"Render cache hit ({time.time() - start_time:.2f}s, "
+                                  f"{cache.hits} hits / {cache.misses} misses).")
+            return {'FINISHED'}
+
+        pending_render[scene.name] = state_hash
+        result = bpy.ops.render.render('INVOKE_DEFAULT')
+        if 'CANCELLED' in result:
+            # The render never started (e.g. another render job is running): nothing will finish it
+            pending_render.clear()
+            self.report({'WARNING'}, "The render could not be started.")
+        return result
+
+class ClearRenderCache(Operator):
+    bl_idname = "epictoolbag.clear_render_cache"
+    bl_label = "Clear Render Cache"
+
+    def execute(self, context):
+        get_render_cache(context).clear()
+        self.report({'INFO'}, "Render cache cleared.")
+        return {'FINISHED'}
+
+def draw_render_cache_stats(layout, context):
+    cache = get_render_cache(context)
+    row = layout.row(align=True)
+    row.label(text=f"Cache: {cache.hits} hits / {cache.misses} misses, {cache.size / (1024 * 1024):.0f} MB",
+              icon='FILE_CACHE')
+    row.operator("epictoolbag.clear_render_cache", text="", icon='TRASH')
+
+classes = [
+    CachedRender,
+    ClearRenderCache,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    for handlers, handler in render_handlers:
+        if handler not in handlers:
+            handlers.append(handler)
+
+def unregister():
+    for handlers, handler in render_handlers:
+        if handler in handlers:
+            handlers.remove(handler)
+    pending_render.clear()
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+if __name__ == "__main__":
+    register()
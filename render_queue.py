@@ -0,0 +1,376 @@
+import bpy
+import os
+import json
+import time
+import uuid
+import shutil
+import tempfile
+from bpy.types import Operator, PropertyGroup, UIList
+from bpy.props import (
+    StringProperty, EnumProperty, IntProperty, FloatProperty,
+    BoolProperty, PointerProperty, CollectionProperty
+)
+from .panels import preview_collections
+from .background import RenderWorkerPool, default_worker_count, save_scene_copy
+
+def log_message(message):
+    print(f"[Epic Toolbag - RenderQueue]: {message}")
+
+def poll_camera(self, obj):
+    return obj.type == 'CAMERA'
+
+class RenderQueueJob(PropertyGroup):
+    job_id: StringProperty(name="Job ID")
+    enabled: BoolProperty(name="Enabled", default=True)
+    camera: PointerProperty(name="Camera", type=bpy.types.Object, poll=poll_camera)
+    hdri_path: StringProperty(name="HDRI", subtype='FILE_PATH', description="HDRI used for this job (empty keeps the scene world)")
+    resolution_x: IntProperty(name="X", default=1920, min=4, max=65536)
+    resolution_y: IntProperty(name="Y", default=1080, min=4, max=65536)
+    resolution_percentage: IntProperty(name="%", default=100, min=1, max=100)
+    engine: StringProperty(name="Engine", default="")
+    samples: IntProperty(name="Samples", default=0, min=0, description="Render samples (0 keeps the scene setting)")
+    status: EnumProperty(
+        name="Status",
+        items=[
+            ('QUEUED', "Queued", "", 'TIME', 0),
+            ('RUNNING', "Running", "", 'RENDER_STILL', 1),
+            ('DONE', "Done", "", 'CHECKMARK', 2),
+            ('FAILED', "Failed", "", 'ERROR', 3),
+        ],
+        default='QUEUED'
+    )
+    attempts: IntProperty(name="Attempts", default=0)
+    seconds: FloatProperty(name="Time", default=0.0)
+    output: StringProperty(name="Output", subtype='FILE_PATH')
+    error: StringProperty(name="Error")
+
+    def label(self):
+        camera_name = self.camera.name if self.camera else "Scene Camera"
+        hdri_name = os.path.splitext(os.path.basename(self.hdri_path))[0] if self.hdri_path else "World"
+        return f"{camera_name} · {hdri_name} · {self.resolution_x}x{self.resolution_y}"
+
+class RenderQueueSettings(PropertyGroup):
+    jobs: CollectionProperty(type=RenderQueueJob)
+    active_index: IntProperty(default=0)
+    max_workers: IntProperty(
+        name="Workers",
+        description="Number of background Blender processes rendering at the same time",
+        default=default_worker_count(),
+        min=1,
+        max=64
+    )
+    max_retries: IntProperty(
+        name="Retries",
+        description="How many times a failed job is retried",
+        default=1,
+        min=0,
+        max=10
+    )
+    output_dir: StringProperty(
+        name="Output Folder",
+        subtype='DIR_PATH',
+        default="//render_queue/"
+    )
+
+class EPICTOOLBAG_UL_render_queue(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "enabled", text="")
+        row.label(text=item.label(), icon=item.bl_rna.properties['status'].enum_items[item.status].icon)
+        if item.status == 'DONE':
+            row.label(text=f"{item.seconds:.1f}s")
+
+class AddRenderQueueJobs(Operator):
+    """Queue a render for every combination of the chosen cameras and HDRIs"""
+    bl_idname = "epictoolbag.add_render_queue_jobs"
+    bl_label = "Add Render Jobs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    camera_scope: EnumProperty(
+        name="Cameras",
+        items=[
+            ('ACTIVE', "Active Camera", "Only the scene camera"),
+            ('ALL', "All Cameras", "Every camera in the scene"),
+        ],
+        default='ALL'
+    )
+
+    hdri_scope: EnumProperty(
+        name="HDRIs",
+        items=[
+            ('WORLD', "Current World", "Keep the scene world"),
+            ('SELECTED', "Selected HDRI", "The HDRI selected in the Render tab"),
+            ('LIBRARY', "Whole Library", "Every HDRI in the library"),
+        ],
+        default='SELECTED'
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        scene = context.scene
+        queue = scene.epic_render_queue
+
+        if self.camera_scope == 'ALL':
+            cameras = [obj for obj in scene.objects if obj.type == 'CAMERA']
+        else:
+            cameras = [scene.camera] if scene.camera else []
+        if not cameras:
+            self.report({'ERROR'}, "No camera to render.")
+            return {'CANCELLED'}
+
+        pcoll_paths = preview_collections.get("hdri_paths", {})
+        if self.hdri_scope == 'LIBRARY':
+            hdri_paths = list(pcoll_paths.values())
+        elif self.hdri_scope == 'SELECTED':
+            hdri_paths = [pcoll_paths[scene.hdri_enum]] if scene.hdri_enum in pcoll_paths else []
+        else:
+            hdri_paths = [""]
+        if not hdri_paths:
+            self.report({'ERROR'}, "No HDRI selected.")
+            return {'CANCELLED'}
+
+        render = scene.render
+        for camera in cameras:
+            for hdri_path in hdri_paths:
+                job = queue.jobs.add()
+                job.job_id = uuid.uuid4().hex
+                job.camera = camera
+                job.hdri_path = hdri_path
+                job.resolution_x = render.resolution_x
+                job.resolution_y = render.resolution_y
+                job.resolution_percentage = render.resolution_percentage
+                job.engine = render.engine
+
+        queue.active_index = len(queue.jobs) - 1
+        self.report({'INFO'}, f"Added {len(cameras) * len(hdri_paths)} render jobs.")
+        return {'FINISHED'}
+
+class RemoveRenderQueueJob(Operator):
+    bl_idname = "epictoolbag.remove_render_queue_job"
+    bl_label = "Remove Render Job"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    clear_all: BoolProperty(default=False)
+
+    def execute(self, context):
+        queue = context.scene.epic_render_queue
+        if self.clear_all:
+            queue.jobs.clear()
+        elif 0 <= queue.active_index < len(queue.jobs):
+            queue.jobs.remove(queue.active_index)
+        queue.active_index = min(queue.active_index, max(len(queue.jobs) - 1, 0))
+        return {'FINISHED'}
+
+class RunRenderQueue(Operator):
+    """Render the queued jobs in parallel background Blender processes"""
+    bl_idname = "epictoolbag.run_render_queue"
+    bl_label = "Run Render Queue"
+
+    _timer = None
+    _pool = None
+    _work_dir = None
+
+    def execute(self, context):
+        scene = context.scene
+        queue = scene.epic_render_queue
+        jobs = [job for job in queue.jobs if job.enabled and job.status != 'DONE']
+        if not jobs:
+            self.report({'WARNING'}, "No pending render jobs.")
+            return {'CANCELLED'}
+
+        self.output_dir = bpy.path.abspath(queue.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        self._work_dir = tempfile.mkdtemp(prefix="epictoolbag_queue_")
+        blend_path = save_scene_copy(os.path.join(self._work_dir, "scene.blend"))
+        self._pool = RenderWorkerPool(blend_path, self._work_dir, queue.max_workers)
+
+        # One process per job, so the worker limit is the number of jobs rendering at once
+        self.tasks = {}
+        for job in jobs:
+            task = self.make_task(job)
+            self.tasks[job.job_id] = task
+            job.status = 'QUEUED'
+            job.attempts = 0
+            job.error = ""
+            self._pool.add([task])
+
+        self.start_time = time.time()
+        self.remaining = len(jobs)
+        wm = context.window_manager
+        wm.progress_begin(0, self.remaining)
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+        self.report({'INFO'}, f"Rendering {self.remaining} jobs with {queue.max_workers} workers...")
+        return {'RUNNING_MODAL'}
+
+    def make_task(self, job):
+        hdri_name = os.path.splitext(os.path.basename(job.hdri_path))[0] if job.hdri_path else "world"
+        camera_name = job.camera.name if job.camera else "camera"
+        file_name = bpy.path.clean_name(f"{camera_name}_{hdri_name}_{job.resolution_x}x{job.resolution_y}_{job.engine}")
+        task = {
+            "id": job.job_id,
+            "camera": job.camera.name if job.camera else None,
+            "resolution": [job.resolution_x, job.resolution_y],
+            "percentage": job.resolution_percentage,
+            "engine": job.engine or None,
+            "samples": job.samples or None,
+            "file_format": 'PNG',
+            "output": os.path.join(self.output_dir, file_name + ".png"),
+        }
+        if job.hdri_path:
+            task["hdri"] = bpy.path.abspath(job.hdri_path)
+            task["hdri_rotation"] = bpy.context.scene.hdri_rotation_degrees
+        return task
+
+    def find_job(self, queue, job_id):
+        return next((job for job in queue.jobs if job.job_id == job_id), None)
+
+    def modal(self, context, event):
+        queue = context.scene.epic_render_queue
+
+        if event.type == 'ESC':
+            self._pool.cancel()
+            for job in queue.jobs:
+                if job.status == 'RUNNING':
+                    job.status = 'QUEUED'
+            self.finish(context, cancelled=True)
+            self.report({'WARNING'}, "Render queue cancelled.")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        for progress in self._pool.update():
+            job = self.find_job(queue, progress.get("task"))
+            if job is None:
+                continue
+            kind = progress.get("event")
+            if kind == "start":
+                job.status = 'RUNNING'
+            elif kind == "done":
+                job.status = 'DONE'
+                job.attempts += 1
+                job.seconds = progress.get("seconds", 0.0)
+                job.output = progress.get("output", "")
+                self.remaining -= 1
+            elif kind == "error":
+                job.error = progress.get("error", "")
+                job.attempts += 1
+                if job.attempts <= queue.max_retries:
+                    log_message(f"Retrying '{job.label()}': {job.error}")
+                    job.status = 'QUEUED'
+                    self._pool.add([self.tasks[job.job_id]])
+                else:
+                    job.status = 'FAILED'
+                    self.remaining -= 1
+
+        context.window_manager.progress_update(len(self.tasks) - self.remaining)
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+        if not self._pool.finished:
+            return {'PASS_THROUGH'}
+
+        self.finish(context)
+        failed = sum(1 for job in queue.jobs if job.job_id in self.tasks and job.status == 'FAILED')
+        self.report({'WARNING'} if failed else {'INFO'},
+                    f"Render queue finished in {time.time() - self.start_time:.1f}s ({failed} failed).")
+        return {'FINISHED'}
+
+    def finish(self, context, cancelled=False):
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        self.write_manifest(context.scene.epic_render_queue, cancelled)
+        if self._work_dir:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+
+    def write_manifest(self, queue, cancelled):
+        manifest = {
+            "blend_file": bpy.data.filepath,
+            "cancelled": cancelled,
+            "total_seconds": time.time() - self.start_time,
+            "workers": queue.max_workers,
+            "jobs": [
+                {
+                    "camera": job.camera.name if job.camera else None,
+                    "hdri": job.hdri_path,
+                    "resolution": [job.resolution_x, job.resolution_y, job.resolution_percentage],
+                    "engine": job.engine,
+                    "status": job.status,
+                    "attempts": job.attempts,
+                    "seconds": job.seconds,
+                    "output": job.output,
+                    "error": job.error,
+                }
+                for job in queue.jobs if job.job_id in self.tasks
+            ],
+        }
+        manifest_path = os.path.join(self.output_dir, "manifest.json")
+        try:
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+        except OSError as e:
+            log_message(f"Failed to write manifest: {e}")
+
+def draw_render_queue(layout, context):
+    queue = context.scene.epic_render_queue
+
+    col = layout.column(align=True)
+    col.label(text="Render Queue:")
+    row = col.row()
+    row.template_list("EPICTOOLBAG_UL_render_queue", "", queue, "jobs", queue, "active_index", rows=3)
+    side = row.column(align=True)
+    side.operator("epictoolbag.add_render_queue_jobs", text="", icon='ADD')
+    side.operator("epictoolbag.remove_render_queue_job", text="", icon='REMOVE')
+    side.operator("epictoolbag.remove_render_queue_job", text="", icon='TRASH').clear_all = True
+
+    if 0 <= queue.active_index < len(queue.jobs):
+        job = queue.jobs[queue.active_index]
+        box = col.box()
+        box.prop(job, "camera")
+        box.prop(job, "hdri_path", text="")
+        row = box.row(align=True)
+        row.prop(job, "resolution_x")
+        row.prop(job, "resolution_y")
+        row.prop(job, "resolution_percentage")
+        box.prop(job, "samples")
+        if job.error:
+            box.label(text=job.error, icon='ERROR')
+
+    col.prop(queue, "output_dir", text="")
+    row = col.row(align=True)
+    row.prop(queue, "max_workers")
+    row.prop(queue, "max_retries")
+    row = col.row(align=True)
+    row.scale_y = 1.5
+    row.operator("epictoolbag.run_render_queue", text="Render Queue", icon='RENDER_ANIMATION')
+
+classes = [
+    RenderQueueJob,
+    RenderQueueSettings,
+    EPICTOOLBAG_UL_render_queue,
+    AddRenderQueueJobs,
+    RemoveRenderQueueJob,
+    RunRenderQueue,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.epic_render_queue = PointerProperty(type=RenderQueueSettings)
+
+def unregister():
+    del bpy.types.Scene.epic_render_queue
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+if __name__ == "__main__":
+    register()
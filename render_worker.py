@@ -0,0 +1,147 @@
+'''
+    Epic Toolbag background render worker.
+
+    Not part of the add-on registration: Epic Toolbag runs this script inside background
+    Blender processes (blender -b scene.blend --python render_worker.py -- tasks.json).
+    Each task renders one still, and progress is reported on stdout as one
+    "EPICTOOLBAG_PROGRESS {json}" line per event so the add-on can follow it over the pipe.
+'''
+
+import bpy
+import json
+import math
+import os
+import sys
+import time
+
+PROGRESS_PREFIX = "EPICTOOLBAG_PROGRESS "
+
+def report(**payload):
+    print(PROGRESS_PREFIX + json.dumps(payload), flush=True)
+
+TASK_WORLD_NAME = "Epic Toolbag Task World"
+
+def apply_hdri(scene, hdri_path, rotation_degrees=0.0, strength=1.0):
+    # Build the HDRI in a world of its own so later tasks without an HDRI still get the scene's world
+    world = bpy.data.worlds.get(TASK_WORLD_NAME) or bpy.data.worlds.new(TASK_WORLD_NAME)
+    scene.world = world
+    world.use_nodes = True
+    nodes = world.node_tree.nodes
+    links = world.node_tree.links
+    nodes.clear()
+
+    tex_coord_node = nodes.new('ShaderNodeTexCoord')
+    mapping_node = nodes.new('ShaderNodeMapping')
+    env_tex_node = nodes.new('ShaderNodeTexEnvironment')
+    background_node = nodes.new('ShaderNodeBackground')
+    output_node = nodes.new('ShaderNodeOutputWorld')
+    links.new(tex_coord_node.outputs['Object'], mapping_node.inputs['Vector'])
+    links.new(mapping_node.outputs['Vector'], env_tex_node.inputs['Vector'])
+    links.new(env_tex_node.outputs['Color'], background_node.inputs['Color'])
+    links.new(background_node.outputs['Background'], output_node.inputs['Surface'])
+
+    env_tex_node.image = bpy.data.images.load(hdri_path, check_existing=True)
+    # The add-on's render_init/render_pre handlers swap in the image of this path for the proxy; point it
+    # at the task HDRI or it loads the main scene's HDRI back in
+    world["epictoolbag_hdri_path"] = hdri_path
+    mapping_node.inputs['Rotation'].default_value[2] = math.radians(rotation_degrees)
+    background_node.inputs['Strength'].default_value = strength
+
+def environment_path(scene):
+    world = scene.world
+    if world is None or not world.use_nodes:
+        return None
+    env_tex_node = next((node for node in world.node_tree.nodes if node.type == 'TEX_ENVIRONMENT'), None)
+    if env_tex_node is None or env_tex_node.image is None:
+        return None
+    return os.path.normpath(bpy.path.abspath(env_tex_node.image.filepath))
+
+# Environment image of the render in progress, as seen after every render_pre handler ran
+rendered_environment = {}
+
+def record_environment(scene, *args):
+    rendered_environment["path"] = environment_path(scene)
+
+def check_environment(task):
+    """Fail a task whose frame was rendered with another HDRI than the one it asked for."""
+    if not task.get("hdri"):
+        return
+    rendered = rendered_environment.get("path")
+    if rendered != os.path.normpath(task["hdri"]):
+        raise RuntimeError(f"Rendered with HDRI {rendered} instead of {task['hdri']}")
+
+def apply_task(scene, task, scene_world=None):
+    render = scene.render
+
+    if task.get("camera"):
+        scene.camera = bpy.data.objects[task["camera"]]
+    if task.get("hdri"):
+        apply_hdri(scene, task["hdri"], task.get("hdri_rotation", 0.0), task.get("hdri_strength", 1.0))
+    else:
+        scene.world = scene_world
+    if task.get("engine"):
+        render.engine = task["engine"]
+    if task.get("resolution"):
+        render.resolution_x, render.resolution_y = task["resolution"]
+    if task.get("percentage"):
+        render.resolution_percentage = task["percentage"]
+    if task.get("samples"):
+        if render.engine == 'CYCLES':
+            scene.cycles.samples = task["samples"]
+        else:
+            scene.eevee.taa_render_samples = task["samples"]
+
+    if "transparent" in task:
+        render.film_transparent = task["transparent"]
+
+    border = task.get("border")
+    render.use_border = border is not None
+    render.use_crop_to_border = border is not None
+    if border:
+        render.border_min_x, render.border_max_x, render.border_min_y, render.border_max_y = border
+
+    label = task.get("label")
+    render.use_stamp = bool(label)
+    if label:
+        # Burn the label into the frame with the stamp note only
+        for field in ("date", "time", "render_time", "frame", "frame_range", "memory", "hostname",
+                      "camera", "lens", "scene", "marker", "filename", "sequencer_strip"):
+            if hasattr(render, f"use_stamp_{field}"):
+                setattr(render, f"use_stamp_{field}", False)
+        render.use_stamp_note = True
+        render.stamp_note_text = label
+
+    render.image_settings.file_format = task.get("file_format", 'PNG')
+    if render.image_settings.file_format == 'OPEN_EXR':
+        render.image_settings.color_depth = '32'
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if not argv:
+        report(event="fatal", error="No task file given")
+        return
+
+    with open(argv[0], 'r', encoding='utf-8') as f:
+        tasks = json.load(f)["tasks"]
+
+    scene = bpy.context.scene
+    scene_world = scene.world
+    # Appended after the add-on's handlers, so it sees the image that is actually rendered
+    bpy.app.handlers.render_pre.append(record_environment)
+    for task in tasks:
+        start_time = time.time()
+        report(event="start", task=task["id"])
+        try:
+            os.makedirs(os.path.dirname(task["output"]), exist_ok=True)
+            apply_task(scene, task, scene_world)
+            rendered_environment.clear()
+            bpy.ops.render.render()
+            check_environment(task)
+            # save_render writes exactly task["output"]; write_still would append frame numbers
+            bpy.data.images['Render Result'].save_render(filepath=task["output"], scene=scene)
+            report(event="done", task=task["id"], output=task["output"], seconds=time.time() - start_time)
+        except Exception as e:
+            report(event="error", task=task["id"], error=str(e), seconds=time.time() - start_time)
+
+if __name__ == "__main__":
+    main()
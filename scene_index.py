@@ -0,0 +1,231 @@
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+
+def log_message(message):
+    print(f"[Epic Toolbag - SceneIndex]: {message}")
+
+class SceneIndex:
+    """
+    Type and spatial index of the objects of one scene.
+
+    Cameras and lights are kept in insertion-ordered dicts, and the world-space bounding box of
+    every object is stored in a uniform grid. Transform and geometry updates patch single objects
+    from the depsgraph handler; adding or removing objects marks the index for a rebuild on the
+    next query, so nothing walks the scene per click.
+    """
+
+    def __init__(self, scene_name, cell_size=4.0, max_cells_per_object=512):
+        self.scene_name = scene_name
+        self.cell_size = cell_size
+        self.max_cells_per_object = max_cells_per_object
+        self.dirty = True
+        self.object_count = 0
+        self.clear()
+
+    def clear(self):
+        self.cameras = {}
+        self.lights = {}
+        self.bounds = {}
+        self.cells = {}
+        self.object_cells = {}
+        # Objects spanning too many cells (ground planes, ...) are checked on every query
+        self.large = set()
+        self._scene_bounds = None
+
+    def rebuild(self, scene):
+        self.clear()
+        for obj in scene.objects:
+            self.update_object(obj)
+        self.object_count = len(bpy.data.objects)
+        self.dirty = False
+
+    def ensure(self, scene):
+        if self.dirty:
+            self.rebuild(scene)
+
+    def world_bounds(self, obj):
+        corners = np.array([corner[:] for corner in obj.bound_box], dtype=np.float64)
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        world = corners @ matrix[:3, :3].T + matrix[:3, 3]
+        return world.min(axis=0), world.max(axis=0)
+
+    def update_object(self, obj):
+        name = obj.name
+        self.remove_object(name)
+
+        if obj.type == 'CAMERA':
+            self.cameras[name] = None
+        elif obj.type == 'LIGHT':
+            self.lights[name] = None
+
+        bounds = self.world_bounds(obj)
+        self.bounds[name] = bounds
+        low = np.floor(bounds[0] / self.cell_size).astype(int)
+        high = np.floor(bounds[1] / self.cell_size).astype(int)
+        if np.prod(high - low + 1) > self.max_cells_per_object:
+            self.large.add(name)
+            self.object_cells[name] = ()
+        else:
+            keys = [(x, y, z) for x in range(low[0], high[0] + 1)
+                    for y in range(low[1], high[1] + 1)
+                    for z in range(low[2], high[2] + 1)]
+            for key in keys:
+                self.cells.setdefault(key, set()).add(name)
+            self.object_cells[name] = keys
+        self._scene_bounds = None
+
+    def remove_object(self, name):
+        self.cameras.pop(name, None)
+        self.lights.pop(name, None)
+        self.large.discard(name)
+        for key in self.object_cells.pop(name, ()):
+            cell = self.cells.get(key)
+            if cell is not None:
+                cell.discard(name)
+                if not cell:
+                    del self.cells[key]
+        if self.bounds.pop(name, None) is not None:
+            self._scene_bounds = None
+
+    def first_camera(self, scene, exclude=()):
+        """
+        Get a camera of the scene without scanning its objects.
+
+        :param scene: Indexed scene
+        :param exclude: Camera names to skip
+        :return: Camera object or None
+        """
+        self.ensure(scene)
+        for name in list(self.cameras):
+            if name in exclude:
+                continue
+            obj = scene.objects.get(name)
+            if obj is not None and obj.type == 'CAMERA':
+                return obj
+            # Stale entry (renamed or deleted since the last update)
+            self.dirty = True
+        if self.dirty:
+            self.rebuild(scene)
+            return next((scene.objects[name] for name in self.cameras if name not in exclude), None)
+        return None
+
+    def light_objects(self, scene):
+        self.ensure(scene)
+        lights = [scene.objects.get(name) for name in self.lights]
+        return [obj for obj in lights if obj is not None and obj.type == 'LIGHT']
+
+    def scene_bounds(self, scene, exclude_types=('LIGHT', 'CAMERA')):
+        """World-space (min, max) of all indexed objects except lights and cameras, or None."""
+        self.ensure(scene)
+        if self._scene_bounds is None:
+            skip = set()
+            if 'LIGHT' in exclude_types:
+                skip.update(self.lights)
+            if 'CAMERA' in exclude_types:
+                skip.update(self.cameras)
+            boxes = [bounds for name, bounds in self.bounds.items() if name not in skip]
+            if not boxes:
+                return None
+            self._scene_bounds = (np.min([box[0] for box in boxes], axis=0),
+                                  np.max([box[1] for box in boxes], axis=0))
+        return self._scene_bounds
+
+    def query_box(self, scene, box_min, box_max):
+        """Names of the objects whose bounding boxes overlap a world-space box."""
+        self.ensure(scene)
+        low = np.floor(np.asarray(box_min) / self.cell_size).astype(int)
+        high = np.floor(np.asarray(box_max) / self.cell_size).astype(int)
+        candidates = set(self.large)
+        for x in range(low[0], high[0] + 1):
+            for y in range(low[1], high[1] + 1):
+                for z in range(low[2], high[2] + 1):
+                    candidates.update(self.cells.get((x, y, z), ()))
+        return [name for name in candidates
+                if np.all(self.bounds[name][0] <= box_max) and np.all(self.bounds[name][1] >= box_min)]
+
+    def find_clear_position(self, scene, center, direction, clearance=1.0, radius=0.5, steps=16):
+        """
+        Find a position along a direction from center that is outside the scene bounds
+        and clear of any object's bounding box.
+
+        :param center: World-space start point
+        :param direction: Unit direction to move along
+        :param clearance: Distance kept from the scene bounds
+        :param radius: Half size of the box that must stay free around the position
+        :return: Position as a NumPy array
+        """
+        center = np.asarray(center, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+        direction = direction / max(np.linalg.norm(direction), 1e-9)
+
+        distance = clearance
+        bounds = self.scene_bounds(scene)
+        if bounds is not None:
+            # Start where the ray leaves the scene bounds grown by the clearance
+            low, high = bounds[0] - clearance, bounds[1] + clearance
+            if np.all(center >= low) and np.all(center <= high):
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    exits = np.where(direction > 0, (high - center) / direction,
+                                     np.where(direction < 0, (low - center) / direction, np.inf))
+                distance = max(distance, float(exits.min()))
+
+        skip = set(self.lights) | set(self.cameras)
+        step = max(clearance, radius * 2)
+        for _attempt in range(steps):
+            position = center + direction * distance
+            hits = [name for name in self.query_box(scene, position - radius, position + radius) if name not in skip]
+            if not hits:
+                return position
+            distance += step
+        return center + direction * distance
+
+# Scene name -> SceneIndex
+scene_indices = {}
+
+def get_scene_index(scene):
+    index = scene_indices.get(scene.name)
+    if index is None:
+        index = SceneIndex(scene.name)
+        scene_indices[scene.name] = index
+    return index
+
+@persistent
+def update_scene_index(scene, depsgraph):
+    index = scene_indices.get(scene.name)
+    if index is None or index.dirty:
+        return
+
+    for update in depsgraph.updates:
+        data = update.id.original if update.id.original is not None else update.id
+        if isinstance(data, bpy.types.Object):
+            if data.name not in index.bounds:
+                # New or renamed object
+                index.dirty = True
+            elif update.is_updated_transform or update.is_updated_geometry:
+                index.update_object(data)
+        elif isinstance(data, bpy.types.Collection):
+            # Objects were linked to or unlinked from a collection
+            index.dirty = True
+        elif isinstance(data, bpy.types.Scene) and len(bpy.data.objects) != index.object_count:
+            # Objects were added or deleted; other scene updates (frame, cursor, ...) keep the index
+            index.dirty = True
+        if index.dirty:
+            return
+
+@persistent
+def reset_scene_indices(*args):
+    scene_indices.clear()
+
+def register():
+    if update_scene_index not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(update_scene_index)
+    if reset_scene_indices not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(reset_scene_indices)
+
+def unregister():
+    if update_scene_index in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(update_scene_index)
+    if reset_scene_indices in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(reset_scene_indices)
+    scene_indices.clear()
@@ -110,4 +110,314 @@ def get_color_ramp(material):
                 print(f"Epic Toolbag - Color ramp node found in material '{material.name}'.")
                 return node
     print(f"Epic Toolbag - No color ramp node found in material '{material.name}'." if material else "Material is None.")
-    return None
\ No newline at end of file
+    return None
+
+def get_cache_dir(*subdirs):
+    """
+    Get (and create) a directory inside the Epic Toolbag user cache.
+    
+    :param subdirs: Optional sub-directory names inside the cache
+    :return: Absolute path to the cache directory
+    """
+    try:
+        base_dir = bpy.utils.user_resource('CONFIG', path="epictoolbag", create=True)
+    except Exception as e:
+        print(f"Epic Toolbag - Falling back to temp cache directory: {e}")
+        base_dir = ""
+    if not base_dir:
+        import tempfile
+        base_dir = os.path.join(tempfile.gettempdir(), "epictoolbag")
+
+    cache_dir = os.path.join(base_dir, *subdirs)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def write_replacing(filepath, write):
+    """
+    Write a file through a uniquely named temporary file next to it, then replace the destination,
+    so concurrent writers (e.g. the HDRI prefetch thread and the main thread) never share a temp file.
+
+    :param filepath: Destination path
+    :param write: Called with the binary file object to write to
+    """
+    import tempfile
+
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            write(f)
+        # mkstemp creates owner-only files; keep the usual permissions of the destination
+        os.chmod(temp_path, os.stat(filepath).st_mode & 0o777 if os.path.exists(filepath) else 0o644)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+def _rna_values(struct, exclude=()):
+    """Collect the simple RNA property values (and pointer names) of a struct for hashing."""
+    values = []
+    for prop in struct.bl_rna.properties:
+        if prop.identifier == 'rna_type' or prop.identifier in exclude:
+            continue
+        if prop.type in {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}:
+            value = getattr(struct, prop.identifier, None)
+            if prop.type in {'BOOLEAN', 'INT', 'FLOAT'} and getattr(prop, 'is_array', False):
+                value = tuple(value)
+            values.append((prop.identifier, value))
+        elif prop.type == 'POINTER' and not prop.is_readonly:
+            pointer = getattr(struct, prop.identifier, None)
+            values.append((prop.identifier, getattr(pointer, 'name', None)))
+    return values
+
+def _node_tree_values(node_tree):
+    if node_tree is None:
+        return None
+    nodes = []
+    for node in sorted(node_tree.nodes, key=lambda node: node.name):
+        inputs = []
+        for socket in node.inputs:
+            value = getattr(socket, 'default_value', None)
+            if value is not None and not isinstance(value, (int, float, str, bool)):
+                try:
+                    value = tuple(value)
+                except TypeError:
+                    value = getattr(value, 'name', repr(value))
+            inputs.append((socket.identifier, value))
+        nodes.append((node.name, _rna_values(node), inputs, _node_tree_values(getattr(node, 'node_tree', None))))
+    links = sorted((link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier)
+                   for link in node_tree.links)
+    return nodes, links
+
+def mesh_checksum(mesh):
+    """
+    Checksum of a mesh's geometry (vertex positions and face topology).
+    
+    :param mesh: Mesh datablock
+    :return: Hex digest
+    """
+    import hashlib
+    import numpy as np
+
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+
+    digest = hashlib.sha1()
+    for array in (coords, loop_vertices, loop_starts):
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+def file_hash(filepath, chunk_size=1024 * 1024):
+    """
+    Content key of a file: its size and a SHA-1 of its bytes, read in chunks.
+    
+    :param filepath: Path to the file
+    :return: Key string "sha1:<size>:<hex digest>"
+    """
+    import hashlib
+
+    digest = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return f"sha1:{os.path.getsize(filepath)}:{digest.hexdigest()}"
+
+def material_hash(material):
+    """
+    Hash of a material's settings and node tree, leaving out its name, so a material counts
+    as the same only when its content is, whatever it is called.
+
+    :param material: Material datablock or None
+    :return: Hex digest
+    """
+    import hashlib
+
+    if material is None:
+        return ""
+    id_properties = {prop.identifier for prop in bpy.types.ID.bl_rna.properties}
+    values = (_rna_values(material, exclude=id_properties),
+              _node_tree_values(material.node_tree if material.use_nodes else None))
+    return hashlib.sha1(repr(values).encode('utf-8')).hexdigest()
+
+# Generic attribute data type -> (foreach property, values per element, NumPy type)
+ATTRIBUTE_VALUES = {
+    'FLOAT': ("value", 1, 'f4'),
+    'INT': ("value", 1, 'i4'),
+    'INT8': ("value", 1, 'i4'),
+    'BOOLEAN': ("value", 1, '?'),
+    'FLOAT2': ("vector", 2, 'f4'),
+    'INT32_2D': ("value", 2, 'i4'),
+    'FLOAT_VECTOR': ("vector", 3, 'f4'),
+    'FLOAT_COLOR': ("color", 4, 'f4'),
+    'BYTE_COLOR': ("color", 4, 'f4'),
+    'QUATERNION': ("value", 4, 'f4'),
+}
+
+# Attributes left out of geometry_hash: positions and topology are in mesh_checksum, and
+# selection and visibility do not change how a mesh renders
+GEOMETRY_HASH_SKIP = {"position", ".edge_verts", ".corner_vert", ".corner_edge"}
+
+# Edge flags that are not generic attributes in every supported Blender version
+EDGE_FLAGS = ("use_seam", "use_edge_sharp", "crease", "bevel_weight", "use_freestyle_mark")
+
+def geometry_hash(mesh, group_names=None):
+    """
+    Hash of everything that makes two meshes interchangeable: geometry, every attribute
+    (face materials and smoothing, UVs, colors, creases, ...), edge flags, custom normals,
+    vertex group weights and the content of the materials.
+    
+    :param mesh: Mesh datablock
+    :param group_names: Vertex group names of the objects using the mesh; weights are hashed
+                        by group name, and only when given
+    :return: Hex digest
+    """
+    import hashlib
+    import numpy as np
+
+    digest = hashlib.sha1(mesh_checksum(mesh).encode())
+    polygon_count = len(mesh.polygons)
+    material_indices = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    smooth = np.empty(polygon_count, dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+    digest.update(material_indices.tobytes())
+    digest.update(smooth.tobytes())
+
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    for uv_layer in mesh.uv_layers:
+        uv_layer.data.foreach_get("uv", uvs)
+        digest.update(uv_layer.name.encode() + b"\0" + uvs.tobytes())
+
+    for attribute in sorted(getattr(mesh, "attributes", ()), key=lambda attribute: attribute.name):
+        name = attribute.name
+        if name in GEOMETRY_HASH_SKIP or name.startswith((".select", ".hide")):
+            continue
+        digest.update(f"{name}:{attribute.domain}:{attribute.data_type}".encode() + b"\0")
+        if attribute.data_type in ATTRIBUTE_VALUES:
+            prop, width, dtype = ATTRIBUTE_VALUES[attribute.data_type]
+            values = np.empty(len(attribute.data) * width, dtype=dtype)
+            attribute.data.foreach_get(prop, values)
+            digest.update(values.tobytes())
+        else:
+            digest.update(repr([getattr(element, "value", None) for element in attribute.data]).encode())
+
+    edge_rna = bpy.types.MeshEdge.bl_rna.properties
+    for prop in EDGE_FLAGS:
+        if prop in edge_rna:
+            values = np.empty(len(mesh.edges), dtype=bool if edge_rna[prop].type == 'BOOLEAN' else np.float32)
+            mesh.edges.foreach_get(prop, values)
+            digest.update(values.tobytes())
+
+    if mesh.has_custom_normals:
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        if hasattr(mesh, "corner_normals"):
+            mesh.corner_normals.foreach_get("vector", normals)
+        else:
+            mesh.calc_normals_split()
+            mesh.loops.foreach_get("normal", normals)
+        digest.update(normals.tobytes())
+
+    if group_names is not None:
+        weights = sorted((vertex.index, group_names[element.group], element.weight)
+                         for vertex in mesh.vertices for element in vertex.groups
+                         if element.group < len(group_names))
+        digest.update(repr((list(group_names), weights)).encode())
+
+    for material in mesh.materials:
+        digest.update(material_hash(material).encode() + b"\0")
+    return digest.hexdigest()
+
+def scene_state_hash(scene, include_world=True):
+    """
+    Deterministic hash of the scene state that affects a rendered image.
+    
+    :param scene: Scene to hash
+    :param include_world: Include the world (HDRI) settings in the hash
+    :return: Hex digest
+    """
+    import hashlib
+
+    digest = hashlib.sha1()
+
+    def add(*values):
+        digest.update(repr(values).encode('utf-8'))
+
+    # The output path doesn't change the image itself
+    add(scene.frame_current, _rna_values(scene.render, exclude={'filepath'}), _rna_values(scene.view_settings))
+    for engine_settings in ("eevee", "cycles"):
+        if hasattr(scene, engine_settings):
+            add(engine_settings, _rna_values(getattr(scene, engine_settings)))
+
+    camera = scene.camera
+    if camera:
+        add(camera.name, [tuple(row) for row in camera.matrix_world], _rna_values(camera.data))
+
+    if include_world and scene.world:
+        add(_rna_values(scene.world), _node_tree_values(scene.world.node_tree if scene.world.use_nodes else None))
+
+    if scene.render.use_compositing:
+        # Blender 5.0 moved the compositor from scene.node_tree to a node group
+        compositor = getattr(scene, "compositing_node_group", None)
+        if compositor is None and scene.use_nodes:
+            compositor = scene.node_tree
+        add("compositor", _node_tree_values(compositor))
+
+    # Image files can change on disk without anything in the .blend file changing
+    for image in sorted(bpy.data.images, key=lambda image: image.name):
+        if image.users == 0 or image.type != 'IMAGE':
+            continue
+        filepath = bpy.path.abspath(image.filepath, library=image.library)
+        if image.packed_file is not None:
+            add(image.name, image.packed_file.size)
+        elif image.source in {'FILE', 'SEQUENCE', 'TILED', 'MOVIE'} and os.path.exists(filepath):
+            stat = os.stat(filepath)
+            add(image.name, filepath, stat.st_size, stat.st_mtime)
+        else:
+            add(image.name, _rna_values(image))
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    mesh_checksums = {}
+    materials = {}
+    for obj in sorted(scene.objects, key=lambda obj: obj.name):
+        if obj.hide_render:
+            continue
+        add(obj.name, obj.type, [tuple(row) for row in obj.matrix_world])
+        add([(mod.name, mod.type, _rna_values(mod), [(key, repr(mod[key])) for key in mod.keys()],
+              _node_tree_values(getattr(mod, "node_group", None)))
+             for mod in obj.modifiers])
+
+        data = obj.data
+        if data is None:
+            continue
+        if obj.type == 'MESH' and not obj.modifiers and data.shape_keys is None:
+            if data.name not in mesh_checksums:
+                mesh_checksums[data.name] = mesh_checksum(data)
+            add(data.name, mesh_checksums[data.name])
+        elif obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}:
+            # Modifiers, shape keys and armature poses only show in the evaluated geometry
+            evaluated = obj.evaluated_get(depsgraph)
+            mesh = evaluated.to_mesh()
+            try:
+                add(data.name, mesh_checksum(mesh) if mesh is not None else None)
+            finally:
+                evaluated.to_mesh_clear()
+            if obj.type != 'MESH':
+                add(_rna_values(data))
+        else:
+            add(data.name, _rna_values(data))
+
+        for slot in obj.material_slots:
+            if slot.material:
+                materials[slot.material.name] = slot.material
+
+    for name in sorted(materials):
+        material = materials[name]
+        add(name, _rna_values(material), _node_tree_values(material.node_tree if material.use_nodes else None))
+
+    return digest.hexdigest()